@@ -0,0 +1,58 @@
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from datetime import datetime
+from enum import Enum
+import io
+from typing import Any
+
+import orjson
+
+
+# Serialized rows are collected up to this size before a chunk is sent
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self is ExportFormat.NDJSON else "text/csv"
+
+
+async def encode_ndjson(
+    documents: AsyncIterable[dict[str, Any]],
+) -> AsyncIterator[bytes]:
+    chunk = bytearray()
+    async for document in documents:
+        chunk += orjson.dumps(document, option=orjson.OPT_APPEND_NEWLINE)
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+
+    if chunk:
+        yield bytes(chunk)
+
+
+async def encode_csv(
+    documents: AsyncIterable[dict[str, Any]], fields: Sequence[str]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+
+    async for document in documents:
+        writer.writerow(
+            [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in (document[field] for field in fields)
+            ]
+        )
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
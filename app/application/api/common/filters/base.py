@@ -1,11 +1,28 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+from domain.entities.base import BaseEntity
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+
 
 @dataclass
 class BaseGetAllFilters(ABC):
     limit: int
     offset: int
+    cursor: str | None = None
+    count: CountMode = CountMode.EXACT
 
     @abstractmethod
     def to_infrastructure_filters(self): ...
+
+    def _decode_cursor(self) -> PageCursor | None:
+        return PageCursor.decode(self.cursor) if self.cursor else None
+
+
+def build_next_cursor(entities: Sequence[BaseEntity], limit: int) -> str | None:
+    """Cursor of the next page, ``None`` once the last page was returned."""
+    if not entities or len(entities) < limit:
+        return None
+
+    return PageCursor.from_entity(entities[-1]).encode()
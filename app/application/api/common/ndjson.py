@@ -0,0 +1,14 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+
+async def iter_ndjson_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a streamed body into lines without reading all of it first."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+
+    if buffer:
+        yield buffer
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from application.api.common.filters.base import BaseGetAllFilters
+from infrastructure.repositories.common.filters.base import CountMode
 from infrastructure.repositories.groups.filters.groups import (
     GetGroupsFilters as GetGroupsInfrastructureFilters,
 )
@@ -10,6 +11,13 @@ from infrastructure.repositories.groups.filters.groups import (
 class GetGroupsFilters(BaseGetAllFilters):
     limit: int = 10
     offset: int = 0
+    cursor: str | None = None
+    count: CountMode = CountMode.EXACT
 
     def to_infrastructure_filters(self):
-        return GetGroupsInfrastructureFilters(limit=self.limit, offset=self.offset)
+        return GetGroupsInfrastructureFilters(
+            limit=self.limit,
+            offset=self.offset,
+            cursor=self._decode_cursor(),
+            count=self.count,
+        )
@@ -1,7 +1,10 @@
 from typing import Annotated
 from punq import Container
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from application.api.common.export import ExportFormat, encode_csv, encode_ndjson
+from application.api.common.filters.base import build_next_cursor
 from application.api.groups.filters import GetGroupsFilters
 from application.api.schemas import SErrorMessage
 from application.api.groups.schemas import (
@@ -25,8 +28,8 @@ from logic.queries.groups import (
     GetGroupQuery,
     GetGroupsQuery,
 )
-from fastapi_cache.decorator import cache
-from logic.queries.users import GetUsersQuery
+from infrastructure.repositories.users.converters import USER_PUBLIC_FIELDS
+from logic.queries.users import ExportGroupUsersQuery, GetUsersQuery
 
 group_router = APIRouter()
 
@@ -89,12 +92,15 @@ async def get_group(
         status.HTTP_400_BAD_REQUEST: {"model": SErrorMessage},
     },
 )
-@cache(expire=5)
 async def get_groups(
     container: Annotated[Container, Depends(init_container)],
     filters: GetGroupsFilters = Depends(),
 ):
-    """Get all groups."""
+    """Get all groups.
+
+    Pass ``next_cursor`` of a response as ``cursor`` to fetch the next page
+    without an offset scan.
+    """
     mediator: Mediator = container.resolve(Mediator)
     try:
         groups, count = await mediator.handle_query(
@@ -108,6 +114,7 @@ async def get_groups(
         limit=filters.limit,
         offset=filters.offset,
         items=[SGetGroup.from_entity(group) for group in groups],
+        next_cursor=build_next_cursor(groups, filters.limit),
     )
 
 
@@ -120,13 +127,16 @@ async def get_groups(
         status.HTTP_404_NOT_FOUND: {"model": GroupNotFoundException},
     },
 )
-@cache(expire=60)
 async def get_users(
     group_oid: str,
     container: Annotated[Container, Depends(init_container)],
     filters: GetUsersFilters = Depends(),
 ) -> SGetUsersQueryResponse:
-    """Get all users from specified group."""
+    """Get all users from specified group.
+
+    Pass ``next_cursor`` of a response as ``cursor`` to fetch the next page
+    without an offset scan.
+    """
     mediator: Mediator = container.resolve(Mediator)
 
     try:
@@ -143,6 +153,56 @@ async def get_users(
         limit=filters.limit,
         offset=filters.offset,
         items=[SGetUser.from_entity(user) for user in users],
+        next_cursor=build_next_cursor(users, filters.limit),
+    )
+
+
+@group_router.get(
+    "/{group_oid}/users/export/",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                ExportFormat.NDJSON.media_type: {},
+                ExportFormat.CSV.media_type: {},
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {"model": GroupNotFoundException},
+    },
+)
+async def export_users(
+    group_oid: str,
+    container: Annotated[Container, Depends(init_container)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+    """Stream all users of the group as NDJSON or CSV.
+
+    Users are read from a database cursor and written out as they arrive,
+    so memory use does not grow with the size of the group.
+    """
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        documents = await mediator.handle_query(
+            ExportGroupUsersQuery(group_oid=group_oid)
+        )
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    content = (
+        encode_ndjson(documents)
+        if export_format is ExportFormat.NDJSON
+        else encode_csv(documents, USER_PUBLIC_FIELDS)
+    )
+    return StreamingResponse(
+        content,
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="group-{group_oid}-users.{export_format.value}"'
+            )
+        },
     )
 
 
@@ -1,6 +1,13 @@
 from dataclasses import dataclass
+from typing import Annotated
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+from punq import Container
+
+from infrastructure.message_brokers.outbox_relay import OutboxRelay
+from infrastructure.repositories.groups.cached import GroupEntityCache
+from infrastructure.repositories.users.cached import UserEntityCache
+from logic.init import init_container
 
 
 healthcheck_router = APIRouter()
@@ -17,3 +24,33 @@ OK_STATUS = OKStatus()
 @healthcheck_router.get("/", status_code=status.HTTP_200_OK)
 async def get_status() -> OKStatus:
     return OK_STATUS
+
+
+@healthcheck_router.get("/cache/", status_code=status.HTTP_200_OK)
+async def get_cache_metrics(
+    container: Annotated[Container, Depends(init_container)],
+) -> dict[str, dict[str, dict[str, int]]]:
+    """Hit and miss counters of the entity caches per tier."""
+    group_cache: GroupEntityCache = container.resolve(GroupEntityCache)
+    user_cache: UserEntityCache = container.resolve(UserEntityCache)
+
+    return {
+        "groups": group_cache.metrics.snapshot(),
+        "users": user_cache.metrics.snapshot(),
+    }
+
+
+@dataclass(frozen=True)
+class OutboxStatus:
+    relayed: int
+    lag: float
+
+
+@healthcheck_router.get("/outbox/", status_code=status.HTTP_200_OK)
+async def get_outbox_status(
+    container: Annotated[Container, Depends(init_container)],
+) -> OutboxStatus:
+    """Messages relayed so far and the age in seconds of the oldest pending one."""
+    outbox_relay: OutboxRelay = container.resolve(OutboxRelay)
+
+    return OutboxStatus(relayed=outbox_relay.relayed, lag=outbox_relay.lag)
@@ -1,8 +1,102 @@
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.redis import RedisBackend
+import asyncio
+import gc
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.cache.base import AbstractCacheService
 from infrastructure.message_brokers.base import BaseMessageBroker
+from infrastructure.message_brokers.outbox_relay import OutboxRelay
+from infrastructure.repositories.common.indexes import MongoDBIndexManager
+from infrastructure.repositories.common.schema import SQLAlchemySchemaManager
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.users.base import BaseUserRepository
+from infrastructure.security.cookies.revocation import TokenRevocationList
+from infrastructure.security.passwords.base import BasePasswordHasher
 from logic.init import init_container
-from redis import asyncio as aioredis
+from logic.mediator.base import Mediator
+from logic.mediator.supervisor import BackgroundTaskSupervisor
+from settings.config import Settings
+
+
+async def warm_up_mongodb_client():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    if settings.storage_backend == "mongodb":
+        client: AsyncIOMotorClient = container.resolve(AsyncIOMotorClient)
+        # Concurrent pings each check out a connection, so the pool holds
+        # its minimum before the first request instead of growing under it
+        await asyncio.gather(
+            *(
+                client.admin.command("ping")
+                for _ in range(max(settings.mongodb_min_pool_size, 1))
+            )
+        )
+
+
+async def init_indexes():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+    index_manager: MongoDBIndexManager = container.resolve(MongoDBIndexManager)
+
+    if settings.mongodb_ensure_indexes:
+        await index_manager.ensure_indexes()
+
+    if settings.mongodb_check_indexes:
+        await index_manager.check_indexes()
+
+
+async def init_sql_schema():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    if settings.storage_backend == "sqlalchemy" and settings.sql_create_tables:
+        schema_manager: SQLAlchemySchemaManager = container.resolve(
+            SQLAlchemySchemaManager
+        )
+        await schema_manager.create_tables()
+
+
+async def close_sql_engine():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    if settings.storage_backend == "sqlalchemy":
+        engine: AsyncEngine = container.resolve(AsyncEngine)
+        await engine.dispose()
+
+
+async def open_memory_repositories():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    if settings.storage_backend == "memory":
+        await container.resolve(BaseGroupRepository).open()
+        await container.resolve(BaseUserRepository).open()
+        # The replayed entities live as long as the process, keep the
+        # collector from walking them on every full collection
+        gc.freeze()
+
+
+async def close_memory_repositories():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    if settings.storage_backend == "memory":
+        await container.resolve(BaseUserRepository).close()
+        await container.resolve(BaseGroupRepository).close()
+
+
+async def close_read_model():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    # Otherwise the read model shares its client with the cache
+    if settings.read_model_backend == "redis" and settings.read_model_redis_url:
+        read_model: BaseReadModel = container.resolve(BaseReadModel)
+        await read_model.close()
 
 
 async def init_message_broker():
@@ -11,12 +105,64 @@ async def init_message_broker():
     await message_broker.start()
 
 
+async def flush_message_broker():
+    container = init_container()
+    message_broker: BaseMessageBroker = container.resolve(BaseMessageBroker)
+    await message_broker.flush()
+
+
 async def close_message_broker():
     container = init_container()
     message_broker: BaseMessageBroker = container.resolve(BaseMessageBroker)
     await message_broker.stop()
 
 
-async def init_cache():
-    redis = aioredis.from_url("redis://redis:6379")
-    FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+async def start_outbox_relay():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+
+    if settings.outbox_relay_enabled:
+        outbox_relay: OutboxRelay = container.resolve(OutboxRelay)
+        outbox_relay.start()
+
+
+async def stop_outbox_relay():
+    container = init_container()
+    outbox_relay: OutboxRelay = container.resolve(OutboxRelay)
+    await outbox_relay.stop()
+
+
+async def start_token_revocation_sync():
+    container = init_container()
+    revocation_list: TokenRevocationList = container.resolve(TokenRevocationList)
+    revocation_list.start()
+
+
+async def stop_token_revocation_sync():
+    container = init_container()
+    revocation_list: TokenRevocationList = container.resolve(TokenRevocationList)
+    await revocation_list.stop()
+
+
+async def warm_up_mediator():
+    container = init_container()
+    container.resolve(Mediator)
+
+
+async def close_password_hasher():
+    container = init_container()
+    password_hasher: BasePasswordHasher = container.resolve(BasePasswordHasher)
+    await password_hasher.shutdown()
+
+
+async def close_cache():
+    container = init_container()
+    cache_service: AbstractCacheService = container.resolve(AbstractCacheService)
+    await cache_service.close()
+
+
+async def close_background_tasks():
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+    supervisor: BackgroundTaskSupervisor = container.resolve(BackgroundTaskSupervisor)
+    await supervisor.shutdown(timeout=settings.background_tasks_shutdown_timeout)
@@ -2,21 +2,52 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from application.api.lifespan import (
+    close_background_tasks,
+    close_cache,
+    close_memory_repositories,
     close_message_broker,
-    init_cache,
+    close_password_hasher,
+    close_read_model,
+    close_sql_engine,
+    flush_message_broker,
+    init_indexes,
     init_message_broker,
+    init_sql_schema,
+    open_memory_repositories,
+    start_outbox_relay,
+    start_token_revocation_sync,
+    stop_outbox_relay,
+    stop_token_revocation_sync,
+    warm_up_mediator,
+    warm_up_mongodb_client,
 )
 from application.api.users.routers import user_router
 from application.api.groups.routers import group_router
 from .healthcheck import healthcheck_router
+from .well_known import well_known_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await warm_up_mongodb_client()
+    await init_indexes()
+    await init_sql_schema()
+    await open_memory_repositories()
     await init_message_broker()
-    await init_cache()
+    await start_outbox_relay()
+    await start_token_revocation_sync()
+    await warm_up_mediator()
     yield
+    await close_background_tasks()
+    await stop_token_revocation_sync()
+    await stop_outbox_relay()
+    await flush_message_broker()
     await close_message_broker()
+    await close_password_hasher()
+    await close_memory_repositories()
+    await close_sql_engine()
+    await close_read_model()
+    await close_cache()
 
 
 def create_app() -> FastAPI:
@@ -31,5 +62,6 @@ def create_app() -> FastAPI:
     app.include_router(user_router, prefix="/users", tags=["USER"])
 
     app.include_router(healthcheck_router, prefix="/healthcheck", tags=["HEALTHCHECK"])
+    app.include_router(well_known_router, prefix="/.well-known", tags=["WELL-KNOWN"])
 
     return app
@@ -10,7 +10,8 @@ IL = TypeVar("IL")
 
 
 class SBaseQueryResponse(BaseModel, Generic[IL]):
-    count: int
+    count: int | None
     limit: int
     offset: int
     items: IL
+    next_cursor: str | None = None
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from application.api.common.filters.base import BaseGetAllFilters
+from infrastructure.repositories.common.filters.base import CountMode
 from infrastructure.repositories.users.filters.users import (
     GetUsersFilters as GetUsersInfrastructureFilters,
 )
@@ -10,6 +11,13 @@ from infrastructure.repositories.users.filters.users import (
 class GetUsersFilters(BaseGetAllFilters):
     limit: int = 10
     offset: int = 0
+    cursor: str | None = None
+    count: CountMode = CountMode.EXACT
 
     def to_infrastructure_filters(self):
-        return GetUsersInfrastructureFilters(limit=self.limit, offset=self.offset)
+        return GetUsersInfrastructureFilters(
+            limit=self.limit,
+            offset=self.offset,
+            cursor=self._decode_cursor(),
+            count=self.count,
+        )
@@ -1,12 +1,25 @@
+from contextlib import suppress
 from typing import Annotated
 from punq import Container
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import (
+    APIRouter,
+    Cookie,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 
+from application.api.common.ndjson import iter_ndjson_lines
 from application.api.schemas import SErrorMessage
 from application.api.users.schemas import (
+    SBatchGetUsersIn,
+    SBatchGetUsersOut,
     SCreateUserIn,
     SCreateUserOut,
     SGetUser,
+    SImportUsersOut,
     SLoginIn,
     SLoginOut,
 )
@@ -16,13 +29,25 @@ from domain.exceptions.users import (
     InvalidPasswordLength,
     InvalidUsernameLength,
 )
+from infrastructure.exceptions.cookies import (
+    ExpiredToken,
+    InvalidToken,
+    RefreshTokenReused,
+    RevokedToken,
+)
+from infrastructure.exceptions.passwords import PasswordHasherOverloaded
 from logic.commands.users import (
+    BulkCreateUsersCommand,
+    CreateTokensCommand,
     CreateUserCommand,
     CreateVerificationTokenCommand,
     DeleteUserCommand,
+    RefreshTokensCommand,
     UserLoginCommand,
+    UserLogoutCommand,
     VerifyUserCommand,
 )
+from logic.exceptions.groups import GroupNotFoundException
 from logic.exceptions.users import (
     InvalidCredentialsException,
     TokenNotFoundException,
@@ -32,8 +57,8 @@ from logic.exceptions.users import (
 from logic.init import init_container
 from logic.mediator.base import Mediator
 from logic.queries.users import (
-    GetTokensQuery,
     GetUserQuery,
+    GetUsersByOidsQuery,
     Tokens,
 )
 from settings.config import Settings
@@ -43,38 +68,36 @@ user_router = APIRouter()
 
 
 @user_router.post(
-    "/{group_oid}/",
-    status_code=status.HTTP_201_CREATED,
+    "/{group_oid}/import/",
+    status_code=status.HTTP_200_OK,
     responses={
-        status.HTTP_201_CREATED: {"model": SCreateUserOut},
-        status.HTTP_400_BAD_REQUEST: {"model": SErrorMessage},
-        status.HTTP_409_CONFLICT: {"model": UserAlreadyExistsException},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {
-            "model": InvalidEmail | InvalidUsernameLength | InvalidPasswordLength
-        },
+        status.HTTP_200_OK: {"model": SImportUsersOut},
+        status.HTTP_404_NOT_FOUND: {"model": GroupNotFoundException},
     },
 )
-async def create_user(
+async def import_users(
     group_oid: str,
-    user_in: SCreateUserIn,
+    request: Request,
     container: Annotated[Container, Depends(init_container)],
-) -> SCreateUserOut:
-    """Create new user."""
+) -> SImportUsersOut:
+    """Create users from an NDJSON body.
+
+    Every line is a JSON object with ``username``, ``email`` and
+    ``password``. The body is read as it arrives, and the response holds
+    the result of every non-blank line, numbered from 1.
+    """
     mediator: Mediator = container.resolve(Mediator)
 
     try:
-        user, *_ = await mediator.handle_command(
-            CreateUserCommand(
-                email=user_in.email,
-                username=user_in.username,
-                password=user_in.password,
-                group_oid=group_oid,
+        results, *_ = await mediator.handle_command(
+            BulkCreateUsersCommand(
+                group_oid=group_oid, rows=iter_ndjson_lines(request.stream())
             )
         )
     except ApplicationException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
-    return SCreateUserOut.from_entity(user)
+    return SImportUsersOut.from_results(results)
 
 
 @user_router.post(
@@ -84,6 +107,7 @@ async def create_user(
         status.HTTP_200_OK: {"model": SLoginOut},
         status.HTTP_400_BAD_REQUEST: {"model": SErrorMessage},
         status.HTTP_401_UNAUTHORIZED: {"model": InvalidCredentialsException},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": PasswordHasherOverloaded},
     },
 )
 async def login(
@@ -99,33 +123,148 @@ async def login(
         user, *_ = await mediator.handle_command(
             UserLoginCommand(username=login_data.username, password=login_data.password)
         )
-    except ApplicationException as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
-    else:
-        tokens: Tokens = await mediator.handle_query(
-            GetTokensQuery(username=login_data.username)
+        tokens, *_ = await mediator.handle_command(
+            CreateTokensCommand(user_oid=user.oid)
         )
-        response.set_cookie(
-            "access_token",
-            tokens.access_token,
-            max_age=settings.access_token_expire_minutes * 60,
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    set_token_cookies(response, tokens, settings)
+
+    return SLoginOut.from_entity(user)
+
+
+def set_token_cookies(response: Response, tokens: Tokens, settings: Settings) -> None:
+    response.set_cookie(
+        "access_token",
+        tokens.access_token,
+        max_age=settings.access_token_expire_minutes * 60,
+    )
+    response.set_cookie(
+        "refresh_token",
+        tokens.refresh_token,
+        max_age=settings.refresh_token_expire_days * 24 * 3600,
+    )
+
+
+@user_router.post(
+    "/refresh/",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "model": InvalidToken | ExpiredToken | RevokedToken | RefreshTokenReused
+        },
+    },
+)
+async def refresh(
+    container: Annotated[Container, Depends(init_container)],
+    response: Response,
+    refresh_token: Annotated[str | None, Cookie()] = None,
+) -> None:
+    """Exchange the refresh token cookie for new access and refresh tokens.
+
+    Every refresh token can be used once, presenting a used one again ends
+    the session it belongs to.
+    """
+    if refresh_token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
         )
-        response.set_cookie(
-            "refresh_token",
-            tokens.refresh_token,
-            max_age=settings.refresh_token_expire_days * 60 * 24,
+
+    mediator: Mediator = container.resolve(Mediator)
+    settings: Settings = container.resolve(Settings)
+
+    try:
+        tokens, *_ = await mediator.handle_command(
+            RefreshTokensCommand(refresh_token=refresh_token)
         )
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
 
-    return SLoginOut.from_entity(user)
+    set_token_cookies(response, tokens, settings)
 
 
 @user_router.post("/logout/", status_code=status.HTTP_204_NO_CONTENT)
-async def logout(response: Response):
-    """User logout."""
+async def logout(
+    container: Annotated[Container, Depends(init_container)],
+    response: Response,
+    refresh_token: Annotated[str | None, Cookie()] = None,
+):
+    """User logout, revokes the session of the refresh token cookie."""
+    if refresh_token is not None:
+        mediator: Mediator = container.resolve(Mediator)
+        # The cookies are dropped anyway, an invalid token has nothing to revoke
+        with suppress(ApplicationException):
+            await mediator.handle_command(
+                UserLogoutCommand(refresh_token=refresh_token)
+            )
+
     response.delete_cookie("access_token")
     response.delete_cookie("refresh_token")
 
 
+@user_router.post(
+    "/batch-get/",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"model": SBatchGetUsersOut},
+    },
+)
+async def batch_get_users(
+    batch_in: SBatchGetUsersIn,
+    container: Annotated[Container, Depends(init_container)],
+) -> SBatchGetUsersOut:
+    """Get up to 1000 users by oid in one request.
+
+    Users come in request order, oids without a user are listed in
+    ``missing``.
+    """
+    mediator: Mediator = container.resolve(Mediator)
+
+    users = await mediator.handle_query(
+        GetUsersByOidsQuery(user_oids=tuple(batch_in.oids))
+    )
+
+    return SBatchGetUsersOut.from_entities(batch_in.oids, users)
+
+
+# Declared after the static POST routes, which it would otherwise shadow
+@user_router.post(
+    "/{group_oid}/",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_201_CREATED: {"model": SCreateUserOut},
+        status.HTTP_400_BAD_REQUEST: {"model": SErrorMessage},
+        status.HTTP_409_CONFLICT: {"model": UserAlreadyExistsException},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": InvalidEmail | InvalidUsernameLength | InvalidPasswordLength
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": PasswordHasherOverloaded},
+    },
+)
+async def create_user(
+    group_oid: str,
+    user_in: SCreateUserIn,
+    container: Annotated[Container, Depends(init_container)],
+) -> SCreateUserOut:
+    """Create new user."""
+    mediator: Mediator = container.resolve(Mediator)
+
+    try:
+        user, *_ = await mediator.handle_command(
+            CreateUserCommand(
+                email=user_in.email,
+                username=user_in.username,
+                password=user_in.password,
+                group_oid=group_oid,
+            )
+        )
+    except ApplicationException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    return SCreateUserOut.from_entity(user)
+
+
 @user_router.post(
     "/{user_oid}/verify/",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -1,8 +1,9 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 from application.api.schemas import SBaseQueryResponse
 from domain.entities.users import User
+from logic.commands.users import UserImportResult
 
 
 class SCreateUserIn(BaseModel):
@@ -29,6 +30,27 @@ class SCreateUserOut(BaseModel):
         )
 
 
+class SImportUserResult(BaseModel):
+    row: int
+    oid: str | None = None
+    error: str | None = None
+
+
+class SImportUsersOut(BaseModel):
+    created: int
+    failed: int
+    items: list[SImportUserResult]
+
+    @classmethod
+    def from_results(cls, results: list[UserImportResult]) -> "SImportUsersOut":
+        items = [
+            SImportUserResult(row=result.row, oid=result.user_oid, error=result.error)
+            for result in results
+        ]
+        created = sum(result.user_oid is not None for result in results)
+        return cls(created=created, failed=len(results) - created, items=items)
+
+
 class SLoginIn(BaseModel):
     username: str
     password: str
@@ -75,3 +97,21 @@ class SGetUser(BaseModel):
 
 
 class SGetUsersQueryResponse(SBaseQueryResponse[list[SGetUser]]): ...
+
+
+class SBatchGetUsersIn(BaseModel):
+    oids: list[str] = Field(min_length=1, max_length=1000)
+
+
+class SBatchGetUsersOut(BaseModel):
+    items: list[SGetUser]
+    missing: list[str]
+
+    @classmethod
+    def from_entities(
+        cls, oids: list[str], users: dict[str, User]
+    ) -> "SBatchGetUsersOut":
+        return cls(
+            items=[SGetUser.from_entity(user) for user in users.values()],
+            missing=[oid for oid in dict.fromkeys(oids) if oid not in users],
+        )
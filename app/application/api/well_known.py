@@ -0,0 +1,22 @@
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Response, status
+from punq import Container
+
+from infrastructure.security.cookies.base import BaseCookieManager
+from logic.init import init_container
+
+
+well_known_router = APIRouter()
+
+
+@well_known_router.get("/jwks.json", status_code=status.HTTP_200_OK)
+async def get_jwks(
+    response: Response,
+    container: Annotated[Container, Depends(init_container)],
+) -> dict[str, list[dict[str, Any]]]:
+    """Public keys to verify access tokens with, empty for HMAC algorithms."""
+    cookie_manager: BaseCookieManager = container.resolve(BaseCookieManager)
+    response.headers["Cache-Control"] = "public, max-age=3600"
+
+    return cookie_manager.get_jwks()
@@ -0,0 +1,4 @@
+from application.consumers.main import main
+
+
+main()
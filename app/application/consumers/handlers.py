@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from domain.events.groups import GroupCreatedEvent, GroupDeletedEvent
+from domain.events.users import (
+    UserCreatedEvent,
+    UserDeletedEvent,
+    UserVerifiedEvent,
+    VerificationTokenCreatedEvent,
+)
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.tags import GROUPS_CACHE_TAG, build_group_cache_tag
+from infrastructure.mail.base import BaseMailSender
+from infrastructure.message_brokers.consumer import BaseMessageHandler
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.read_models.converters import (
+    convert_group_created_event_to_entity,
+    convert_user_created_event_to_entity,
+)
+
+
+@dataclass(frozen=True)
+class SendVerificationEmailMessageHandler(BaseMessageHandler):
+    event_type: ClassVar[type[VerificationTokenCreatedEvent]] = (
+        VerificationTokenCreatedEvent
+    )
+
+    mail_sender: BaseMailSender
+    verification_url_template: str
+
+    async def handle(self, event: VerificationTokenCreatedEvent) -> None:
+        verification_url = self.verification_url_template.format(
+            user_oid=event.user_oid, token=event.token
+        )
+        await self.mail_sender.send(
+            recipient=event.email,
+            subject="Confirm your email",
+            body=f"Follow the link to verify your account: {verification_url}",
+        )
+
+
+@dataclass(frozen=True)
+class ProjectUserCreatedMessageHandler(BaseMessageHandler):
+    """Adds the user to the read model, then drops the pages cached from it,
+    which the API process may have refilled before the projection."""
+
+    event_type: ClassVar[type[UserCreatedEvent]] = UserCreatedEvent
+
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+
+    async def handle(self, event: UserCreatedEvent) -> None:
+        await self.read_model.add_users([convert_user_created_event_to_entity(event)])
+        await self.cache_service.invalidate_tags(build_group_cache_tag(event.group_oid))
+
+
+@dataclass(frozen=True)
+class ProjectUserVerifiedMessageHandler(BaseMessageHandler):
+    event_type: ClassVar[type[UserVerifiedEvent]] = UserVerifiedEvent
+
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+
+    async def handle(self, event: UserVerifiedEvent) -> None:
+        await self.read_model.verify_user(event.user_oid)
+        await self.cache_service.invalidate_tags(build_group_cache_tag(event.group_oid))
+
+
+@dataclass(frozen=True)
+class ProjectUserDeletedMessageHandler(BaseMessageHandler):
+    event_type: ClassVar[type[UserDeletedEvent]] = UserDeletedEvent
+
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+
+    async def handle(self, event: UserDeletedEvent) -> None:
+        await self.read_model.delete_user(event.user_oid, event.group_oid)
+        await self.cache_service.invalidate_tags(build_group_cache_tag(event.group_oid))
+
+
+@dataclass(frozen=True)
+class ProjectGroupCreatedMessageHandler(BaseMessageHandler):
+    event_type: ClassVar[type[GroupCreatedEvent]] = GroupCreatedEvent
+
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+
+    async def handle(self, event: GroupCreatedEvent) -> None:
+        await self.read_model.add_groups([convert_group_created_event_to_entity(event)])
+        await self.cache_service.invalidate_tags(GROUPS_CACHE_TAG)
+
+
+@dataclass(frozen=True)
+class ProjectGroupDeletedMessageHandler(BaseMessageHandler):
+    event_type: ClassVar[type[GroupDeletedEvent]] = GroupDeletedEvent
+
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+
+    async def handle(self, event: GroupDeletedEvent) -> None:
+        await self.read_model.delete_group(event.group_oid)
+        await self.cache_service.invalidate_tags(GROUPS_CACHE_TAG)
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import signal
+
+from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+from punq import Container
+
+from application.consumers.handlers import (
+    ProjectGroupCreatedMessageHandler,
+    ProjectGroupDeletedMessageHandler,
+    ProjectUserCreatedMessageHandler,
+    ProjectUserDeletedMessageHandler,
+    ProjectUserVerifiedMessageHandler,
+    SendVerificationEmailMessageHandler,
+)
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.mail.base import BaseMailSender
+from infrastructure.message_brokers.consumer import (
+    BaseMessageHandler,
+    KafkaConsumerWorker,
+)
+from infrastructure.repositories.read_models.base import BaseReadModel
+from logic.init import init_container
+from settings.config import Settings
+
+
+def init_projectors(container: Container) -> dict[str, BaseMessageHandler]:
+    """The read model's projectors by topic, none when queries read the
+    primary repositories."""
+    settings: Settings = container.resolve(Settings)
+    if settings.read_model_backend == "primary":
+        return {}
+
+    read_model: BaseReadModel = container.resolve(BaseReadModel)
+    cache_service: AbstractCacheService = container.resolve(AbstractCacheService)
+    return {
+        topic: projector_type(read_model=read_model, cache_service=cache_service)
+        for topic, projector_type in (
+            (settings.new_user_event_topic, ProjectUserCreatedMessageHandler),
+            (settings.user_verified_event_topic, ProjectUserVerifiedMessageHandler),
+            (settings.user_deleted_event_topic, ProjectUserDeletedMessageHandler),
+            (settings.new_group_event_topic, ProjectGroupCreatedMessageHandler),
+            (settings.group_deleted_event_topic, ProjectGroupDeletedMessageHandler),
+        )
+    }
+
+
+def init_consumer_worker(container: Container) -> KafkaConsumerWorker:
+    settings: Settings = container.resolve(Settings)
+
+    return KafkaConsumerWorker(
+        consumer=AIOKafkaConsumer(
+            bootstrap_servers=settings.kafka_url,
+            group_id=settings.kafka_consumer_group_id,
+            enable_auto_commit=False,
+            auto_offset_reset="earliest",
+        ),
+        producer=AIOKafkaProducer(bootstrap_servers=settings.kafka_url),
+        handlers={
+            settings.verification_token_event_topic: (
+                SendVerificationEmailMessageHandler(
+                    mail_sender=container.resolve(BaseMailSender),
+                    verification_url_template=settings.verification_url_template,
+                )
+            ),
+            **init_projectors(container),
+        },
+        dead_letter_topic=settings.kafka_dead_letter_topic,
+        max_in_flight=settings.kafka_consumer_max_in_flight,
+        max_records=settings.kafka_consumer_max_records,
+        max_attempts=settings.kafka_consumer_max_attempts,
+    )
+
+
+async def run_consumer_worker() -> None:
+    worker = init_consumer_worker(init_container())
+
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, worker.stop)
+
+    await worker.start()
+    try:
+        await worker.run()
+    finally:
+        await worker.close()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_consumer_worker())
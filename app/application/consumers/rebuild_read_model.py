@@ -0,0 +1,90 @@
+"""Project every stored group and user into the read model.
+
+Run once when switching ``READ_MODEL_BACKEND`` away from ``primary``, with
+the consumer worker already running so no event falls in between::
+
+    python -m application.consumers.rebuild_read_model
+
+Projections are idempotent and deleted oids are remembered, so running it
+alongside the worker neither duplicates nor resurrects anything.
+"""
+
+import asyncio
+from dataclasses import replace
+import logging
+
+from punq import Container
+
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.users.base import BaseUserRepository
+from infrastructure.repositories.users.converters import (
+    convert_user_document_to_entity,
+)
+from logic.init import init_container
+from settings.config import Settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_read_model(container: Container, batch_size: int) -> int:
+    """Returns the number of projected users."""
+    read_model: BaseReadModel = container.resolve(BaseReadModel)
+    group_repository: BaseGroupRepository = container.resolve(BaseGroupRepository)
+    user_repository: BaseUserRepository = container.resolve(BaseUserRepository)
+
+    users_count = 0
+    filters = GetGroupsFilters(limit=batch_size, offset=0, count=CountMode.NONE)
+    while True:
+        groups, _ = await group_repository.get_groups(filters=filters)
+        groups = list(groups)
+        if not groups:
+            return users_count
+
+        await read_model.add_groups(groups)
+        for group in groups:
+            users = []
+            async for document in user_repository.iter_group_user_documents(
+                group_oid=group.oid, batch_size=batch_size
+            ):
+                users.append(
+                    convert_user_document_to_entity(
+                        {**document, "group_oid": group.oid}
+                    )
+                )
+                if len(users) == batch_size:
+                    await read_model.add_users(users)
+                    users_count += len(users)
+                    users = []
+
+            if users:
+                await read_model.add_users(users)
+                users_count += len(users)
+
+        logger.info("Projected %d users", users_count)
+        filters = replace(filters, cursor=PageCursor.from_entity(groups[-1]))
+
+
+async def run_rebuild() -> None:
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+    if settings.read_model_backend == "primary":
+        logger.info("Queries read the primary repositories, nothing to rebuild")
+        return
+
+    users_count = await rebuild_read_model(
+        container, batch_size=settings.user_export_batch_size
+    )
+    logger.info("Read model rebuilt with %d users", users_count)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_rebuild())
+
+
+if __name__ == "__main__":
+    main()
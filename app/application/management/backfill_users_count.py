@@ -0,0 +1,53 @@
+"""Count the users of every MongoDB group into its ``users_count`` counter.
+
+Groups created before the counter was maintained report 0, or only the
+changes since, in the ``cached`` count mode until this ran once::
+
+    python -m application.management.backfill_users_count
+
+The other storage backends maintain the counter from the start.
+"""
+
+import asyncio
+import logging
+
+from infrastructure.repositories.common.indexes import MongoDBIndexManager
+from infrastructure.repositories.groups.mongo import MongoDBGroupRepository
+from infrastructure.repositories.users.mongo import MongoDBUserRepository
+from logic.init import init_container
+from settings.config import Settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_users_count() -> None:
+    container = init_container()
+    settings: Settings = container.resolve(Settings)
+    if settings.storage_backend != "mongodb":
+        logger.info("Only MongoDB groups need their users counted")
+        return
+
+    repositories = container.resolve(MongoDBIndexManager).repositories
+    (group_repository,) = (
+        repository
+        for repository in repositories
+        if isinstance(repository, MongoDBGroupRepository)
+    )
+    (user_repository,) = (
+        repository
+        for repository in repositories
+        if isinstance(repository, MongoDBUserRepository)
+    )
+
+    groups_count = await group_repository.recount_users(user_repository)
+    logger.info("Counted the users of %d groups", groups_count)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(backfill_users_count())
+
+
+if __name__ == "__main__":
+    main()
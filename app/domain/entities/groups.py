@@ -20,6 +20,7 @@ class UserGroup(BaseEntity):
             GroupCreatedEvent(
                 group_title=new_group.title.as_generic_type(),
                 group_oid=new_group.oid,
+                occured_at=new_group.created_at,
             )
         )
 
@@ -7,6 +7,7 @@ from domain.values.users import Username, Email, Password
 from domain.events.users import (
     UserCreatedEvent,
     UserDeletedEvent,
+    UserVerifiedEvent,
     VerificationTokenCreatedEvent,
 )
 
@@ -15,7 +16,8 @@ from domain.events.users import (
 class User(BaseEntity):
     email: Email
     username: Username
-    password: Password
+    # None for users read without their password hash
+    password: Password | None
     group_id: str
     is_verified: bool = field(default=False, kw_only=True)
 
@@ -32,6 +34,7 @@ class User(BaseEntity):
                 email=new_user.email.as_generic_type(),
                 user_oid=new_user.oid,
                 group_oid=group_id,
+                occured_at=new_user.created_at,
             )
         )
         return new_user
@@ -46,6 +49,12 @@ class User(BaseEntity):
             )
         )
 
+    def verify(self) -> None:
+        self.is_verified = True
+        self.register_event(
+            UserVerifiedEvent(user_oid=self.oid, group_oid=self.group_id)
+        )
+
 
 @dataclass(eq=False)
 class VerificationToken(BaseEntity):
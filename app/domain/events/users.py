@@ -31,3 +31,11 @@ class UserDeletedEvent(BaseEvent):
     username: str
     email: str
     group_oid: str
+
+
+@dataclass
+class UserVerifiedEvent(BaseEvent):
+    title: ClassVar[str] = "User was verified"
+
+    user_oid: str
+    group_oid: str
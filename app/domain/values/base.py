@@ -1,20 +1,32 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
 
 
 VT = TypeVar("VT", bound=Any)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BaseValueObject(ABC, Generic[VT]):
     value: VT
 
     def __post_init__(self):
         self.validate()
 
+    @classmethod
+    def from_trusted(cls, value: VT) -> Self:
+        """Wrap a value that was validated before it was stored, skipping
+        ``validate``."""
+        value_object = object.__new__(cls)
+        _set_value(value_object, value)
+        return value_object
+
     @abstractmethod
     def validate(self): ...
 
     @abstractmethod
     def as_generic_type(self): ...
+
+
+# Writes the ``value`` slot directly, past the frozen ``__setattr__``
+_set_value = BaseValueObject.value.__set__
@@ -7,15 +7,16 @@ from domain.exceptions.groups import (
 from domain.values.base import BaseValueObject
 
 
-@dataclass
-class Title(BaseValueObject):
-    value: str
+TITLE_MIN_LENGTH, TITLE_MAX_LENGTH = 3, 15
 
+
+@dataclass(frozen=True, slots=True)
+class Title(BaseValueObject[str]):
     def validate(self):
         if not self.value:
             raise EmptyGroupTitle()
 
-        if len(self.value) not in range(3, 16):
+        if not TITLE_MIN_LENGTH <= len(self.value) <= TITLE_MAX_LENGTH:
             raise InvalidGroupTitleLength(self.value)
 
     def as_generic_type(self):
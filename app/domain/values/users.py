@@ -12,50 +12,47 @@ from domain.exceptions.users import (
 from domain.values.base import BaseValueObject
 
 
-@dataclass
-class Username(BaseValueObject):
-    value: str
+USERNAME_MIN_LENGTH, USERNAME_MAX_LENGTH = 3, 15
+PASSWORD_MIN_LENGTH, PASSWORD_MAX_LENGTH = 3, 99
 
+_match_email = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}").fullmatch
+
+
+@dataclass(frozen=True, slots=True)
+class Username(BaseValueObject[str]):
     def validate(self) -> None:
         if not self.value:
             raise EmptyUsername()
 
-        value_length = len(self.value)
-
-        if value_length not in range(3, 16):
+        if not USERNAME_MIN_LENGTH <= len(self.value) <= USERNAME_MAX_LENGTH:
             raise InvalidUsernameLength(self.value)
 
     def as_generic_type(self) -> str:
         return str(self.value)
 
 
-@dataclass
-class Email(BaseValueObject):
-    value: str
-
+@dataclass(frozen=True, slots=True)
+class Email(BaseValueObject[str]):
     def validate(self):
         if not self.value:
             raise EmptyEmail()
 
-        email_validate_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_validate_pattern, self.value):
+        if _match_email(self.value) is None:
             raise InvalidEmail(self.value)
 
     def as_generic_type(self):
         return str(self.value)
 
 
-@dataclass
-class Password(BaseValueObject):
-    value: str
-
+@dataclass(frozen=True, slots=True)
+class Password(BaseValueObject[str]):
     def validate(self):
         if not self.value:
             raise EmptyPassword()
 
         value_length = len(self.value)
 
-        if value_length not in range(3, 100):
+        if not PASSWORD_MIN_LENGTH <= value_length <= PASSWORD_MAX_LENGTH:
             raise InvalidPasswordLength(value_length)
 
     def as_generic_type(self):
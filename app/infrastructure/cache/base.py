@@ -1,25 +1,96 @@
-import json
-from functools import cached_property
-from typing import (
-    Protocol,
-    Union,
-)
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
 
+import orjson
 
-class AbstractCacheService(Protocol):
-    @cached_property
-    def client(self): ...
 
-    async def set_cache(self, key: str, value: str):
-        raise NotImplementedError()
+@dataclass
+class AbstractCacheService(ABC):
+    @abstractmethod
+    async def set_cache(
+        self, key: str, value: bytes, ex: int | None = None
+    ) -> None: ...
 
-    async def set_json_cache(self, key: str, value: Union[dict, list]):
-        json_data = json.dumps(value)
-        return self.set_cache(key, json_data)
+    @abstractmethod
+    async def get_cache(self, key: str) -> bytes | None: ...
 
-    async def get_cache(self, key: str) -> str:
-        raise NotImplementedError()
+    @abstractmethod
+    async def get_many_cache(self, keys: Sequence[str]) -> list[bytes | None]: ...
 
-    async def get_json_cache(self, key: str) -> Union[dict, list]:
-        json_data = json.loads(self.get_cache(key))
-        return json_data
+    @abstractmethod
+    async def delete_cache(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    async def add_cache(self, values: Mapping[str, bytes]) -> None:
+        """Set the keys that do not exist yet, without an expiry."""
+
+    @abstractmethod
+    async def replace_cache(
+        self, values: Mapping[str, bytes], ex: int | None = None
+    ) -> None:
+        """Set the keys at once. Unlike the other writes, errors are raised."""
+
+    @abstractmethod
+    async def set_cache_if_unchanged(
+        self, key: str, value: bytes, expected: bytes | None, ex: int | None = None
+    ) -> None:
+        """Set the key only while it still holds ``expected``, None for a
+        missing key. The comparison happens on the cache server."""
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+    async def set_json_cache(self, key: str, value: Any, ex: int | None = None) -> None:
+        await self.set_cache(key, orjson.dumps(value), ex=ex)
+
+    async def get_json_cache(self, key: str) -> Any | None:
+        data = await self.get_cache(key)
+        return orjson.loads(data) if data is not None else None
+
+    async def get_tags_versions(self, tags: Sequence[str]) -> list[str] | None:
+        """Current generation of every tag, None when one can not be read.
+
+        A tag without a generation, never invalidated or evicted, gets a new
+        one instead of falling back to a default that entries may already
+        have been cached under.
+        """
+        if not tags:
+            return []
+
+        keys = [_build_tag_key(tag) for tag in tags]
+        versions = await self.get_many_cache(keys)
+        if None in versions:
+            await self.add_cache(
+                {
+                    key: _new_tag_version()
+                    for key, version in zip(keys, versions)
+                    if version is None
+                }
+            )
+            versions = await self.get_many_cache(keys)
+            if None in versions:
+                return None
+
+        return [version.decode() for version in versions]
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Give the tags new generations, entries keyed on the old ones are
+        never read again and expire with their TTL.
+
+        Errors are raised, a tag that kept its generation keeps serving the
+        entries it should have invalidated.
+        """
+        await self.replace_cache(
+            {_build_tag_key(tag): _new_tag_version() for tag in tags}
+        )
+
+
+def _build_tag_key(tag: str) -> str:
+    return f"{tag}:v"
+
+
+def _new_tag_version() -> bytes:
+    return uuid4().hex.encode()
@@ -0,0 +1,61 @@
+from collections.abc import Awaitable, Callable, Sequence
+from functools import wraps
+import hashlib
+from typing import Any, TypeVar
+
+import orjson
+
+
+QT = TypeVar("QT")
+QR = TypeVar("QR")
+
+Handle = Callable[[Any, QT], Awaitable[QR]]
+
+
+def build_query_cache_key(query: Any) -> str:
+    """Stable key for a query dataclass, equal queries give equal keys."""
+    digest = hashlib.blake2b(
+        orjson.dumps(query, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+    return f"query:{query.__class__.__name__}:{digest}"
+
+
+def cached_query(
+    encoder: Callable[[QR], Any],
+    decoder: Callable[[Any], QR],
+    tags: Callable[[QT], Sequence[str]] = lambda query: (),
+) -> Callable[[Handle], Handle]:
+    """Cache the result of a query handler's ``handle`` method.
+
+    The handler provides ``cache_service`` and ``cache_ttl`` attributes,
+    ``encoder`` and ``decoder`` convert the result to and from JSON-able data.
+    The current generations of the query's ``tags`` are part of the key, so
+    invalidating a tag makes every entry cached under it unreachable. When
+    a generation can not be read the cache is bypassed.
+    """
+
+    def decorator(handle: Handle) -> Handle:
+        @wraps(handle)
+        async def wrapper(self, query: QT) -> QR:
+            versions = await self.cache_service.get_tags_versions(tags(query))
+            if versions is None:
+                return await handle(self, query)
+
+            key = build_query_cache_key(query)
+            if versions:
+                key = f"{key}:{'.'.join(versions)}"
+
+            cached_result = await self.cache_service.get_json_cache(key)
+            if cached_result is not None:
+                return decoder(cached_result)
+
+            result = await handle(self, query)
+            await self.cache_service.set_json_cache(
+                key, encoder(result), ex=self.cache_ttl
+            )
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+
+@dataclass
+class LocalCache:
+    """Bounded in-process LRU cache with a TTL per entry."""
+
+    maxsize: int
+    ttl: float
+    _entries: OrderedDict[str, tuple[Any, float]] = field(
+        default_factory=OrderedDict, init=False
+    )
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store ``value``, ``ttl`` overrides the cache wide TTL for the entry."""
+        expires_in = self.ttl if ttl is None else ttl
+        self._entries[key] = (value, time.monotonic() + expires_in)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
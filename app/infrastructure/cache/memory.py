@@ -0,0 +1,51 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+import time
+
+from infrastructure.cache.base import AbstractCacheService
+
+
+@dataclass
+class InMemoryCacheService(AbstractCacheService):
+    _values: dict[str, tuple[bytes, float | None]] = field(
+        default_factory=dict, kw_only=True
+    )
+
+    async def set_cache(self, key: str, value: bytes, ex: int | None = None) -> None:
+        expires_at = time.monotonic() + ex if ex else None
+        self._values[key] = (value, expires_at)
+
+    async def get_cache(self, key: str) -> bytes | None:
+        value, expires_at = self._values.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+
+        return value
+
+    async def get_many_cache(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [await self.get_cache(key) for key in keys]
+
+    async def delete_cache(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+
+    async def add_cache(self, values: Mapping[str, bytes]) -> None:
+        for key, value in values.items():
+            if await self.get_cache(key) is None:
+                self._values[key] = (value, None)
+
+    async def replace_cache(
+        self, values: Mapping[str, bytes], ex: int | None = None
+    ) -> None:
+        for key, value in values.items():
+            await self.set_cache(key, value, ex=ex)
+
+    async def set_cache_if_unchanged(
+        self, key: str, value: bytes, expected: bytes | None, ex: int | None = None
+    ) -> None:
+        if await self.get_cache(key) == expected:
+            await self.set_cache(key, value, ex=ex)
+
+    async def close(self) -> None:
+        self._values.clear()
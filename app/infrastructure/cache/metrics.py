@@ -0,0 +1,25 @@
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CacheMetrics:
+    """Hit and miss counters per cache tier."""
+
+    _counters: Counter[tuple[str, str]] = field(default_factory=Counter, init=False)
+
+    def hit(self, tier: str) -> None:
+        self._counters[tier, "hits"] += 1
+
+    def miss(self, tier: str) -> None:
+        self._counters[tier, "misses"] += 1
+
+    def coalesced(self) -> None:
+        self._counters["single_flight", "coalesced"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        snapshot: dict[str, dict[str, int]] = {}
+        for (tier, name), value in self._counters.items():
+            snapshot.setdefault(tier, {})[name] = value
+
+        return snapshot
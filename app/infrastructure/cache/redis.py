@@ -1,22 +1,116 @@
-from functools import cached_property
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import logging
 
-from redis import Redis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from infrastructure.cache.base import AbstractCacheService
-from logic.init import init_container
-from settings.config import Settings
 
 
-# TODO replace fastapi-cache with own cache decorator
+logger = logging.getLogger(__name__)
+
+# KEYS: key; ARGV: value, expiry in seconds or "", expected value, "1" when
+# a value is expected at all
+SET_IF_UNCHANGED_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if ARGV[4] == '1' then
+    if current ~= ARGV[3] then return 0 end
+elseif current then
+    return 0
+end
+if ARGV[2] == '' then
+    redis.call('SET', KEYS[1], ARGV[1])
+else
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+end
+return 1
+"""
+
+
+@dataclass
 class RedisCacheService(AbstractCacheService):
-    @cached_property
-    def client(self):
-        container = init_container()
-        settings: Settings = container.resolve(Settings)
-        return Redis(host=settings.redis_url)
+    """Cache on top of an asyncio Redis client sharing one connection pool.
+
+    Redis errors are logged and treated as cache misses, so an unavailable
+    cache slows requests down instead of failing them.
+    """
+
+    client: Redis
+
+    def __post_init__(self) -> None:
+        self._set_if_unchanged_script = self.client.register_script(
+            SET_IF_UNCHANGED_SCRIPT
+        )
+
+    async def set_cache(self, key: str, value: bytes, ex: int | None = None) -> None:
+        try:
+            await self.client.set(key, value, ex=ex)
+        except RedisError:
+            logger.exception("Could not write cache key %s", key)
+
+    async def get_cache(self, key: str) -> bytes | None:
+        try:
+            return await self.client.get(key)
+        except RedisError:
+            logger.exception("Could not read cache key %s", key)
+            return None
+
+    async def get_many_cache(self, keys: Sequence[str]) -> list[bytes | None]:
+        try:
+            return await self.client.mget(keys)
+        except RedisError:
+            logger.exception("Could not read cache keys %s", keys)
+            return [None] * len(keys)
+
+    async def delete_cache(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        try:
+            await self.client.delete(*keys)
+        except RedisError:
+            logger.exception("Could not delete cache keys %s", keys)
+
+    async def add_cache(self, values: Mapping[str, bytes]) -> None:
+        try:
+            async with self.client.pipeline(transaction=False) as pipeline:
+                for key, value in values.items():
+                    pipeline.set(key, value, nx=True)
+                await pipeline.execute()
+        except RedisError:
+            logger.exception("Could not add cache keys %s", list(values))
+
+    async def replace_cache(
+        self, values: Mapping[str, bytes], ex: int | None = None
+    ) -> None:
+        if not values:
+            return
+
+        if ex is None:
+            await self.client.mset(values)
+            return
+
+        async with self.client.pipeline() as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, value, ex=ex)
+            await pipeline.execute()
 
-    async def set_cache(self, key: str, value: str, ex: int):
-        self.client.set(key, value, ex=ex)
+    async def set_cache_if_unchanged(
+        self, key: str, value: bytes, expected: bytes | None, ex: int | None = None
+    ) -> None:
+        try:
+            await self._set_if_unchanged_script(
+                keys=[key],
+                args=[
+                    value,
+                    ex or "",
+                    expected or b"",
+                    "1" if expected is not None else "0",
+                ],
+            )
+        except RedisError:
+            logger.exception("Could not write cache key %s", key)
 
-    async def get_cache(self, key: str) -> str:
-        return self.client.get(key)
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,5 @@
+GROUPS_CACHE_TAG = "groups"
+
+
+def build_group_cache_tag(group_oid: str) -> str:
+    return f"group:{group_oid}"
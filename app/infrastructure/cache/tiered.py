@@ -0,0 +1,175 @@
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Generic, TypeVar
+from uuid import uuid4
+
+import orjson
+
+from domain.entities.base import BaseEntity
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.local import LocalCache
+from infrastructure.cache.metrics import CacheMetrics
+
+
+ET = TypeVar("ET", bound=BaseEntity)
+
+EVICTED_PREFIX = b"evicted:"
+
+
+@dataclass
+class TieredEntityCache(ABC, Generic[ET]):
+    """Read-through entity cache: in-process LRU, then Redis, then the loader.
+
+    Concurrent misses for the same key share a single load. Tiers keep the
+    encoded entity and every read decodes a fresh instance, so callers can
+    mutate what they get without touching the cache.
+
+    Evicting replaces the Redis entry with a unique tombstone, and a load
+    only writes back while the key still holds what it read before loading.
+    A load racing an eviction, in this process or another one, never puts
+    the entity it read before the change back into Redis. This only holds
+    when ``evict`` is called once the change is committed and visible.
+    """
+
+    cache_service: AbstractCacheService
+    local_cache: LocalCache
+    ttl: int
+    metrics: CacheMetrics = field(default_factory=CacheMetrics)
+    _in_flight: dict[str, asyncio.Future] = field(default_factory=dict, init=False)
+    _generation: int = field(default=0, init=False)
+
+    key_prefix: ClassVar[str]
+
+    @abstractmethod
+    def encode(self, entity: ET) -> dict[str, Any]: ...
+
+    @abstractmethod
+    def decode(self, data: dict[str, Any]) -> ET: ...
+
+    async def get_or_load(
+        self, oid: str, loader: Callable[[], Awaitable[ET | None]]
+    ) -> ET | None:
+        data = self.local_cache.get(oid)
+        if data is not None:
+            self.metrics.hit("local")
+            return self.decode(data)
+
+        self.metrics.miss("local")
+
+        future = self._in_flight.get(oid)
+        if future is None:
+            future = asyncio.ensure_future(self._load(oid, loader))
+            self._in_flight[oid] = future
+            future.add_done_callback(lambda _: self._drop_in_flight(oid, future))
+        else:
+            self.metrics.coalesced()
+
+        data = await asyncio.shield(future)
+        return self.decode(data) if data is not None else None
+
+    async def get_many_or_load(
+        self,
+        oids: Iterable[str],
+        loader: Callable[[list[str]], Awaitable[Mapping[str, ET]]],
+    ) -> dict[str, ET]:
+        """Entities found among ``oids``, keyed by oid.
+
+        Local misses are read from Redis in one round trip and what is still
+        missing is passed to a single ``loader`` call.
+        """
+        generation = self._generation
+        found: dict[str, dict[str, Any]] = {}
+        local_misses: list[str] = []
+        for oid in dict.fromkeys(oids):
+            data = self.local_cache.get(oid)
+            if data is not None:
+                self.metrics.hit("local")
+                found[oid] = data
+            else:
+                self.metrics.miss("local")
+                local_misses.append(oid)
+
+        if local_misses:
+            values = await self.cache_service.get_many_cache(
+                [self._build_key(oid) for oid in local_misses]
+            )
+            redis_misses: dict[str, bytes | None] = {}
+            for oid, value in zip(local_misses, values):
+                if _is_entity(value):
+                    self.metrics.hit("redis")
+                    found[oid] = orjson.loads(value)
+                else:
+                    self.metrics.miss("redis")
+                    redis_misses[oid] = value
+
+            entities = await loader(list(redis_misses)) if redis_misses else {}
+            loaded = {oid: self.encode(entity) for oid, entity in entities.items()}
+            found.update(loaded)
+
+            await asyncio.gather(
+                *(
+                    self.cache_service.set_cache_if_unchanged(
+                        self._build_key(oid),
+                        orjson.dumps(data),
+                        expected=redis_misses[oid],
+                        ex=self.ttl,
+                    )
+                    for oid, data in loaded.items()
+                )
+            )
+            # Anything loaded while an eviction happened may already be stale.
+            if generation == self._generation:
+                for oid in local_misses:
+                    if oid in found:
+                        self.local_cache.set(oid, found[oid])
+
+        return {oid: self.decode(data) for oid, data in found.items()}
+
+    async def evict(self, oid: str) -> None:
+        self._generation += 1
+        self._in_flight.pop(oid, None)
+        self.local_cache.delete(oid)
+        await self.cache_service.replace_cache(
+            {self._build_key(oid): EVICTED_PREFIX + uuid4().hex.encode()},
+            ex=self.ttl,
+        )
+
+    async def _load(
+        self, oid: str, loader: Callable[[], Awaitable[ET | None]]
+    ) -> dict[str, Any] | None:
+        generation = self._generation
+
+        key = self._build_key(oid)
+        value = await self.cache_service.get_cache(key)
+        if _is_entity(value):
+            self.metrics.hit("redis")
+            data = orjson.loads(value)
+        else:
+            self.metrics.miss("redis")
+            entity = await loader()
+            if entity is None:
+                return None
+
+            data = self.encode(entity)
+            await self.cache_service.set_cache_if_unchanged(
+                key, orjson.dumps(data), expected=value, ex=self.ttl
+            )
+
+        # Anything loaded while an eviction happened may already be stale.
+        if generation == self._generation:
+            self.local_cache.set(oid, data)
+
+        return data
+
+    def _drop_in_flight(self, oid: str, future: asyncio.Future) -> None:
+        if self._in_flight.get(oid) is future:
+            del self._in_flight[oid]
+
+    def _build_key(self, oid: str) -> str:
+        return f"{self.key_prefix}:{oid}"
+
+
+def _is_entity(value: bytes | None) -> bool:
+    return value is not None and not value.startswith(EVICTED_PREFIX)
@@ -25,3 +25,25 @@ class ExpiredToken(InfrastructureException):
     @property
     def status_code(self) -> int:
         return HTTPStatus.UNAUTHORIZED.value
+
+
+@dataclass(eq=False)
+class RevokedToken(InfrastructureException):
+    @property
+    def message(self) -> str:
+        return "Token has been revoked"
+
+    @property
+    def status_code(self) -> int:
+        return HTTPStatus.UNAUTHORIZED.value
+
+
+@dataclass(eq=False)
+class RefreshTokenReused(InfrastructureException):
+    @property
+    def message(self) -> str:
+        return "Refresh token was already used, the session has been revoked"
+
+    @property
+    def status_code(self) -> int:
+        return HTTPStatus.UNAUTHORIZED.value
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from infrastructure.exceptions.base import InfrastructureException
+
+
+@dataclass(eq=False)
+class InvalidCursorException(InfrastructureException):
+    cursor: str
+
+    @property
+    def message(self) -> str:
+        return f"Page cursor is invalid: {self.cursor}"
+
+    @property
+    def status_code(self) -> int:
+        return HTTPStatus.BAD_REQUEST.value
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from infrastructure.exceptions.base import InfrastructureException
+
+
+@dataclass(eq=False)
+class UnknownEventTypeException(InfrastructureException):
+    tag: str
+
+    @property
+    def message(self) -> str:
+        return f"Unknown event type in broker message: {self.tag}"
+
+
+@dataclass(eq=False)
+class UnsupportedEventVersionException(InfrastructureException):
+    tag: str
+    version: int
+
+    @property
+    def message(self) -> str:
+        return f"Unsupported schema version {self.version} of the event {self.tag}"
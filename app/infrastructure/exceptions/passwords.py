@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from infrastructure.exceptions.base import InfrastructureException
+
+
+@dataclass(eq=False)
+class PasswordHasherOverloaded(InfrastructureException):
+    max_pending: int
+
+    @property
+    def message(self) -> str:
+        return f"Too many password operations in progress: {self.max_pending}"
+
+    @property
+    def status_code(self) -> int:
+        return HTTPStatus.TOO_MANY_REQUESTS.value
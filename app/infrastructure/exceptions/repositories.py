@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from infrastructure.exceptions.base import InfrastructureException
+
+
+@dataclass(eq=False)
+class MissingIndexesException(InfrastructureException):
+    missing_indexes: dict[str, list[str]]
+
+    @property
+    def message(self) -> str:
+        return f"Queries are not covered by an index: {self.missing_indexes}"
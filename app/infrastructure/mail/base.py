@@ -0,0 +1,6 @@
+from abc import ABC, abstractmethod
+
+
+class BaseMailSender(ABC):
+    @abstractmethod
+    async def send(self, recipient: str, subject: str, body: str) -> None: ...
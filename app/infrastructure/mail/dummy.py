@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+import logging
+
+from infrastructure.mail.base import BaseMailSender
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DummyMailSender(BaseMailSender):
+    """Logs mails instead of sending them, used when no SMTP host is set."""
+
+    sent: list[tuple[str, str, str]] = field(default_factory=list)
+
+    async def send(self, recipient: str, subject: str, body: str) -> None:
+        self.sent.append((recipient, subject, body))
+        logger.info("Mail to %s: %s\n%s", recipient, subject, body)
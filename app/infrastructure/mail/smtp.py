@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from infrastructure.mail.base import BaseMailSender
+
+
+@dataclass(frozen=True)
+class SMTPMailSender(BaseMailSender):
+    host: str
+    port: int
+    sender: str
+    username: str | None = None
+    password: str | None = None
+    start_tls: bool = True
+
+    async def send(self, recipient: str, subject: str, body: str) -> None:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.set_content(body)
+
+        await aiosmtplib.send(
+            message,
+            hostname=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+        )
@@ -1,7 +1,16 @@
 from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class BrokerMessage:
+    topic: str
+    key: bytes
+    value: bytes
+
+
 @dataclass
 class BaseMessageBroker(ABC):
     @abstractmethod
@@ -11,7 +20,16 @@ class BaseMessageBroker(ABC):
     async def stop(self) -> None: ...
 
     @abstractmethod
-    async def send_message(self, key: str, topic: str, value: bytes): ...
+    async def send_message(self, key: str, topic: str, value: bytes) -> asyncio.Future:
+        """Queue the message, the returned future resolves once it is delivered."""
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Wait until every queued message is delivered."""
+
+    @abstractmethod
+    async def send_batch(self, messages: Iterable[BrokerMessage]) -> None:
+        """Send all messages, returns once every one of them is acknowledged."""
 
     @abstractmethod
     async def start_consuming(self, topic: str): ...
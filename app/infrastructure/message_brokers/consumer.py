@@ -0,0 +1,141 @@
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+import logging
+from typing import ClassVar
+
+from aiokafka import AIOKafkaConsumer, AIOKafkaProducer, ConsumerRecord
+
+from domain.events.base import BaseEvent
+from infrastructure.message_brokers.converters import convert_broker_message_to_event
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseMessageHandler(ABC):
+    event_type: ClassVar[type[BaseEvent]]
+
+    @abstractmethod
+    async def handle(self, event: BaseEvent) -> None: ...
+
+
+@dataclass(eq=False)
+class KafkaConsumerWorker:
+    """Consumes topics in a shared consumer group and dispatches to handlers.
+
+    Every fetched batch is split into lanes by partition and message key:
+    lanes run concurrently, messages of one lane in offset order, and at most
+    ``max_in_flight`` messages are handled at once. Offsets are committed once
+    per batch after every lane finished, so delivery is at least once.
+
+    A message still failing after ``max_attempts`` goes to the dead letter
+    topic with its origin and the error in the headers.
+    """
+
+    consumer: AIOKafkaConsumer
+    producer: AIOKafkaProducer
+    handlers: Mapping[str, BaseMessageHandler]
+    dead_letter_topic: str
+    max_in_flight: int = 64
+    max_records: int = 500
+    max_attempts: int = 3
+    retry_backoff: float = 0.5
+    _semaphore: asyncio.Semaphore = field(init=False)
+    _is_stopping: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+    async def start(self) -> None:
+        await self.consumer.start()
+        await self.producer.start()
+
+    async def close(self) -> None:
+        await self.consumer.stop()
+        await self.producer.stop()
+
+    async def run(self) -> None:
+        self.consumer.subscribe(topics=list(self.handlers))
+
+        while not self._is_stopping.is_set():
+            batches = await self.consumer.getmany(
+                timeout_ms=1000, max_records=self.max_records
+            )
+            if not batches:
+                continue
+
+            await self.process(batches.values())
+            await self.consumer.commit(
+                {
+                    partition: records[-1].offset + 1
+                    for partition, records in batches.items()
+                }
+            )
+
+    def stop(self) -> None:
+        self._is_stopping.set()
+
+    async def process(self, batches: Iterable[list[ConsumerRecord]]) -> None:
+        lanes: dict[tuple[str, int, bytes | None], list[ConsumerRecord]] = {}
+        for records in batches:
+            for record in records:
+                lanes.setdefault(
+                    (record.topic, record.partition, record.key), []
+                ).append(record)
+
+        await asyncio.gather(*(self._process_lane(lane) for lane in lanes.values()))
+
+    async def _process_lane(self, records: list[ConsumerRecord]) -> None:
+        for record in records:
+            async with self._semaphore:
+                await self._process_record(record)
+
+    async def _process_record(self, record: ConsumerRecord) -> None:
+        handler = self.handlers[record.topic]
+        try:
+            event = convert_broker_message_to_event(record.value, handler.event_type)
+        except Exception as error:
+            await self._dead_letter(record, error)
+            return
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await handler.handle(event)
+                return
+            except Exception as error:
+                if attempt == self.max_attempts:
+                    await self._dead_letter(record, error)
+                    return
+
+                logger.warning(
+                    "Attempt %d for %s:%d@%d failed",
+                    attempt,
+                    record.topic,
+                    record.partition,
+                    record.offset,
+                    exc_info=True,
+                )
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+    async def _dead_letter(self, record: ConsumerRecord, error: Exception) -> None:
+        logger.error(
+            "Moving %s:%d@%d to %s: %r",
+            record.topic,
+            record.partition,
+            record.offset,
+            self.dead_letter_topic,
+            error,
+        )
+        await self.producer.send_and_wait(
+            self.dead_letter_topic,
+            key=record.key,
+            value=record.value,
+            headers=[
+                ("topic", record.topic.encode()),
+                ("partition", str(record.partition).encode()),
+                ("offset", str(record.offset).encode()),
+                ("error", repr(error).encode()),
+            ],
+        )
@@ -1,9 +1,23 @@
-from dataclasses import asdict
-from typing import Any
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+import struct
+from typing import Any, Mapping
 
+import msgpack
 import orjson
 
 from domain.events.base import BaseEvent
+from domain.events.groups import GroupCreatedEvent, GroupDeletedEvent
+from domain.events.users import (
+    UserCreatedEvent,
+    UserDeletedEvent,
+    UserVerifiedEvent,
+    VerificationTokenCreatedEvent,
+)
+from infrastructure.exceptions.message_brokers import (
+    UnknownEventTypeException,
+    UnsupportedEventVersionException,
+)
 
 
 def convert_event_to_broker_message(event: BaseEvent) -> bytes:
@@ -12,3 +26,111 @@ def convert_event_to_broker_message(event: BaseEvent) -> bytes:
 
 def convert_event_to_json(event: BaseEvent) -> dict[str, Any]:
     return asdict(event)
+
+
+# Binary messages start with a header of a magic byte, the schema version and
+# the length of the type tag that follows, then the event's field values as a
+# msgpack array in dataclass field order, datetimes as microseconds since the
+# naive epoch. Changing the fields of an event means bumping its version.
+# JSON messages never start with the magic byte.
+BINARY_MESSAGE_MAGIC = 0xE5
+_BINARY_HEADER = struct.Struct("!BBB")
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class _EventSchema:
+    event_type: type[BaseEvent]
+    version: int
+    field_names: tuple[str, ...]
+    datetime_indexes: tuple[int, ...]
+    header: bytes
+
+
+_EVENT_SCHEMAS: dict[bytes, _EventSchema] = {}
+
+# Reusing one packer saves its setup on every message, converters are only
+# called from the event loop thread.
+_packer = msgpack.Packer()
+
+
+def register_event_schema(event_type: type[BaseEvent], version: int = 1) -> None:
+    event_fields = fields(event_type)
+    tag = event_type.__name__.encode()
+    _EVENT_SCHEMAS[tag] = _EventSchema(
+        event_type=event_type,
+        version=version,
+        field_names=tuple(field.name for field in event_fields),
+        datetime_indexes=tuple(
+            index for index, field in enumerate(event_fields) if field.type is datetime
+        ),
+        header=_BINARY_HEADER.pack(BINARY_MESSAGE_MAGIC, version, len(tag)) + tag,
+    )
+
+
+for _event_type in (
+    GroupCreatedEvent,
+    GroupDeletedEvent,
+    UserCreatedEvent,
+    UserDeletedEvent,
+    UserVerifiedEvent,
+    VerificationTokenCreatedEvent,
+):
+    register_event_schema(_event_type)
+
+
+def convert_event_to_binary_message(event: BaseEvent) -> bytes:
+    schema = _EVENT_SCHEMAS.get(event.__class__.__name__.encode())
+    if schema is None:
+        raise UnknownEventTypeException(event.__class__.__name__)
+
+    values = [getattr(event, name) for name in schema.field_names]
+    for index in schema.datetime_indexes:
+        values[index] = (values[index] - _EPOCH) // _MICROSECOND
+
+    return schema.header + _packer.pack(values)
+
+
+def convert_binary_message_to_event(message: bytes | memoryview) -> BaseEvent:
+    """Decode a binary message straight into its event.
+
+    The payload is unpacked from a view into the message, without copying
+    it, and the event is built without running its ``__init__``.
+    """
+    _, version, tag_length = _BINARY_HEADER.unpack_from(message)
+    tag_end = _BINARY_HEADER.size + tag_length
+    tag = bytes(message[_BINARY_HEADER.size : tag_end])
+
+    schema = _EVENT_SCHEMAS.get(tag)
+    if schema is None:
+        raise UnknownEventTypeException(tag.decode(errors="replace"))
+    if version != schema.version:
+        raise UnsupportedEventVersionException(tag.decode(), version)
+
+    values = msgpack.unpackb(memoryview(message)[tag_end:])
+    for index in schema.datetime_indexes:
+        values[index] = _EPOCH + values[index] * _MICROSECOND
+
+    event = object.__new__(schema.event_type)
+    event.__dict__ = dict(zip(schema.field_names, values))
+
+    return event
+
+
+def convert_json_to_event(
+    event_type: type[BaseEvent], event_json: Mapping[str, Any]
+) -> BaseEvent:
+    return event_type(
+        **{**event_json, "occured_at": datetime.fromisoformat(event_json["occured_at"])}
+    )
+
+
+def convert_broker_message_to_event(
+    message: bytes, event_type: type[BaseEvent]
+) -> BaseEvent:
+    """Decode a binary or a JSON message, ``event_type`` is needed for JSON."""
+    if message[:1] == bytes((BINARY_MESSAGE_MAGIC,)):
+        return convert_binary_message_to_event(message)
+
+    return convert_json_to_event(event_type, orjson.loads(message))
@@ -1,6 +1,8 @@
+import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
-from infrastructure.message_brokers.base import BaseMessageBroker
+from infrastructure.message_brokers.base import BaseMessageBroker, BrokerMessage
 
 
 @dataclass
@@ -13,12 +15,24 @@ class DummyKafkaMessageBroker(BaseMessageBroker):
     async def stop(self) -> None:
         print("Dummy Kafka broker stopped")
 
-    async def send_message(self, key: str, topic: str, value: bytes) -> None:
+    async def send_message(self, key: str, topic: str, value: bytes) -> asyncio.Future:
         if topic not in self._messages:
             self._messages[topic] = []
         self._messages[topic].append(value)
         print(f"Dummy sent message to topic {topic}: {value}")
 
+        delivery = asyncio.get_running_loop().create_future()
+        delivery.set_result(None)
+        return delivery
+
+    async def flush(self) -> None: ...
+
+    async def send_batch(self, messages: Iterable[BrokerMessage]) -> None:
+        for message in messages:
+            await self.send_message(
+                key=message.key, topic=message.topic, value=message.value
+            )
+
     async def start_consuming(self, topic: str) -> list[bytes]:
         return self._messages.get(topic, [])
 
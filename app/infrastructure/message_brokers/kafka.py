@@ -1,9 +1,11 @@
+import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import AsyncIterator
 
 import orjson
 
-from infrastructure.message_brokers.base import BaseMessageBroker
+from infrastructure.message_brokers.base import BaseMessageBroker, BrokerMessage
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
 
 
@@ -12,8 +14,24 @@ class KafkaMessageBroker(BaseMessageBroker):
     producer: AIOKafkaProducer
     consumer: AIOKafkaConsumer
 
-    async def send_message(self, key: bytes, topic: str, value: bytes):
-        await self.producer.send(topic=topic, key=key, value=value)
+    async def send_message(
+        self, key: bytes, topic: str, value: bytes
+    ) -> asyncio.Future:
+        # ``send`` appends to the producer's per-partition batch and only
+        # waits when the buffer is full, delivery is tracked by the future.
+        return await self.producer.send(topic=topic, key=key, value=value)
+
+    async def flush(self) -> None:
+        await self.producer.flush()
+
+    async def send_batch(self, messages: Iterable[BrokerMessage]) -> None:
+        deliveries = [
+            await self.send_message(
+                key=message.key, topic=message.topic, value=message.value
+            )
+            for message in messages
+        ]
+        await asyncio.gather(*deliveries)
 
     async def start_consuming(self, topic: str) -> AsyncIterator[dict]:
         self.consumer.subscribe(topics=[topic])
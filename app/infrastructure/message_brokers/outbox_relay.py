@@ -0,0 +1,76 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
+import logging
+
+from infrastructure.message_brokers.base import BaseMessageBroker, BrokerMessage
+from infrastructure.repositories.outbox.base import BaseOutboxRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class OutboxRelay:
+    """Drains the outbox to the message broker in batches.
+
+    A batch is marked as sent only after the broker acknowledged all of it,
+    so a crash in between re-sends that batch: delivery is at least once and
+    consumers deduplicate by the event id used as the message key.
+    """
+
+    outbox_repository: BaseOutboxRepository
+    message_broker: BaseMessageBroker
+    batch_size: int = 500
+    poll_interval: float = 0.5
+    relayed: int = field(default=0, init=False)
+    lag: float = field(default=0.0, init=False)
+    _is_stopping: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _task: asyncio.Task | None = field(default=None, init=False)
+
+    async def relay_batch(self) -> int:
+        messages = await self.outbox_repository.get_pending_messages(
+            limit=self.batch_size
+        )
+        if messages:
+            await self.message_broker.send_batch(
+                BrokerMessage(topic=message.topic, key=message.key, value=message.value)
+                for message in messages
+            )
+            await self.outbox_repository.mark_sent(message.oid for message in messages)
+            self.relayed += len(messages)
+
+        oldest_created_at = await self.outbox_repository.get_oldest_pending_created_at()
+        self.lag = (
+            (datetime.now() - oldest_created_at).total_seconds()
+            if oldest_created_at
+            else 0.0
+        )
+
+        return len(messages)
+
+    async def run(self) -> None:
+        while not self._is_stopping.is_set():
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                logger.exception("Could not relay the outbox")
+                relayed = 0
+
+            # A full batch means there is more waiting, keep draining.
+            if relayed < self.batch_size:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._is_stopping.wait(), timeout=self.poll_interval
+                    )
+
+    def start(self) -> None:
+        self._is_stopping.clear()
+        self._task = asyncio.create_task(self.run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        self._is_stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
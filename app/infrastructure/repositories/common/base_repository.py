@@ -1,7 +1,26 @@
 from abc import ABC
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, ClassVar, Iterable, Mapping
 
-from motor.core import AgnosticClient, AgnosticCollection
+from motor.core import (
+    AgnosticClient,
+    AgnosticClientSession,
+    AgnosticCollection,
+    AgnosticCursor,
+)
+from pymongo import ASCENDING, IndexModel, WriteConcern
+from pymongo.read_preferences import Primary, _ServerMode
+
+from infrastructure.repositories.common.filters.base import (
+    BaseGetAllFilters,
+    CountMode,
+)
+from infrastructure.transactions.mongo import current_session
+
+
+PAGE_SORT = [("created_at", ASCENDING), ("oid", ASCENDING)]
 
 
 @dataclass(frozen=True)
@@ -9,9 +28,100 @@ class BaseMongoDBRepository(ABC):
     mongo_db_client: AgnosticClient
     mongo_db_db_name: str
     mongo_db_collection_name: str
+    # Paged listings may be served by secondaries. Point reads stay on the
+    # primary, the entity caches are filled from them and must never miss
+    # a write because a secondary lags behind.
+    listing_read_preference: _ServerMode = field(default_factory=Primary, kw_only=True)
+    write_concern: WriteConcern = field(default_factory=WriteConcern, kw_only=True)
 
-    @property
+    # Indexes created on startup, every query in checked_queries has to be
+    # served by one of them.
+    indexes: ClassVar[tuple[IndexModel, ...]] = ()
+
+    @cached_property
     def _collection(self) -> AgnosticCollection:
-        return self.mongo_db_client[self.mongo_db_db_name][
-            self.mongo_db_collection_name
-        ]
+        return self.mongo_db_client[self.mongo_db_db_name].get_collection(
+            self.mongo_db_collection_name, write_concern=self.write_concern
+        )
+
+    @cached_property
+    def _listing_collection(self) -> AgnosticCollection:
+        return self._collection.with_options(
+            read_preference=self.listing_read_preference
+        )
+
+    @property
+    def _session(self) -> AgnosticClientSession | None:
+        return current_session.get()
+
+    def checked_queries(self) -> Iterable[AgnosticCursor]:
+        """Cursors for the queries the repository runs, with placeholder values.
+
+        Filtered and sorted queries are built by the same helpers the
+        repository methods use, point lookups by the field they match on.
+        """
+        return ()
+
+    def _find_page(
+        self,
+        conditions: dict,
+        filters: BaseGetAllFilters,
+        projection: Mapping[str, Any] | None = None,
+    ) -> AgnosticCursor:
+        """Find one page of documents in ``(created_at, oid)`` order.
+
+        Pages after a cursor are fetched with a range condition on the sort
+        key instead of skipping, so deep pages cost the same as the first.
+        """
+        if filters.cursor:
+            cursor = filters.cursor
+            conditions = {
+                **conditions,
+                "$or": [
+                    {"created_at": {"$gt": cursor.created_at}},
+                    {"created_at": cursor.created_at, "oid": {"$gt": cursor.oid}},
+                ],
+            }
+            documents = self._listing_collection.find(
+                conditions, projection=projection, session=self._session
+            )
+        else:
+            documents = self._listing_collection.find(
+                conditions, projection=projection, session=self._session
+            ).skip(filters.offset)
+
+        return documents.sort(PAGE_SORT).limit(filters.limit)
+
+    async def _count_documents(self, conditions: dict, mode: CountMode) -> int | None:
+        if mode == CountMode.NONE:
+            return None
+
+        if not conditions and mode == CountMode.ESTIMATED:
+            return await self._listing_collection.estimated_document_count()
+
+        return await self._listing_collection.count_documents(
+            conditions, session=self._session
+        )
+
+    async def _get_page(
+        self,
+        conditions: dict,
+        filters: BaseGetAllFilters,
+        projection: Mapping[str, Any] | None = None,
+    ) -> tuple[list[dict], int | None]:
+        """Fetch a page and its total count concurrently."""
+        cursor = self._find_page(
+            conditions=conditions, filters=filters, projection=projection
+        )
+
+        if self._session is not None:
+            # A session serves one operation at a time.
+            return (
+                await cursor.to_list(length=filters.limit),
+                await self._count_documents(conditions=conditions, mode=filters.count),
+            )
+
+        return await asyncio.gather(
+            cursor.to_list(length=filters.limit),
+            self._count_documents(conditions=conditions, mode=filters.count),
+        )
@@ -1,8 +1,59 @@
 from abc import ABC
+import base64
+import binascii
 from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+import orjson
+
+from domain.entities.base import BaseEntity
+from infrastructure.exceptions.filters import InvalidCursorException
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position of the last item of a page in ``(created_at, oid)`` order."""
+
+    created_at: datetime
+    oid: str
+
+    @classmethod
+    def from_entity(cls, entity: BaseEntity) -> "PageCursor":
+        return cls(created_at=entity.created_at, oid=entity.oid)
+
+    @classmethod
+    def decode(cls, value: str) -> "PageCursor":
+        try:
+            created_at, oid = orjson.loads(base64.urlsafe_b64decode(value))
+            return cls(created_at=datetime.fromisoformat(created_at), oid=str(oid))
+        except (binascii.Error, ValueError, TypeError):
+            raise InvalidCursorException(value)
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(
+            orjson.dumps([self.created_at.isoformat(), self.oid])
+        ).decode()
+
+
+class CountMode(str, Enum):
+    """How the total count of a listing is computed.
+
+    ``estimated`` uses collection metadata and only applies to unfiltered
+    listings, ``cached`` reads a counter maintained from domain events where
+    one exists. Both fall back to ``exact`` otherwise.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
 
 
 @dataclass
 class BaseGetAllFilters(ABC):
     limit: int
     offset: int
+    # When set, the page starts right after the cursor and offset is ignored.
+    cursor: PageCursor | None = None
+    count: CountMode = CountMode.EXACT
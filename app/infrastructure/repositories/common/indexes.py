@@ -0,0 +1,96 @@
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from infrastructure.exceptions.repositories import MissingIndexesException
+from infrastructure.repositories.common.base_repository import BaseMongoDBRepository
+
+# Plan stages that scan the whole collection or sort the results in memory.
+UNINDEXED_STAGES = frozenset({"COLLSCAN", "SORT"})
+
+
+def get_queried_fields(query_filter: Mapping[str, Any]) -> list[set[str]]:
+    """Split a filter into the field sets each of its ``$or`` branches matches on."""
+    fields = {field for field in query_filter if not field.startswith("$")}
+    branches = query_filter.get("$or")
+    if not branches:
+        return [fields]
+
+    return [
+        fields | branch_fields
+        for branch in branches
+        for branch_fields in get_queried_fields(branch)
+    ]
+
+
+def is_query_covered(
+    index_key: Sequence[tuple[str, Any]],
+    queried_fields: Iterable[str],
+    sort: Sequence[tuple[str, Any]] = (),
+) -> bool:
+    """Check that an index can serve an equality query on ``queried_fields``.
+
+    The queried fields have to match the leading fields of the index key in
+    any order, the ``sort`` fields have to follow them in the index order or
+    in the fully reversed one.
+    """
+    queried_fields = set(queried_fields)
+    leading_fields = {field for field, _ in index_key[: len(queried_fields)]}
+    if leading_fields != queried_fields:
+        return False
+
+    sort_key = list(index_key[len(queried_fields) : len(queried_fields) + len(sort)])
+    reversed_sort_key = [(field, -direction) for field, direction in sort_key]
+    return not sort or list(sort) in (sort_key, reversed_sort_key)
+
+
+def get_unindexed_stages(plan: Mapping[str, Any]) -> set[str]:
+    """Collect the stages of an explained plan that do not use an index."""
+    stages = {plan["stage"]} & UNINDEXED_STAGES if "stage" in plan else set()
+    children = [
+        plan.get("inputStage"),
+        plan.get("queryPlan"),
+        *plan.get("inputStages", ()),
+    ]
+    for child in children:
+        if child:
+            stages |= get_unindexed_stages(child)
+
+    return stages
+
+
+@dataclass
+class MongoDBIndexManager:
+    repositories: Iterable[BaseMongoDBRepository]
+
+    async def ensure_indexes(self) -> None:
+        """Create declared indexes.
+
+        Indexes are created by name, so running this on several replicas
+        at once or on every startup is a no-op once they exist.
+        """
+        for repository in self.repositories:
+            if repository.indexes:
+                await repository._collection.create_indexes(list(repository.indexes))
+
+    async def check_indexes(self) -> None:
+        """Explain the queries of every repository against the live indexes.
+
+        A query whose winning plan scans the collection or sorts in memory
+        is reported, whatever indexes the repository declares.
+        """
+        missing_indexes: dict[str, list[str]] = {}
+
+        for repository in self.repositories:
+            for cursor in repository.checked_queries():
+                explanation = await cursor.explain()
+                query_planner = explanation["queryPlanner"]
+                stages = get_unindexed_stages(query_planner["winningPlan"])
+                if stages:
+                    query = explanation.get("command", query_planner["parsedQuery"])
+                    missing_indexes.setdefault(
+                        repository.mongo_db_collection_name, []
+                    ).append(f"{query} ({', '.join(sorted(stages))})")
+
+        if missing_indexes:
+            raise MissingIndexesException(missing_indexes)
@@ -0,0 +1,67 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+import contextvars
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+@dataclass(eq=False)
+class BatchLoader(Generic[KT, VT]):
+    """Merges single-key lookups issued within one event loop tick.
+
+    The first ``load`` of a tick schedules a dispatch, every key requested
+    until the loop runs it is fetched by a shared ``load_many`` call, at
+    most ``max_batch_size`` keys each. The same key requested twice is
+    fetched once. Batches run outside the context of any caller, so reads
+    never join the transaction of whichever caller came first. Callers in a
+    transaction have to read through it instead of the loader.
+    """
+
+    load_many: Callable[[list[KT]], Awaitable[Mapping[KT, VT]]]
+    max_batch_size: int = 1000
+    _pending: dict[KT, asyncio.Future] = field(default_factory=dict, init=False)
+    _tasks: set[asyncio.Task] = field(default_factory=set, init=False)
+
+    async def load(self, key: KT) -> VT | None:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) == 1:
+                loop.call_soon(self._dispatch, context=contextvars.Context())
+
+        # A cancelled caller must not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch_size):
+            batch = {
+                key: pending[key] for key in keys[start : start + self.max_batch_size]
+            }
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, batch: dict[KT, asyncio.Future]) -> None:
+        try:
+            values = await self.load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,90 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Generic, Hashable, TypeVar
+
+from domain.entities.base import BaseEntity
+from infrastructure.repositories.common.filters.base import BaseGetAllFilters
+
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+class ShardedIndex(Generic[KT, VT]):
+    """Hash index spread over several dicts.
+
+    Lookups stay O(1), and as the index grows every resize rehashes one
+    shard instead of the whole index, so at millions of entries a single
+    insert never stalls the event loop for long.
+    """
+
+    __slots__ = ("_shards",)
+
+    def __init__(self, shards: int = 16) -> None:
+        self._shards: list[dict[KT, VT]] = [{} for _ in range(shards)]
+
+    def _shard(self, key: KT) -> dict[KT, VT]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: KT) -> VT | None:
+        return self._shard(key).get(key)
+
+    def set(self, key: KT, value: VT) -> None:
+        self._shard(key)[key] = value
+
+    def pop(self, key: KT) -> VT | None:
+        return self._shard(key).pop(key, None)
+
+    def __contains__(self, key: KT) -> bool:
+        return key in self._shard(key)
+
+    def __len__(self) -> int:
+        return sum(map(len, self._shards))
+
+    def values(self) -> Iterator[VT]:
+        for shard in self._shards:
+            yield from shard.values()
+
+
+class PageIndex:
+    """Oids in ``(created_at, oid)`` order, paged the way
+    ``BaseMongoDBRepository._find_page`` pages a collection.
+
+    Cursor pages start with a binary search. Entities are mostly added in
+    creation order, so keeping the keys sorted is usually an append.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[datetime, str]] = []
+
+    def add(self, entity: BaseEntity) -> None:
+        key = (entity.created_at, entity.oid)
+        if not self._keys or self._keys[-1] < key:
+            self._keys.append(key)
+        else:
+            insort(self._keys, key)
+
+    def remove(self, entity: BaseEntity) -> None:
+        key = (entity.created_at, entity.oid)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return (oid for _, oid in self._keys)
+
+    def page(self, filters: BaseGetAllFilters) -> list[str]:
+        if filters.cursor:
+            start = bisect_right(
+                self._keys, (filters.cursor.created_at, filters.cursor.oid)
+            )
+        else:
+            start = filters.offset
+
+        return [oid for _, oid in self._keys[start : start + filters.limit]]
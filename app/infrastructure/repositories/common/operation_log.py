@@ -0,0 +1,279 @@
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+import logging
+import os
+from pathlib import Path
+import time
+
+import msgpack
+
+
+logger = logging.getLogger(__name__)
+
+Record = tuple
+ReplayRecord = Callable[[Record], None]
+DumpRecords = Callable[[], Iterable[Record]]
+
+
+class BaseOperationLog(ABC):
+    """Durability for an in-memory repository.
+
+    The repository applies a write to its indexes and appends a record of
+    it in the same step, then awaits the returned awaitable before
+    reporting the write done, undoing the write if the record could not be
+    persisted. Replaying a record has to be idempotent, one can be replayed
+    on top of a snapshot that already holds its effect.
+    """
+
+    @abstractmethod
+    async def open(self, replay: ReplayRecord, dump: DumpRecords) -> int:
+        """Replay the persisted records and start persisting new ones.
+
+        ``dump`` returns the records that rebuild the current state, it is
+        called from the event loop and may be consumed in another thread.
+        Returns the number of replayed records.
+        """
+
+    @abstractmethod
+    def append(self, record: Record) -> Awaitable[None]:
+        """Queue a record, the awaitable is done once it is durable."""
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+
+async def undo_unless_durable(
+    written: Awaitable[None], lock: asyncio.Lock, undo: Callable[[], None]
+) -> None:
+    """Await an appended record, calling ``undo`` under ``lock`` and
+    re-raising if it could not be persisted.
+
+    A cancelled caller undoes nothing, the record is still written.
+    """
+    try:
+        await asyncio.shield(written)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        async with lock:
+            undo()
+        raise
+
+
+class DummyOperationLog(BaseOperationLog):
+    """Keeps nothing, the state is lost with the process."""
+
+    async def open(self, replay: ReplayRecord, dump: DumpRecords) -> int:
+        return 0
+
+    def append(self, record: Record) -> Awaitable[None]:
+        written = asyncio.get_running_loop().create_future()
+        written.set_result(None)
+        return written
+
+    async def close(self) -> None:
+        pass
+
+
+@dataclass(eq=False)
+class FileOperationLog(BaseOperationLog):
+    """Append-only msgpack log segments plus a periodic snapshot.
+
+    Records queued within ``fsync_interval`` are written and fsynced as one
+    batch. Every ``snapshot_interval`` seconds with new records, the state
+    is dumped to ``<name>.snapshot`` and the log segments it covers are
+    deleted, so a restart loads the snapshot and replays only the segments
+    written since. The snapshot is taken while writes go on, records
+    queued after it was started go to the next segment.
+    """
+
+    directory: Path
+    name: str
+    fsync_interval: float = 0.01
+    snapshot_interval: float = 300.0
+    _dump: DumpRecords | None = field(default=None, init=False)
+    _segment: int = field(default=0, init=False)
+    _pending: list[tuple[bytes, asyncio.Future]] = field(
+        default_factory=list, init=False
+    )
+    _has_pending: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _records_since_snapshot: int = field(default=0, init=False)
+    _is_closing: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _flush_task: asyncio.Task | None = field(default=None, init=False)
+    _snapshot_task: asyncio.Task | None = field(default=None, init=False)
+    _flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _snapshot_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _packer: msgpack.Packer = field(default_factory=msgpack.Packer, init=False)
+
+    @property
+    def _snapshot_path(self) -> Path:
+        return self.directory / f"{self.name}.snapshot"
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"{self.name}.{segment:08d}.log"
+
+    def _segments(self) -> list[int]:
+        return sorted(
+            int(path.name.split(".")[-2])
+            for path in self.directory.glob(f"{self.name}.*.log")
+        )
+
+    async def open(self, replay: ReplayRecord, dump: DumpRecords) -> int:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        replayed = 0
+        first_segment = 0
+
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path, "rb") as snapshot:
+                unpacker = msgpack.Unpacker(snapshot, use_list=False)
+                first_segment = next(unpacker)
+                for record in unpacker:
+                    replay(record)
+                    replayed += 1
+
+        segments = [segment for segment in self._segments() if segment >= first_segment]
+        for segment in segments:
+            logged = self._replay_segment(segment, replay)
+            replayed += logged
+            self._records_since_snapshot += logged
+
+        # A torn tail is never appended to, new records start a new segment
+        self._segment = max(segments, default=first_segment - 1) + 1
+        self._dump = dump
+        self._is_closing.clear()
+        self._flush_task = asyncio.create_task(
+            self._run_flush(), name=f"{self.name}-log-flush"
+        )
+        self._snapshot_task = asyncio.create_task(
+            self._run_snapshots(), name=f"{self.name}-log-snapshot"
+        )
+        logger.info(
+            "Replayed %d %s records in %.2fs",
+            replayed,
+            self.name,
+            time.perf_counter() - started,
+        )
+        return replayed
+
+    def _replay_segment(self, segment: int, replay: ReplayRecord) -> int:
+        replayed = 0
+        with open(self._segment_path(segment), "rb") as log:
+            unpacker = msgpack.Unpacker(log, use_list=False)
+            try:
+                for record in unpacker:
+                    replay(record)
+                    replayed += 1
+            except (msgpack.OutOfData, ValueError):
+                # Only the last batch of a crashed process can be torn
+                logger.warning(
+                    "Ignoring the torn tail of %s", self._segment_path(segment)
+                )
+
+        return replayed
+
+    def append(self, record: Record) -> Awaitable[None]:
+        written = asyncio.get_running_loop().create_future()
+        self._pending.append((self._packer.pack(record), written))
+        self._records_since_snapshot += 1
+        self._has_pending.set()
+        return written
+
+    async def _run_flush(self) -> None:
+        while not (self._is_closing.is_set() and not self._pending):
+            await self._has_pending.wait()
+            # Let the records of concurrent writes join the batch
+            await asyncio.sleep(self.fsync_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        self._has_pending.clear()
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            async with self._flush_lock:
+                await asyncio.to_thread(
+                    _write_durably,
+                    self._segment_path(self._segment),
+                    b"".join(data for data, _ in batch),
+                )
+        except Exception as error:
+            logger.exception("Could not write %d %s records", len(batch), self.name)
+            for _, written in batch:
+                if not written.done():
+                    written.set_exception(error)
+            return
+
+        for _, written in batch:
+            if not written.done():
+                written.set_result(None)
+
+    async def _run_snapshots(self) -> None:
+        while not self._is_closing.is_set():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._is_closing.wait(), timeout=self.snapshot_interval
+                )
+            if self._records_since_snapshot:
+                try:
+                    await self.snapshot()
+                except Exception:
+                    logger.exception("Could not snapshot %s", self.name)
+
+    async def snapshot(self) -> None:
+        async with self._snapshot_lock:
+            # The dump and the switch to a new segment happen in one step.
+            # Records queued before it may still land in the new segment,
+            # replaying them over the snapshot changes nothing.
+            records = self._dump()
+            self._segment += 1
+            self._records_since_snapshot = 0
+            first_segment = self._segment
+
+            await asyncio.to_thread(
+                _write_snapshot, self._snapshot_path, first_segment, records
+            )
+            async with self._flush_lock:
+                for segment in self._segments():
+                    if segment < first_segment:
+                        self._segment_path(segment).unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        self._is_closing.set()
+        self._has_pending.set()
+        if self._snapshot_task:
+            await self._snapshot_task
+            self._snapshot_task = None
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+
+
+def _write_durably(path: Path, data: bytes) -> None:
+    with open(path, "ab") as log:
+        log.write(data)
+        log.flush()
+        os.fsync(log.fileno())
+
+
+def _write_snapshot(path: Path, first_segment: int, records: Iterable[Record]) -> None:
+    packer = msgpack.Packer()
+    temporary_path = path.with_suffix(".tmp")
+    with open(temporary_path, "wb", buffering=1 << 20) as snapshot:
+        snapshot.write(packer.pack(first_segment))
+        for record in records:
+            snapshot.write(packer.pack(record))
+        snapshot.flush()
+        os.fsync(snapshot.fileno())
+
+    os.replace(temporary_path, path)
+    directory = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(directory)
+    finally:
+        os.close(directory)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.repositories.common.sql_repository import metadata
+
+# Imported for their tables, every table has to be in the metadata
+from infrastructure.repositories.groups import sql as groups_sql  # noqa: F401
+from infrastructure.repositories.outbox import sql as outbox_sql  # noqa: F401
+from infrastructure.repositories.users import sql as users_sql  # noqa: F401
+
+
+@dataclass
+class SQLAlchemySchemaManager:
+    engine: AsyncEngine
+
+    async def create_tables(self) -> None:
+        """Create the tables and their indexes.
+
+        Existing tables are left as they are, so running this on several
+        replicas at once or on every startup is a no-op once they exist.
+        """
+        async with self.engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
@@ -0,0 +1,114 @@
+from abc import ABC
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    ColumnElement,
+    Insert,
+    MetaData,
+    Row,
+    Select,
+    Table,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from infrastructure.repositories.common.filters.base import (
+    BaseGetAllFilters,
+    CountMode,
+)
+from infrastructure.transactions.sqlalchemy import current_connection
+
+
+# Tables of every SQL repository, created on startup by SQLAlchemySchemaManager
+metadata = MetaData()
+
+
+@dataclass(frozen=True)
+class BaseSQLAlchemyRepository(ABC):
+    """Base of the repositories stored in PostgreSQL or SQLite.
+
+    Statements are built the same way on every call, so SQLAlchemy compiles
+    each one once and the driver reuses its prepared statement.
+    """
+
+    engine: AsyncEngine
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[AsyncConnection]:
+        """A connection for reads, the one of the current transaction if any.
+
+        A pooled connection is returned without a commit, which saves a
+        round trip per read.
+        """
+        connection = current_connection.get()
+        if connection is not None:
+            yield connection
+            return
+
+        async with self.engine.connect() as connection:
+            yield connection
+
+    @asynccontextmanager
+    async def _begin(self) -> AsyncIterator[AsyncConnection]:
+        """A connection for writes, committed when the block ends unless it
+        belongs to the current transaction."""
+        connection = current_connection.get()
+        if connection is not None:
+            yield connection
+            return
+
+        async with self.engine.begin() as connection:
+            yield connection
+
+    def _insert(self, table: Table) -> Insert:
+        """An insert that can skip duplicates with ``on_conflict_do_nothing``."""
+        if self.engine.dialect.name == "postgresql":
+            return postgresql.insert(table)
+
+        return sqlite.insert(table)
+
+    def _select_page(
+        self, statement: Select, table: Table, filters: BaseGetAllFilters
+    ) -> Select:
+        """One page of rows in ``(created_at, oid)`` order.
+
+        Pages after a cursor start with a range condition on the sort key
+        instead of an offset, so deep pages cost the same as the first.
+        """
+        sort_key = (table.c.created_at, table.c.oid)
+        if filters.cursor:
+            cursor = filters.cursor
+            statement = statement.where(
+                tuple_(*sort_key) > tuple_(cursor.created_at, cursor.oid)
+            )
+        else:
+            statement = statement.offset(filters.offset)
+
+        return statement.order_by(*sort_key).limit(filters.limit)
+
+    async def _get_page(
+        self,
+        statement: Select,
+        table: Table,
+        conditions: Sequence[ColumnElement[bool]],
+        filters: BaseGetAllFilters,
+    ) -> tuple[list[Row], int | None]:
+        """Fetch a page and its total count in one transaction."""
+        async with self._connect() as connection:
+            result = await connection.execute(
+                self._select_page(statement.where(*conditions), table, filters)
+            )
+            rows = result.all()
+
+            count = None
+            if filters.count != CountMode.NONE:
+                count = await connection.scalar(
+                    select(func.count()).select_from(table).where(*conditions)
+                )
+
+        return rows, count
@@ -15,13 +15,25 @@ class BaseGroupRepository(ABC):
     @abstractmethod
     async def get_group_by_oid(self, group_oid: str) -> UserGroup | None: ...
 
+    @abstractmethod
+    async def get_groups_by_oids(
+        self, group_oids: Iterable[str]
+    ) -> dict[str, UserGroup]:
+        """The groups found among the given oids, keyed by oid."""
+
     @abstractmethod
     async def add_group(self, group: UserGroup) -> None: ...
 
     @abstractmethod
     async def get_groups(
         self, filters: GetGroupsFilters
-    ) -> tuple[Iterable[UserGroup], int]: ...
+    ) -> tuple[Iterable[UserGroup], int | None]: ...
 
     @abstractmethod
     async def delete_group(self, group_oid: str) -> UserGroup | None: ...
+
+    @abstractmethod
+    async def get_users_count(self, group_oid: str) -> int: ...
+
+    @abstractmethod
+    async def update_users_count(self, group_oid: str, delta: int) -> None: ...
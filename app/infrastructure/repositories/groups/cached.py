@@ -0,0 +1,95 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from domain.entities.groups import UserGroup
+from infrastructure.cache.tiered import TieredEntityCache
+from infrastructure.repositories.common.loader import BatchLoader
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.converters import (
+    convert_group_entity_to_document,
+    convert_group_json_to_entity,
+)
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.transactions.base import BaseTransactionManager
+from infrastructure.transactions.dummy import DummyTransactionManager
+
+
+@dataclass
+class GroupEntityCache(TieredEntityCache[UserGroup]):
+    key_prefix: ClassVar[str] = "entity:group"
+
+    def encode(self, entity: UserGroup) -> dict[str, Any]:
+        document = convert_group_entity_to_document(group=entity)
+        return {**document, "created_at": entity.created_at.isoformat()}
+
+    def decode(self, data: dict[str, Any]) -> UserGroup:
+        return convert_group_json_to_entity(group_json=data)
+
+
+@dataclass(frozen=True)
+class CachedGroupRepository(BaseGroupRepository):
+    """Serves lookups by oid through the entity cache.
+
+    Cache misses of concurrent ``get_group_by_oid`` calls are loaded together
+    with one ``get_groups_by_oids``. Writes go straight to the wrapped
+    repository, stale entries are evicted by the domain event handlers.
+    Inside a transaction lookups bypass the cache and the batches, so they
+    see the transaction's own writes and never cache uncommitted ones.
+    """
+
+    repository: BaseGroupRepository
+    cache: GroupEntityCache
+    max_batch_size: int = 1000
+    transaction_manager: BaseTransactionManager = field(
+        default_factory=DummyTransactionManager
+    )
+    loader: BatchLoader[str, UserGroup] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "loader",
+            BatchLoader(
+                load_many=self.repository.get_groups_by_oids,
+                max_batch_size=self.max_batch_size,
+            ),
+        )
+
+    async def check_group_exists_by_title(self, title: str) -> bool:
+        return await self.repository.check_group_exists_by_title(title=title)
+
+    async def get_group_by_oid(self, group_oid: str) -> UserGroup | None:
+        if self.transaction_manager.in_transaction:
+            return await self.repository.get_group_by_oid(group_oid=group_oid)
+
+        return await self.cache.get_or_load(
+            group_oid, lambda: self.loader.load(group_oid)
+        )
+
+    async def get_groups_by_oids(
+        self, group_oids: Iterable[str]
+    ) -> dict[str, UserGroup]:
+        if self.transaction_manager.in_transaction:
+            return await self.repository.get_groups_by_oids(group_oids=group_oids)
+
+        return await self.cache.get_many_or_load(
+            group_oids, self.repository.get_groups_by_oids
+        )
+
+    async def add_group(self, group: UserGroup) -> None:
+        await self.repository.add_group(group=group)
+
+    async def get_groups(
+        self, filters: GetGroupsFilters
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        return await self.repository.get_groups(filters=filters)
+
+    async def delete_group(self, group_oid: str) -> UserGroup | None:
+        return await self.repository.delete_group(group_oid=group_oid)
+
+    async def get_users_count(self, group_oid: str) -> int:
+        return await self.repository.get_users_count(group_oid=group_oid)
+
+    async def update_users_count(self, group_oid: str, delta: int) -> None:
+        await self.repository.update_users_count(group_oid=group_oid, delta=delta)
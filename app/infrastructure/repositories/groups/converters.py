@@ -1,4 +1,5 @@
-from typing import Any, Mapping
+from datetime import datetime
+from typing import Any, Mapping, Sequence
 from domain.entities.groups import UserGroup
 from domain.values.groups import Title
 
@@ -11,9 +12,41 @@ def convert_group_entity_to_document(group: UserGroup) -> dict:
     }
 
 
+# The users counter is read on its own, never as part of the entity
+GROUP_ENTITY_PROJECTION = {"_id": False, "users_count": False}
+
+
 def convert_group_document_to_entity(group_document: Mapping[str, Any]) -> UserGroup:
+    """Hydrate a stored group, its title was validated before it was written."""
     return UserGroup(
-        title=Title(value=group_document["title"]),
+        title=Title.from_trusted(group_document["title"]),
         oid=group_document["oid"],
         created_at=group_document["created_at"],
     )
+
+
+def convert_group_json_to_entity(group_json: Mapping[str, Any]) -> UserGroup:
+    """Restore a group from a JSON dump of its document, e.g. from a cache."""
+    return convert_group_document_to_entity(
+        {**group_json, "created_at": datetime.fromisoformat(group_json["created_at"])}
+    )
+
+
+def convert_group_entity_to_record(group: UserGroup) -> tuple:
+    """A group as a flat tuple of plain values, for compact binary storage."""
+    return (
+        group.oid,
+        group.title.as_generic_type(),
+        group.created_at.isoformat(),
+        group.is_deleted,
+    )
+
+
+def convert_group_record_to_entity(record: Sequence[Any]) -> UserGroup:
+    oid, title, created_at, is_deleted = record
+    return UserGroup(
+        title=Title.from_trusted(title),
+        oid=oid,
+        created_at=datetime.fromisoformat(created_at),
+        is_deleted=is_deleted,
+    )
@@ -1,45 +1,182 @@
+import asyncio
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Iterable
 
 from domain.entities.groups import UserGroup
+from infrastructure.repositories.common.filters.base import CountMode
+from infrastructure.repositories.common.memory_repository import (
+    PageIndex,
+    ShardedIndex,
+)
+from infrastructure.repositories.common.operation_log import (
+    BaseOperationLog,
+    DummyOperationLog,
+    Record,
+    undo_unless_durable,
+)
 from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.converters import (
+    convert_group_entity_to_record,
+    convert_group_record_to_entity,
+)
 from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
 
 
+# Operation log records, a tag followed by the values of the operation. The
+# users count is logged as its new value, so replaying it twice is harmless.
+GROUP_ADDED, GROUP_DELETED, GROUP_USERS_COUNTED = (
+    "group_added",
+    "group_deleted",
+    "group_users_counted",
+)
+
+
 @dataclass
 class InMemoryGroupRepository(BaseGroupRepository):
-    _saved_groups: list[UserGroup] = field(default_factory=list, kw_only=True)
+    """Groups kept in process, indexed by oid and title and in page order.
+
+    Every write is recorded in ``operation_log`` and only returns once the
+    record is durable, a write whose record fails is undone. ``open``
+    restores what the log persisted.
+    """
+
+    shards: int = field(default=16, kw_only=True)
+    operation_log: BaseOperationLog = field(
+        default_factory=DummyOperationLog, kw_only=True
+    )
+    _groups: ShardedIndex[str, UserGroup] = field(init=False)
+    _oids_by_title: ShardedIndex[str, str] = field(init=False)
+    _page_index: PageIndex = field(default_factory=PageIndex, init=False)
+    _users_count: dict[str, int] = field(default_factory=dict, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        self._groups = ShardedIndex(self.shards)
+        self._oids_by_title = ShardedIndex(self.shards)
+
+    async def open(self) -> int:
+        return await self.operation_log.open(replay=self._replay, dump=self._dump)
+
+    async def close(self) -> None:
+        await self.operation_log.close()
 
     async def check_group_exists_by_title(self, title: str) -> bool:
-        return any(
-            group.title.as_generic_type() == title for group in self._saved_groups
-        )
+        return title in self._oids_by_title
 
     async def get_group_by_oid(self, group_oid: str) -> UserGroup | None:
-        for group in self._saved_groups:
-            if group.oid == group_oid:
-                return group
-        return None
+        return self._groups.get(group_oid)
+
+    async def get_groups_by_oids(
+        self, group_oids: Iterable[str]
+    ) -> dict[str, UserGroup]:
+        groups = {}
+        for group_oid in group_oids:
+            group = self._groups.get(group_oid)
+            if group is not None:
+                groups[group_oid] = group
+
+        return groups
 
     async def add_group(self, group: UserGroup) -> None:
-        self._saved_groups.append(group)
+        async with self._lock:
+            self._index_group(group)
+            written = self.operation_log.append(_added(group))
+
+        def undo() -> None:
+            if self._groups.get(group.oid) is group:
+                self._unindex_group(group.oid)
+
+        await undo_unless_durable(written, self._lock, undo)
 
     async def get_groups(
         self, filters: GetGroupsFilters
-    ) -> tuple[Iterable[UserGroup], int]:
-        raise Exception(self._saved_groups)
-        filtered_groups = [
-            group for group in self._saved_groups if not group.is_deleted
-        ]
-        total_count = len(filtered_groups)
-        limited_groups = filtered_groups[
-            filters.offset : filters.offset + filters.limit
-        ]
-        return limited_groups, total_count
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        groups = [self._groups.get(oid) for oid in self._page_index.page(filters)]
+        total_count = len(self._page_index) if filters.count != CountMode.NONE else None
+        return groups, total_count
 
     async def delete_group(self, group_oid: str) -> UserGroup | None:
-        for group in self._saved_groups:
-            if group.oid == group_oid:
-                self._saved_groups.remove(group)
-                return group
-        return None
+        async with self._lock:
+            users_count = self._users_count.get(group_oid)
+            group = self._unindex_group(group_oid)
+            if group is None:
+                return None
+
+            written = self.operation_log.append((GROUP_DELETED, group_oid))
+
+        def undo() -> None:
+            # Unless a group taking its place was added meanwhile
+            if (
+                group_oid in self._groups
+                or group.title.as_generic_type() in self._oids_by_title
+            ):
+                return
+
+            self._index_group(group)
+            if users_count is not None:
+                self._users_count[group_oid] = users_count
+
+        await undo_unless_durable(written, self._lock, undo)
+        return group
+
+    async def get_users_count(self, group_oid: str) -> int:
+        return self._users_count.get(group_oid, 0)
+
+    async def update_users_count(self, group_oid: str, delta: int) -> None:
+        async with self._lock:
+            users_count = self._users_count.get(group_oid, 0) + delta
+            self._users_count[group_oid] = users_count
+            written = self.operation_log.append(
+                (GROUP_USERS_COUNTED, group_oid, users_count)
+            )
+
+        def undo() -> None:
+            self._users_count[group_oid] = self._users_count.get(group_oid, 0) - delta
+
+        await undo_unless_durable(written, self._lock, undo)
+
+    def _index_group(self, group: UserGroup) -> None:
+        self._groups.set(group.oid, group)
+        self._oids_by_title.set(group.title.as_generic_type(), group.oid)
+        self._page_index.add(group)
+
+    def _unindex_group(self, group_oid: str) -> UserGroup | None:
+        group = self._groups.pop(group_oid)
+        if group is not None:
+            self._oids_by_title.pop(group.title.as_generic_type())
+            self._page_index.remove(group)
+            self._users_count.pop(group_oid, None)
+
+        return group
+
+    def _replay(self, record: Record) -> None:
+        operation, *values = record
+        if operation == GROUP_ADDED:
+            group = convert_group_record_to_entity(values)
+            # An add replayed over a snapshot that already holds the group
+            users_count = self._users_count.get(group.oid)
+            self._unindex_group(group.oid)
+            self._index_group(group)
+            if users_count is not None:
+                self._users_count[group.oid] = users_count
+        elif operation == GROUP_DELETED:
+            self._unindex_group(values[0])
+        elif operation == GROUP_USERS_COUNTED:
+            group_oid, users_count = values
+            self._users_count[group_oid] = users_count
+
+    def _dump(self) -> Iterable[Record]:
+        # Only the references are taken now, records are built as consumed.
+        # In page order, so replaying rebuilds the page index by appending.
+        return chain(
+            map(_added, [self._groups.get(oid) for oid in self._page_index]),
+            (
+                (GROUP_USERS_COUNTED, group_oid, users_count)
+                for group_oid, users_count in list(self._users_count.items())
+            ),
+        )
+
+
+def _added(group: UserGroup) -> Record:
+    return (GROUP_ADDED, *convert_group_entity_to_record(group))
@@ -1,6 +1,9 @@
 from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import ClassVar
 
+from motor.core import AgnosticCursor
+from pymongo import ASCENDING, IndexModel, UpdateOne
 
 from domain.entities.groups import UserGroup
 from infrastructure.repositories.common.base_repository import BaseMongoDBRepository
@@ -8,44 +11,136 @@ from infrastructure.repositories.groups.base import (
     BaseGroupRepository,
 )
 from infrastructure.repositories.groups.converters import (
+    GROUP_ENTITY_PROJECTION,
     convert_group_document_to_entity,
     convert_group_entity_to_document,
 )
 from infrastructure.repositories.groups.filters.groups import (
     GetGroupsFilters,
 )
+from infrastructure.repositories.users.mongo import MongoDBUserRepository
 
 
 @dataclass(frozen=True)
 class MongoDBGroupRepository(BaseGroupRepository, BaseMongoDBRepository):
+    indexes: ClassVar[tuple[IndexModel, ...]] = (
+        IndexModel("oid", name="oid_unique", unique=True),
+        IndexModel("title", name="title_unique", unique=True),
+        IndexModel(
+            [("created_at", ASCENDING), ("oid", ASCENDING)], name="created_at_oid"
+        ),
+    )
+
+    def checked_queries(self) -> Iterable[AgnosticCursor]:
+        return (
+            self._collection.find({"oid": ""}),
+            self._collection.find({"title": ""}),
+            self._find_page(conditions={}, filters=GetGroupsFilters()),
+        )
+
     async def get_group_by_oid(self, group_oid: str) -> UserGroup | None:
-        group_document = await self._collection.find_one(filter={"oid": group_oid})
+        group_document = await self._collection.find_one(
+            filter={"oid": group_oid},
+            projection=GROUP_ENTITY_PROJECTION,
+            session=self._session,
+        )
 
         if not group_document:
             return None
 
         return convert_group_document_to_entity(group_document)
 
+    async def get_groups_by_oids(
+        self, group_oids: Iterable[str]
+    ) -> dict[str, UserGroup]:
+        group_oids = list(set(group_oids))
+        if not group_oids:
+            return {}
+
+        group_documents = self._collection.find(
+            filter={"oid": {"$in": group_oids}},
+            projection=GROUP_ENTITY_PROJECTION,
+            session=self._session,
+        )
+        return {
+            group_document["oid"]: convert_group_document_to_entity(group_document)
+            async for group_document in group_documents
+        }
+
     async def check_group_exists_by_title(self, title: str) -> bool:
-        return bool(await self._collection.find_one(filter={"title": title}))
+        return bool(
+            await self._collection.find_one(
+                filter={"title": title}, projection={"_id": True}, session=self._session
+            )
+        )
 
     async def add_group(self, group: UserGroup) -> None:
-        await self._collection.insert_one(convert_group_entity_to_document(group))
+        await self._collection.insert_one(
+            convert_group_entity_to_document(group), session=self._session
+        )
 
     async def get_groups(
         self, filters: GetGroupsFilters
-    ) -> tuple[Iterable[UserGroup], int]:
-        cursor = self._collection.find().skip(filters.offset).limit(filters.limit)
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        group_documents, count = await self._get_page(
+            conditions={}, filters=filters, projection=GROUP_ENTITY_PROJECTION
+        )
 
         groups = [
             convert_group_document_to_entity(group_document=group_document)
-            async for group_document in cursor
+            for group_document in group_documents
         ]
-        count = await self._collection.count_documents({})
 
         return groups, count
 
+    async def get_users_count(self, group_oid: str) -> int:
+        group_document = await self._collection.find_one(
+            filter={"oid": group_oid},
+            projection={"_id": False, "users_count": True},
+            session=self._session,
+        )
+        return group_document.get("users_count", 0) if group_document else 0
+
+    async def recount_users(self, user_repository: MongoDBUserRepository) -> int:
+        """Set the users counter of every group to a count of its users.
+
+        Backfills groups created before the counter was maintained, and ones
+        whose counter only holds the changes since. A user created or
+        deleted while a group is recounted may be missed, run it before the
+        cached count mode is relied on. Returns the number of groups.
+        """
+        counts = {
+            document["_id"]: document["users_count"]
+            async for document in user_repository._collection.aggregate(
+                [{"$group": {"_id": "$group_oid", "users_count": {"$sum": 1}}}]
+            )
+        }
+        requests = [
+            UpdateOne(
+                {"oid": document["oid"]},
+                {"$set": {"users_count": counts.get(document["oid"], 0)}},
+            )
+            async for document in self._collection.find(
+                {}, projection={"_id": False, "oid": True}
+            )
+        ]
+        if requests:
+            await self._collection.bulk_write(requests, ordered=False)
+
+        return len(requests)
+
+    async def update_users_count(self, group_oid: str, delta: int) -> None:
+        await self._collection.update_one(
+            filter={"oid": group_oid},
+            update={"$inc": {"users_count": delta}},
+            session=self._session,
+        )
+
     async def delete_group(self, group_oid: str) -> UserGroup | None:
-        group = await self._collection.find_one_and_delete(filter={"oid": group_oid})
+        group = await self._collection.find_one_and_delete(
+            filter={"oid": group_oid},
+            projection=GROUP_ENTITY_PROJECTION,
+            session=self._session,
+        )
         if group:
             return convert_group_document_to_entity(group_document=group)
@@ -0,0 +1,126 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    delete,
+    select,
+    update,
+)
+
+from domain.entities.groups import UserGroup
+from infrastructure.repositories.common.sql_repository import (
+    BaseSQLAlchemyRepository,
+    metadata,
+)
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.converters import (
+    convert_group_document_to_entity,
+    convert_group_entity_to_document,
+)
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+
+
+groups_table = Table(
+    "groups",
+    metadata,
+    Column("oid", String, primary_key=True),
+    Column("title", String, nullable=False, unique=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("users_count", Integer, nullable=False, server_default="0"),
+    Index("groups_created_at_oid", "created_at", "oid"),
+)
+
+# The users counter is read on its own, never as part of the entity
+GROUP_ENTITY_COLUMNS = (
+    groups_table.c.oid,
+    groups_table.c.title,
+    groups_table.c.created_at,
+)
+
+
+@dataclass(frozen=True)
+class SQLAlchemyGroupRepository(BaseGroupRepository, BaseSQLAlchemyRepository):
+    async def get_group_by_oid(self, group_oid: str) -> UserGroup | None:
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(*GROUP_ENTITY_COLUMNS).where(groups_table.c.oid == group_oid)
+            )
+            row = result.first()
+
+        return convert_group_document_to_entity(row._mapping) if row else None
+
+    async def get_groups_by_oids(
+        self, group_oids: Iterable[str]
+    ) -> dict[str, UserGroup]:
+        group_oids = list(set(group_oids))
+        if not group_oids:
+            return {}
+
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(*GROUP_ENTITY_COLUMNS).where(groups_table.c.oid.in_(group_oids))
+            )
+            rows = result.all()
+
+        return {row.oid: convert_group_document_to_entity(row._mapping) for row in rows}
+
+    async def check_group_exists_by_title(self, title: str) -> bool:
+        async with self._connect() as connection:
+            group_oid = await connection.scalar(
+                select(groups_table.c.oid).where(groups_table.c.title == title)
+            )
+
+        return group_oid is not None
+
+    async def add_group(self, group: UserGroup) -> None:
+        async with self._begin() as connection:
+            await connection.execute(
+                groups_table.insert(), convert_group_entity_to_document(group)
+            )
+
+    async def get_groups(
+        self, filters: GetGroupsFilters
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        rows, count = await self._get_page(
+            statement=select(*GROUP_ENTITY_COLUMNS),
+            table=groups_table,
+            conditions=(),
+            filters=filters,
+        )
+
+        return [convert_group_document_to_entity(row._mapping) for row in rows], count
+
+    async def get_users_count(self, group_oid: str) -> int:
+        async with self._connect() as connection:
+            users_count = await connection.scalar(
+                select(groups_table.c.users_count).where(
+                    groups_table.c.oid == group_oid
+                )
+            )
+
+        return users_count or 0
+
+    async def update_users_count(self, group_oid: str, delta: int) -> None:
+        async with self._begin() as connection:
+            await connection.execute(
+                update(groups_table)
+                .where(groups_table.c.oid == group_oid)
+                .values(users_count=groups_table.c.users_count + delta)
+            )
+
+    async def delete_group(self, group_oid: str) -> UserGroup | None:
+        async with self._begin() as connection:
+            result = await connection.execute(
+                delete(groups_table)
+                .where(groups_table.c.oid == group_oid)
+                .returning(*GROUP_ENTITY_COLUMNS)
+            )
+            row = result.first()
+
+        return convert_group_document_to_entity(row._mapping) if row else None
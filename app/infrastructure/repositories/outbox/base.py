@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import uuid4
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    topic: str
+    key: bytes
+    value: bytes
+    oid: str = field(default_factory=lambda: str(uuid4()), kw_only=True)
+    created_at: datetime = field(default_factory=datetime.now, kw_only=True)
+
+
+class BaseOutboxRepository(ABC):
+    @abstractmethod
+    async def add_message(self, message: OutboxMessage) -> None: ...
+
+    @abstractmethod
+    async def add_messages(self, messages: Sequence[OutboxMessage]) -> None: ...
+
+    @abstractmethod
+    async def get_pending_messages(self, limit: int) -> list[OutboxMessage]:
+        """Oldest messages not relayed yet, in the order they were written."""
+
+    @abstractmethod
+    async def mark_sent(self, oids: Iterable[str]) -> None: ...
+
+    @abstractmethod
+    async def get_oldest_pending_created_at(self) -> datetime | None: ...
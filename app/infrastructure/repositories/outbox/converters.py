@@ -0,0 +1,33 @@
+from typing import Any, Mapping
+
+from infrastructure.repositories.outbox.base import OutboxMessage
+
+
+OUTBOX_PENDING_STATUS = "pending"
+OUTBOX_SENT_STATUS = "sent"
+
+# Relayed messages are kept for a day to make broker outages debuggable.
+OUTBOX_SENT_RETENTION_SECONDS = 24 * 3600
+
+
+def convert_outbox_message_to_document(message: OutboxMessage) -> dict:
+    return {
+        "oid": message.oid,
+        "topic": message.topic,
+        "key": message.key,
+        "value": message.value,
+        "created_at": message.created_at,
+        "status": OUTBOX_PENDING_STATUS,
+    }
+
+
+def convert_outbox_document_to_message(
+    outbox_document: Mapping[str, Any],
+) -> OutboxMessage:
+    return OutboxMessage(
+        topic=outbox_document["topic"],
+        key=outbox_document["key"],
+        value=outbox_document["value"],
+        oid=outbox_document["oid"],
+        created_at=outbox_document["created_at"],
+    )
@@ -0,0 +1,33 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from infrastructure.repositories.outbox.base import BaseOutboxRepository, OutboxMessage
+
+
+@dataclass
+class InMemoryOutboxRepository(BaseOutboxRepository):
+    _pending_messages: dict[str, OutboxMessage] = field(
+        default_factory=dict, kw_only=True
+    )
+    _sent_messages: list[OutboxMessage] = field(default_factory=list, kw_only=True)
+
+    async def add_message(self, message: OutboxMessage) -> None:
+        self._pending_messages[message.oid] = message
+
+    async def add_messages(self, messages: Sequence[OutboxMessage]) -> None:
+        for message in messages:
+            await self.add_message(message)
+
+    async def get_pending_messages(self, limit: int) -> list[OutboxMessage]:
+        return list(self._pending_messages.values())[:limit]
+
+    async def mark_sent(self, oids: Iterable[str]) -> None:
+        for oid in oids:
+            message = self._pending_messages.pop(oid, None)
+            if message:
+                self._sent_messages.append(message)
+
+    async def get_oldest_pending_created_at(self) -> datetime | None:
+        message = next(iter(self._pending_messages.values()), None)
+        return message.created_at if message else None
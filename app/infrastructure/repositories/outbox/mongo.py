@@ -0,0 +1,81 @@
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, ClassVar
+
+from motor.core import AgnosticCursor
+
+from pymongo import ASCENDING, IndexModel
+
+from infrastructure.repositories.common.base_repository import (
+    PAGE_SORT,
+    BaseMongoDBRepository,
+)
+from infrastructure.repositories.outbox.base import BaseOutboxRepository, OutboxMessage
+from infrastructure.repositories.outbox.converters import (
+    OUTBOX_PENDING_STATUS,
+    OUTBOX_SENT_RETENTION_SECONDS,
+    OUTBOX_SENT_STATUS,
+    convert_outbox_document_to_message,
+    convert_outbox_message_to_document,
+)
+
+
+@dataclass(frozen=True)
+class MongoDBOutboxRepository(BaseOutboxRepository, BaseMongoDBRepository):
+    indexes: ClassVar[tuple[IndexModel, ...]] = (
+        IndexModel("oid", name="oid_unique", unique=True),
+        IndexModel(
+            [("status", ASCENDING), ("created_at", ASCENDING), ("oid", ASCENDING)],
+            name="status_created_at_oid",
+        ),
+        IndexModel(
+            "sent_at",
+            name="sent_at_ttl",
+            expireAfterSeconds=OUTBOX_SENT_RETENTION_SECONDS,
+        ),
+    )
+
+    async def add_message(self, message: OutboxMessage) -> None:
+        await self._collection.insert_one(
+            convert_outbox_message_to_document(message), session=self._session
+        )
+
+    async def add_messages(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+
+        await self._collection.insert_many(
+            [convert_outbox_message_to_document(message) for message in messages],
+            session=self._session,
+        )
+
+    def checked_queries(self) -> Iterable[AgnosticCursor]:
+        return (self._collection.find({"oid": ""}), self._find_pending())
+
+    def _find_pending(
+        self, projection: Mapping[str, Any] | None = None
+    ) -> AgnosticCursor:
+        return self._collection.find(
+            {"status": OUTBOX_PENDING_STATUS}, projection=projection
+        ).sort(PAGE_SORT)
+
+    async def get_pending_messages(self, limit: int) -> list[OutboxMessage]:
+        return [
+            convert_outbox_document_to_message(outbox_document=document)
+            async for document in self._find_pending().limit(limit)
+        ]
+
+    async def mark_sent(self, oids: Iterable[str]) -> None:
+        await self._collection.update_many(
+            filter={"oid": {"$in": list(oids)}},
+            update={"$set": {"status": OUTBOX_SENT_STATUS, "sent_at": datetime.now()}},
+        )
+
+    async def get_oldest_pending_created_at(self) -> datetime | None:
+        async for document in self._find_pending(projection={"created_at": True}).limit(
+            1
+        ):
+            return document["created_at"]
+
+        return None
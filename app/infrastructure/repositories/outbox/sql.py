@@ -0,0 +1,99 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    LargeBinary,
+    String,
+    Table,
+    delete,
+    select,
+    update,
+)
+
+from infrastructure.repositories.common.sql_repository import (
+    BaseSQLAlchemyRepository,
+    metadata,
+)
+from infrastructure.repositories.outbox.base import BaseOutboxRepository, OutboxMessage
+from infrastructure.repositories.outbox.converters import (
+    OUTBOX_PENDING_STATUS,
+    OUTBOX_SENT_RETENTION_SECONDS,
+    OUTBOX_SENT_STATUS,
+    convert_outbox_document_to_message,
+    convert_outbox_message_to_document,
+)
+
+
+outbox_table = Table(
+    "outbox",
+    metadata,
+    Column("oid", String, primary_key=True),
+    Column("topic", String, nullable=False),
+    Column("key", LargeBinary, nullable=False),
+    Column("value", LargeBinary, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("status", String, nullable=False),
+    Column("sent_at", DateTime),
+    Index("outbox_status_created_at_oid", "status", "created_at", "oid"),
+)
+
+
+@dataclass(frozen=True)
+class SQLAlchemyOutboxRepository(BaseOutboxRepository, BaseSQLAlchemyRepository):
+    """Kept in the same database as the entities, so a command's messages
+    commit in its transaction."""
+
+    async def add_message(self, message: OutboxMessage) -> None:
+        await self.add_messages([message])
+
+    async def add_messages(self, messages: Sequence[OutboxMessage]) -> None:
+        if not messages:
+            return
+
+        async with self._begin() as connection:
+            await connection.execute(
+                outbox_table.insert(),
+                [convert_outbox_message_to_document(message) for message in messages],
+            )
+
+    async def get_pending_messages(self, limit: int) -> list[OutboxMessage]:
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(outbox_table)
+                .where(outbox_table.c.status == OUTBOX_PENDING_STATUS)
+                .order_by(outbox_table.c.created_at, outbox_table.c.oid)
+                .limit(limit)
+            )
+            rows = result.all()
+
+        return [convert_outbox_document_to_message(row._mapping) for row in rows]
+
+    async def mark_sent(self, oids: Iterable[str]) -> None:
+        sent_at = datetime.now()
+        async with self._begin() as connection:
+            await connection.execute(
+                update(outbox_table)
+                .where(outbox_table.c.oid.in_(list(oids)))
+                .values(status=OUTBOX_SENT_STATUS, sent_at=sent_at)
+            )
+            # What the TTL index on sent_at does in MongoDB
+            await connection.execute(
+                delete(outbox_table).where(
+                    outbox_table.c.status == OUTBOX_SENT_STATUS,
+                    outbox_table.c.sent_at
+                    < sent_at - timedelta(seconds=OUTBOX_SENT_RETENTION_SECONDS),
+                )
+            )
+
+    async def get_oldest_pending_created_at(self) -> datetime | None:
+        async with self._connect() as connection:
+            return await connection.scalar(
+                select(outbox_table.c.created_at)
+                .where(outbox_table.c.status == OUTBOX_PENDING_STATUS)
+                .order_by(outbox_table.c.created_at, outbox_table.c.oid)
+                .limit(1)
+            )
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+
+
+class BaseReadModel(ABC):
+    """Denormalized users and groups the queries read from.
+
+    Projections are applied from domain events, which may arrive more than
+    once and out of order: adding an entity again is a no-op, and an entity
+    deleted before its creation was projected is never added.
+    """
+
+    @abstractmethod
+    async def get_user(self, user_oid: str) -> User | None:
+        """A user without its password."""
+
+    @abstractmethod
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]: ...
+
+    @abstractmethod
+    async def get_groups(
+        self, filters: GetGroupsFilters
+    ) -> tuple[Iterable[UserGroup], int | None]: ...
+
+    @abstractmethod
+    async def add_users(self, users: Sequence[User]) -> None: ...
+
+    @abstractmethod
+    async def verify_user(self, user_oid: str) -> None: ...
+
+    @abstractmethod
+    async def delete_user(self, user_oid: str, group_oid: str) -> None: ...
+
+    @abstractmethod
+    async def add_groups(self, groups: Sequence[UserGroup]) -> None: ...
+
+    @abstractmethod
+    async def delete_group(self, group_oid: str) -> None: ...
+
+    async def close(self) -> None: ...
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+from datetime import datetime
+import sys
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User
+from domain.events.groups import GroupCreatedEvent
+from domain.events.users import UserCreatedEvent
+from domain.values.groups import Title
+from domain.values.users import Email, Username
+
+
+# Fields of the Redis hashes, in the order they are read back
+USER_HASH_FIELDS = ("email", "username", "group_oid", "created_at", "is_verified")
+GROUP_HASH_FIELDS = ("title", "created_at")
+
+
+def convert_user_created_event_to_entity(event: UserCreatedEvent) -> User:
+    """The user as it was created, the event occurred at its creation time."""
+    return User(
+        oid=event.user_oid,
+        email=Email.from_trusted(event.email),
+        username=Username.from_trusted(event.username),
+        password=None,
+        group_id=event.group_oid,
+        created_at=event.occured_at,
+    )
+
+
+def convert_group_created_event_to_entity(event: GroupCreatedEvent) -> UserGroup:
+    return UserGroup(
+        oid=event.group_oid,
+        title=Title.from_trusted(event.group_title),
+        created_at=event.occured_at,
+    )
+
+
+def convert_created_at_to_sort_key(created_at: datetime) -> str:
+    """A fixed width timestamp, so strings sort in the order of the times."""
+    return created_at.isoformat(timespec="microseconds")
+
+
+def build_page_member(created_at: datetime, oid: str) -> str:
+    """Sorted set member of an entity, members of equal score sort by bytes,
+    which pages them in ``(created_at, oid)`` order."""
+    return f"{convert_created_at_to_sort_key(created_at)}|{oid}"
+
+
+def convert_page_member_to_oid(member: bytes) -> str:
+    return member.rpartition(b"|")[2].decode()
+
+
+def convert_user_hash_to_entity(
+    user_oid: str, values: Sequence[bytes | None]
+) -> User | None:
+    """None for a user whose creation was not projected yet."""
+    email, username, group_oid, created_at, is_verified = values
+    if username is None:
+        return None
+
+    return User(
+        oid=user_oid,
+        email=Email.from_trusted(email.decode()),
+        username=Username.from_trusted(username.decode()),
+        password=None,
+        created_at=datetime.fromisoformat(created_at.decode()),
+        group_id=sys.intern(group_oid.decode()),
+        is_verified=is_verified == b"1",
+    )
+
+
+def convert_group_hash_to_entity(
+    group_oid: str, values: Sequence[bytes | None]
+) -> UserGroup | None:
+    title, created_at = values
+    if title is None:
+        return None
+
+    return UserGroup(
+        oid=group_oid,
+        title=Title.from_trusted(title.decode()),
+        created_at=datetime.fromisoformat(created_at.decode()),
+    )
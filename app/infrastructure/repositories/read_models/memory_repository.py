@@ -0,0 +1,96 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User
+from infrastructure.repositories.common.filters.base import (
+    BaseGetAllFilters,
+    CountMode,
+)
+from infrastructure.repositories.common.memory_repository import PageIndex
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+
+
+@dataclass
+class InMemoryReadModel(BaseReadModel):
+    """Projections kept in process, deleted oids are remembered for good."""
+
+    _users: dict[str, User] = field(default_factory=dict, init=False)
+    _group_pages: dict[str, PageIndex] = field(default_factory=dict, init=False)
+    _groups: dict[str, UserGroup] = field(default_factory=dict, init=False)
+    _groups_page: PageIndex = field(default_factory=PageIndex, init=False)
+    # Users verified before their creation was projected
+    _verified_oids: set[str] = field(default_factory=set, init=False)
+    _deleted_oids: set[str] = field(default_factory=set, init=False)
+
+    async def get_user(self, user_oid: str) -> User | None:
+        return self._users.get(user_oid)
+
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]:
+        page_index = self._group_pages.get(group_oid, PageIndex())
+        return [self._users[oid] for oid in page_index.page(filters)], _count(
+            page_index, filters
+        )
+
+    async def get_groups(
+        self, filters: GetGroupsFilters
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        return [self._groups[oid] for oid in self._groups_page.page(filters)], _count(
+            self._groups_page, filters
+        )
+
+    async def add_users(self, users: Sequence[User]) -> None:
+        for user in users:
+            if user.oid in self._deleted_oids or user.oid in self._users:
+                continue
+
+            self._users[user.oid] = User(
+                oid=user.oid,
+                email=user.email,
+                username=user.username,
+                password=None,
+                group_id=user.group_id,
+                created_at=user.created_at,
+                is_verified=user.is_verified or user.oid in self._verified_oids,
+            )
+            self._verified_oids.discard(user.oid)
+            self._group_pages.setdefault(user.group_id, PageIndex()).add(user)
+
+    async def verify_user(self, user_oid: str) -> None:
+        if user_oid in self._deleted_oids:
+            return
+
+        user = self._users.get(user_oid)
+        if user is None:
+            self._verified_oids.add(user_oid)
+        else:
+            user.is_verified = True
+
+    async def delete_user(self, user_oid: str, group_oid: str) -> None:
+        self._deleted_oids.add(user_oid)
+        self._verified_oids.discard(user_oid)
+        user = self._users.pop(user_oid, None)
+        if user is not None:
+            self._group_pages[group_oid].remove(user)
+
+    async def add_groups(self, groups: Sequence[UserGroup]) -> None:
+        for group in groups:
+            if group.oid in self._deleted_oids or group.oid in self._groups:
+                continue
+
+            self._groups[group.oid] = group
+            self._groups_page.add(group)
+
+    async def delete_group(self, group_oid: str) -> None:
+        self._deleted_oids.add(group_oid)
+        group = self._groups.pop(group_oid, None)
+        if group is not None:
+            self._groups_page.remove(group)
+
+
+def _count(page_index: PageIndex, filters: BaseGetAllFilters) -> int | None:
+    return None if filters.count == CountMode.NONE else len(page_index)
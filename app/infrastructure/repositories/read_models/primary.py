@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User
+from infrastructure.repositories.common.filters.base import CountMode
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.users.base import BaseUserRepository
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+
+
+@dataclass(frozen=True)
+class PrimaryReadModel(BaseReadModel):
+    """Queries read the repositories the commands write to.
+
+    Nothing has to be projected, the commands already wrote every change.
+    """
+
+    user_repository: BaseUserRepository
+    group_repository: BaseGroupRepository
+
+    async def get_user(self, user_oid: str) -> User | None:
+        return await self.user_repository.get_user_by_oid(user_oid=user_oid)
+
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]:
+        if filters.count != CountMode.CACHED:
+            return await self.user_repository.get_users(
+                group_oid=group_oid, filters=filters
+            )
+
+        # The cached count is the per-group counter kept up to date by the
+        # user created/deleted event handlers.
+        (users, _), count = await asyncio.gather(
+            self.user_repository.get_users(
+                group_oid=group_oid, filters=replace(filters, count=CountMode.NONE)
+            ),
+            self.group_repository.get_users_count(group_oid=group_oid),
+        )
+        return users, count
+
+    async def get_groups(
+        self, filters: GetGroupsFilters
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        return await self.group_repository.get_groups(filters=filters)
+
+    async def add_users(self, users: Sequence[User]) -> None: ...
+
+    async def verify_user(self, user_oid: str) -> None: ...
+
+    async def delete_user(self, user_oid: str, group_oid: str) -> None: ...
+
+    async def add_groups(self, groups: Sequence[UserGroup]) -> None: ...
+
+    async def delete_group(self, group_oid: str) -> None: ...
@@ -0,0 +1,257 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User
+from infrastructure.repositories.common.filters.base import (
+    BaseGetAllFilters,
+    CountMode,
+)
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.read_models.converters import (
+    GROUP_HASH_FIELDS,
+    USER_HASH_FIELDS,
+    build_page_member,
+    convert_created_at_to_sort_key,
+    convert_group_hash_to_entity,
+    convert_page_member_to_oid,
+    convert_user_hash_to_entity,
+)
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+
+
+# Adds a user unless it was deleted. A verification projected before the
+# creation already set is_verified, which is kept.
+ADD_USER_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call(
+    'HSET', KEYS[1],
+    'email', ARGV[2], 'username', ARGV[3], 'group_oid', ARGV[4],
+    'created_at', ARGV[5]
+)
+if ARGV[6] == '1' then
+    redis.call('HSET', KEYS[1], 'is_verified', '1')
+else
+    redis.call('HSETNX', KEYS[1], 'is_verified', '0')
+end
+redis.call('ZADD', KEYS[3], 0, ARGV[5] .. '|' .. ARGV[1])
+return 1
+"""
+
+VERIFY_USER_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'is_verified', '1')
+return 1
+"""
+
+ADD_GROUP_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'title', ARGV[2], 'created_at', ARGV[3])
+redis.call('ZADD', KEYS[3], 0, ARGV[3] .. '|' .. ARGV[1])
+return 1
+"""
+
+# Removes a user or a group from its page and leaves a tombstone behind, so
+# a creation delivered late does not bring it back.
+DELETE_SCRIPT = """
+local created_at = redis.call('HGET', KEYS[1], 'created_at')
+if created_at then
+    redis.call('ZREM', KEYS[3], created_at .. '|' .. ARGV[1])
+end
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], '1', 'EX', ARGV[2])
+return 1
+"""
+
+
+@dataclass
+class RedisReadModel(BaseReadModel):
+    """Users and groups as hashes, paged through sorted sets.
+
+    Every member of a page set has the same score and is named after its
+    entity's sort key, so a page is one ``ZRANGEBYLEX`` from the cursor.
+    A page and its count take one round trip, the entities a second one.
+    Every projection is one script call, atomic on the server.
+
+    Like the refresh tokens, Redis errors are raised: the projector retries
+    the event, a query fails instead of answering from a partial page.
+    """
+
+    client: Redis
+    key_prefix: str = "read-model"
+    # How long deleted oids are remembered, longer than events can be late
+    tombstone_ttl: int = 24 * 3600
+    _add_user_script: AsyncScript = field(init=False, repr=False)
+    _verify_user_script: AsyncScript = field(init=False, repr=False)
+    _add_group_script: AsyncScript = field(init=False, repr=False)
+    _delete_script: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._add_user_script = self.client.register_script(ADD_USER_SCRIPT)
+        self._verify_user_script = self.client.register_script(VERIFY_USER_SCRIPT)
+        self._add_group_script = self.client.register_script(ADD_GROUP_SCRIPT)
+        self._delete_script = self.client.register_script(DELETE_SCRIPT)
+
+    def _user_key(self, user_oid: str) -> str:
+        return f"{self.key_prefix}:user:{user_oid}"
+
+    def _group_key(self, group_oid: str) -> str:
+        return f"{self.key_prefix}:group:{group_oid}"
+
+    def _tombstone_key(self, oid: str) -> str:
+        return f"{self.key_prefix}:deleted:{oid}"
+
+    def _group_users_key(self, group_oid: str) -> str:
+        return f"{self.key_prefix}:group-users:{group_oid}"
+
+    @property
+    def _groups_key(self) -> str:
+        return f"{self.key_prefix}:groups"
+
+    async def _get_page(
+        self, page_key: str, filters: BaseGetAllFilters
+    ) -> tuple[list[str], int | None]:
+        async with self.client.pipeline(transaction=False) as pipeline:
+            if filters.cursor:
+                cursor = filters.cursor
+                pipeline.zrangebylex(
+                    page_key,
+                    f"({build_page_member(cursor.created_at, cursor.oid)}",
+                    "+",
+                    start=0,
+                    num=filters.limit,
+                )
+            else:
+                pipeline.zrangebylex(
+                    page_key, "-", "+", start=filters.offset, num=filters.limit
+                )
+            if filters.count != CountMode.NONE:
+                pipeline.zcard(page_key)
+            members, *count = await pipeline.execute()
+
+        return [convert_page_member_to_oid(member) for member in members], (
+            count[0] if count else None
+        )
+
+    async def _get_hashes(
+        self, keys: Iterable[str], fields: Sequence[str]
+    ) -> list[list[bytes | None]]:
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.hmget(key, fields)
+            return await pipeline.execute()
+
+    async def get_user(self, user_oid: str) -> User | None:
+        values = await self.client.hmget(self._user_key(user_oid), USER_HASH_FIELDS)
+        return convert_user_hash_to_entity(user_oid, values)
+
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]:
+        user_oids, count = await self._get_page(
+            self._group_users_key(group_oid), filters
+        )
+        if not user_oids:
+            return [], count
+
+        hashes = await self._get_hashes(
+            map(self._user_key, user_oids), USER_HASH_FIELDS
+        )
+        users = [
+            convert_user_hash_to_entity(user_oid, values)
+            for user_oid, values in zip(user_oids, hashes)
+        ]
+        return [user for user in users if user is not None], count
+
+    async def get_groups(
+        self, filters: GetGroupsFilters
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        group_oids, count = await self._get_page(self._groups_key, filters)
+        if not group_oids:
+            return [], count
+
+        hashes = await self._get_hashes(
+            map(self._group_key, group_oids), GROUP_HASH_FIELDS
+        )
+        groups = [
+            convert_group_hash_to_entity(group_oid, values)
+            for group_oid, values in zip(group_oids, hashes)
+        ]
+        return [group for group in groups if group is not None], count
+
+    async def add_users(self, users: Sequence[User]) -> None:
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for user in users:
+                await self._add_user_script(
+                    keys=[
+                        self._user_key(user.oid),
+                        self._tombstone_key(user.oid),
+                        self._group_users_key(user.group_id),
+                    ],
+                    args=[
+                        user.oid,
+                        user.email.as_generic_type(),
+                        user.username.as_generic_type(),
+                        user.group_id,
+                        convert_created_at_to_sort_key(user.created_at),
+                        int(user.is_verified),
+                    ],
+                    client=pipeline,
+                )
+            await pipeline.execute()
+
+    async def verify_user(self, user_oid: str) -> None:
+        await self._verify_user_script(
+            keys=[self._user_key(user_oid), self._tombstone_key(user_oid)]
+        )
+
+    async def delete_user(self, user_oid: str, group_oid: str) -> None:
+        await self._delete_script(
+            keys=[
+                self._user_key(user_oid),
+                self._tombstone_key(user_oid),
+                self._group_users_key(group_oid),
+            ],
+            args=[user_oid, self.tombstone_ttl],
+        )
+
+    async def add_groups(self, groups: Sequence[UserGroup]) -> None:
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for group in groups:
+                await self._add_group_script(
+                    keys=[
+                        self._group_key(group.oid),
+                        self._tombstone_key(group.oid),
+                        self._groups_key,
+                    ],
+                    args=[
+                        group.oid,
+                        group.title.as_generic_type(),
+                        convert_created_at_to_sort_key(group.created_at),
+                    ],
+                    client=pipeline,
+                )
+            await pipeline.execute()
+
+    async def delete_group(self, group_oid: str) -> None:
+        await self._delete_script(
+            keys=[
+                self._group_key(group_oid),
+                self._tombstone_key(group_oid),
+                self._groups_key,
+            ],
+            args=[group_oid, self.tombstone_ttl],
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
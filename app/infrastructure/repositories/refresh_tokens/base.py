@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from enum import Enum
+
+
+class RotationResult(str, Enum):
+    """Outcome of presenting a refresh token for rotation.
+
+    ``reused`` means the token was already rotated away: it leaked, and the
+    family has been deleted as a whole.
+    """
+
+    ROTATED = "rotated"
+    REUSED = "reused"
+    UNKNOWN = "unknown"
+
+
+class BaseRefreshTokenRepository(ABC):
+    """Refresh-token families and the revocations of access tokens.
+
+    A family is the chain of refresh tokens started by one login, only its
+    latest token id is accepted. Revoked token ids and per-user
+    "issued before" watermarks are kept for ``keep_for`` seconds.
+    """
+
+    @abstractmethod
+    async def add_family(
+        self, family_id: str, token_id: str, expires_in: int
+    ) -> None: ...
+
+    @abstractmethod
+    async def rotate_token(
+        self, family_id: str, token_id: str, new_token_id: str, expires_in: int
+    ) -> RotationResult:
+        """Atomically swap the family's token if ``token_id`` is its latest one."""
+
+    @abstractmethod
+    async def delete_family(self, family_id: str) -> None: ...
+
+    @abstractmethod
+    async def add_revoked_ids(
+        self, token_ids: Sequence[str], revoked_at: float, keep_for: float
+    ) -> None: ...
+
+    @abstractmethod
+    async def get_revoked_ids(self, since: float) -> list[tuple[str, float]]:
+        """Token ids revoked at or after ``since`` with their revocation time."""
+
+    @abstractmethod
+    async def is_revoked_id(self, token_id: str) -> bool: ...
+
+    @abstractmethod
+    async def set_watermark(
+        self, user_oid: str, issued_before: int, keep_for: float
+    ) -> None: ...
+
+    @abstractmethod
+    async def get_watermark(self, user_oid: str) -> int | None: ...
+
+    @abstractmethod
+    async def get_watermarks(self, since: float) -> dict[str, int]:
+        """Watermarks set to ``since`` or later by user oid."""
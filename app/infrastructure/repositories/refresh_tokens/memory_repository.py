@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from infrastructure.repositories.refresh_tokens.base import (
+    BaseRefreshTokenRepository,
+    RotationResult,
+)
+
+
+@dataclass
+class InMemoryRefreshTokenRepository(BaseRefreshTokenRepository):
+    _families: dict[str, str] = field(default_factory=dict, kw_only=True)
+    _revoked_ids: dict[str, float] = field(default_factory=dict, kw_only=True)
+    _watermarks: dict[str, int] = field(default_factory=dict, kw_only=True)
+
+    async def add_family(self, family_id: str, token_id: str, expires_in: int) -> None:
+        self._families[family_id] = token_id
+
+    async def rotate_token(
+        self, family_id: str, token_id: str, new_token_id: str, expires_in: int
+    ) -> RotationResult:
+        current_token_id = self._families.get(family_id)
+        if current_token_id is None:
+            return RotationResult.UNKNOWN
+
+        if current_token_id != token_id:
+            del self._families[family_id]
+            return RotationResult.REUSED
+
+        self._families[family_id] = new_token_id
+        return RotationResult.ROTATED
+
+    async def delete_family(self, family_id: str) -> None:
+        self._families.pop(family_id, None)
+
+    async def add_revoked_ids(
+        self, token_ids: Sequence[str], revoked_at: float, keep_for: float
+    ) -> None:
+        self._revoked_ids.update(dict.fromkeys(token_ids, revoked_at))
+
+    async def get_revoked_ids(self, since: float) -> list[tuple[str, float]]:
+        return [
+            (token_id, revoked_at)
+            for token_id, revoked_at in self._revoked_ids.items()
+            if revoked_at >= since
+        ]
+
+    async def is_revoked_id(self, token_id: str) -> bool:
+        return token_id in self._revoked_ids
+
+    async def set_watermark(
+        self, user_oid: str, issued_before: int, keep_for: float
+    ) -> None:
+        self._watermarks[user_oid] = issued_before
+
+    async def get_watermark(self, user_oid: str) -> int | None:
+        return self._watermarks.get(user_oid)
+
+    async def get_watermarks(self, since: float) -> dict[str, int]:
+        return {
+            user_oid: issued_before
+            for user_oid, issued_before in self._watermarks.items()
+            if issued_before >= since
+        }
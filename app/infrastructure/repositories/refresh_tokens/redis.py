@@ -0,0 +1,116 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from infrastructure.repositories.refresh_tokens.base import (
+    BaseRefreshTokenRepository,
+    RotationResult,
+)
+
+
+# Compare and swap of the family's latest token id, a mismatch deletes the
+# family. Returns 0 for an unknown family, 1 once rotated, 2 on reuse.
+ROTATE_TOKEN_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    return 0
+end
+if current == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+redis.call('DEL', KEYS[1])
+return 2
+"""
+
+_ROTATION_RESULTS = {
+    0: RotationResult.UNKNOWN,
+    1: RotationResult.ROTATED,
+    2: RotationResult.REUSED,
+}
+
+
+@dataclass
+class RedisRefreshTokenRepository(BaseRefreshTokenRepository):
+    """Families as expiring keys, revocations as sorted sets scored by time.
+
+    Unlike the cache, Redis errors are raised: a token must not be accepted
+    when its revocation state is unknown.
+    """
+
+    client: Redis
+    key_prefix: str = "refresh-token"
+    _rotate_token_script: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rotate_token_script = self.client.register_script(ROTATE_TOKEN_SCRIPT)
+
+    def _family_key(self, family_id: str) -> str:
+        return f"{self.key_prefix}:family:{family_id}"
+
+    @property
+    def _revoked_ids_key(self) -> str:
+        return f"{self.key_prefix}:revoked"
+
+    @property
+    def _watermarks_key(self) -> str:
+        return f"{self.key_prefix}:watermarks"
+
+    async def add_family(self, family_id: str, token_id: str, expires_in: int) -> None:
+        await self.client.set(self._family_key(family_id), token_id, ex=expires_in)
+
+    async def rotate_token(
+        self, family_id: str, token_id: str, new_token_id: str, expires_in: int
+    ) -> RotationResult:
+        result = await self._rotate_token_script(
+            keys=[self._family_key(family_id)],
+            args=[token_id, new_token_id, expires_in],
+        )
+        return _ROTATION_RESULTS[result]
+
+    async def delete_family(self, family_id: str) -> None:
+        await self.client.delete(self._family_key(family_id))
+
+    async def add_revoked_ids(
+        self, token_ids: Sequence[str], revoked_at: float, keep_for: float
+    ) -> None:
+        async with self.client.pipeline(transaction=False) as pipeline:
+            pipeline.zadd(self._revoked_ids_key, dict.fromkeys(token_ids, revoked_at))
+            pipeline.zremrangebyscore(
+                self._revoked_ids_key, "-inf", f"({revoked_at - keep_for}"
+            )
+            await pipeline.execute()
+
+    async def get_revoked_ids(self, since: float) -> list[tuple[str, float]]:
+        revoked_ids = await self.client.zrangebyscore(
+            self._revoked_ids_key, since, "+inf", withscores=True
+        )
+        return [(token_id.decode(), revoked_at) for token_id, revoked_at in revoked_ids]
+
+    async def is_revoked_id(self, token_id: str) -> bool:
+        return await self.client.zscore(self._revoked_ids_key, token_id) is not None
+
+    async def set_watermark(
+        self, user_oid: str, issued_before: int, keep_for: float
+    ) -> None:
+        async with self.client.pipeline(transaction=False) as pipeline:
+            pipeline.zadd(self._watermarks_key, {user_oid: issued_before})
+            pipeline.zremrangebyscore(
+                self._watermarks_key, "-inf", f"({issued_before - keep_for}"
+            )
+            await pipeline.execute()
+
+    async def get_watermark(self, user_oid: str) -> int | None:
+        issued_before = await self.client.zscore(self._watermarks_key, user_oid)
+        return int(issued_before) if issued_before is not None else None
+
+    async def get_watermarks(self, since: float) -> dict[str, int]:
+        watermarks = await self.client.zrangebyscore(
+            self._watermarks_key, since, "+inf", withscores=True
+        )
+        return {
+            user_oid.decode(): int(issued_before)
+            for user_oid, issued_before in watermarks
+        }
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
+from typing import Any
 
 from domain.entities.users import User, VerificationToken
 from infrastructure.repositories.users.filters.users import (
@@ -13,27 +14,46 @@ class BaseUserRepository(ABC):
         self, email: str, username: str
     ) -> bool: ...
 
+    @abstractmethod
+    async def get_existing_emails_and_usernames(
+        self, emails: Iterable[str], usernames: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        """The given emails and usernames that are already taken."""
+
     @abstractmethod
     async def add_user(self, user: User) -> None: ...
 
+    @abstractmethod
+    async def add_users(self, users: Sequence[User]) -> set[int]:
+        """Add the users that do not clash with existing ones.
+
+        Returns the positions of the users rejected as duplicates.
+        """
+
     @abstractmethod
     async def get_users(
         self, group_oid: str, filters: GetUsersFilters
-    ) -> tuple[Iterable[User], int]: ...
+    ) -> tuple[Iterable[User], int | None]: ...
+
+    @abstractmethod
+    def iter_group_user_documents(
+        self, group_oid: str, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the public fields of a group's users in ``(created_at, oid)``
+        order, as plain documents without building entities."""
 
     @abstractmethod
     async def get_user_by_oid(self, user_oid: str) -> User | None: ...
 
     @abstractmethod
-    async def get_user_by_username(self, username: str) -> User | None: ...
+    async def get_users_by_oids(self, user_oids: Iterable[str]) -> dict[str, User]:
+        """The users found among the given oids, keyed by oid."""
 
     @abstractmethod
-    async def verify_user(self, user_oid: str) -> None: ...
+    async def get_user_by_username(self, username: str) -> User | None: ...
 
     @abstractmethod
-    async def check_password_is_valid(
-        self, password: str, hashed_password: str
-    ) -> bool: ...
+    async def verify_user(self, user_oid: str) -> None: ...
 
     @abstractmethod
     async def delete_user(self, user_oid: str) -> User | None: ...
@@ -0,0 +1,114 @@
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from domain.entities.users import User
+from infrastructure.cache.tiered import TieredEntityCache
+from infrastructure.repositories.common.loader import BatchLoader
+from infrastructure.repositories.users.base import BaseUserRepository
+from infrastructure.repositories.users.converters import (
+    convert_user_entity_to_document,
+    convert_user_json_to_entity,
+)
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from infrastructure.transactions.base import BaseTransactionManager
+from infrastructure.transactions.dummy import DummyTransactionManager
+
+
+@dataclass
+class UserEntityCache(TieredEntityCache[User]):
+    key_prefix: ClassVar[str] = "entity:user"
+
+    def encode(self, entity: User) -> dict[str, Any]:
+        document = convert_user_entity_to_document(user=entity)
+        return {**document, "created_at": entity.created_at.isoformat()}
+
+    def decode(self, data: dict[str, Any]) -> User:
+        return convert_user_json_to_entity(user_json=data)
+
+
+@dataclass(frozen=True)
+class CachedUserRepository(BaseUserRepository):
+    """Serves lookups by oid through the entity cache.
+
+    Cache misses of concurrent ``get_user_by_oid`` calls are loaded together
+    with one ``get_users_by_oids``. Writes go straight to the wrapped
+    repository, stale entries are evicted by the domain event handlers.
+    Inside a transaction lookups bypass the cache and the batches, so they
+    see the transaction's own writes and never cache uncommitted ones.
+    """
+
+    repository: BaseUserRepository
+    cache: UserEntityCache
+    max_batch_size: int = 1000
+    transaction_manager: BaseTransactionManager = field(
+        default_factory=DummyTransactionManager
+    )
+    loader: BatchLoader[str, User] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "loader",
+            BatchLoader(
+                load_many=self.repository.get_users_by_oids,
+                max_batch_size=self.max_batch_size,
+            ),
+        )
+
+    async def check_user_exists_by_email_and_username(
+        self, email: str, username: str
+    ) -> bool:
+        return await self.repository.check_user_exists_by_email_and_username(
+            email=email, username=username
+        )
+
+    async def get_existing_emails_and_usernames(
+        self, emails: Iterable[str], usernames: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        return await self.repository.get_existing_emails_and_usernames(
+            emails=emails, usernames=usernames
+        )
+
+    async def add_user(self, user: User) -> None:
+        await self.repository.add_user(user=user)
+
+    async def add_users(self, users: Sequence[User]) -> set[int]:
+        return await self.repository.add_users(users=users)
+
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]:
+        return await self.repository.get_users(group_oid=group_oid, filters=filters)
+
+    def iter_group_user_documents(
+        self, group_oid: str, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        return self.repository.iter_group_user_documents(
+            group_oid=group_oid, batch_size=batch_size
+        )
+
+    async def get_user_by_oid(self, user_oid: str) -> User | None:
+        if self.transaction_manager.in_transaction:
+            return await self.repository.get_user_by_oid(user_oid=user_oid)
+
+        return await self.cache.get_or_load(
+            user_oid, lambda: self.loader.load(user_oid)
+        )
+
+    async def get_users_by_oids(self, user_oids: Iterable[str]) -> dict[str, User]:
+        if self.transaction_manager.in_transaction:
+            return await self.repository.get_users_by_oids(user_oids=user_oids)
+
+        return await self.cache.get_many_or_load(
+            user_oids, self.repository.get_users_by_oids
+        )
+
+    async def get_user_by_username(self, username: str) -> User | None:
+        return await self.repository.get_user_by_username(username=username)
+
+    async def verify_user(self, user_oid: str) -> None:
+        await self.repository.verify_user(user_oid=user_oid)
+
+    async def delete_user(self, user_oid: str) -> User | None:
+        return await self.repository.delete_user(user_oid=user_oid)
@@ -1,18 +1,31 @@
-from typing import Any, Mapping
+from datetime import datetime
+import sys
+from typing import Any, Mapping, Sequence
 from domain.entities.users import User, VerificationToken
 from domain.values.users import Email, Password, Username
 
 
 def convert_user_entity_to_document(user: User) -> dict:
-    return {
+    document = {
         "oid": user.oid,
         "email": user.email.as_generic_type(),
         "username": user.username.as_generic_type(),
-        "password": user.password.as_generic_type(),
         "created_at": user.created_at,
         "group_oid": user.group_id,
         "is_verified": user.is_verified,
     }
+    if user.password is not None:
+        document["password"] = user.password.as_generic_type()
+
+    return document
+
+
+# Fields of a user that may leave the service, in export column order
+USER_PUBLIC_FIELDS = ("oid", "username", "email", "is_verified", "created_at")
+
+# Reads that never check credentials leave the password hash in the database
+USER_ENTITY_PROJECTION = {"_id": False, "password": False}
+USER_CREDENTIALS_PROJECTION = {"_id": False}
 
 
 def convert_verification_token_entity_to_document(token: VerificationToken):
@@ -36,12 +49,51 @@ def convert_verification_token_document_to_entity(token: VerificationToken):
 
 
 def convert_user_document_to_entity(user_document: Mapping[str, Any]) -> User:
+    """Hydrate a stored user, its values were validated before they were
+    written. The password stays None when the document was read without it.
+
+    Every user of a group shares one interned copy of the group oid.
+    """
+    password = user_document.get("password")
     return User(
         oid=user_document["oid"],
-        email=Email(value=user_document["email"]),
-        username=Username(value=user_document["username"]),
-        password=Password(value=user_document["password"]),
+        email=Email.from_trusted(user_document["email"]),
+        username=Username.from_trusted(user_document["username"]),
+        password=Password.from_trusted(password) if password is not None else None,
         created_at=user_document["created_at"],
-        group_id=user_document["group_oid"],
+        group_id=sys.intern(user_document["group_oid"]),
         is_verified=user_document["is_verified"],
     )
+
+
+def convert_user_json_to_entity(user_json: Mapping[str, Any]) -> User:
+    """Restore a user from a JSON dump of its document, e.g. from a cache."""
+    return convert_user_document_to_entity(
+        {**user_json, "created_at": datetime.fromisoformat(user_json["created_at"])}
+    )
+
+
+def convert_user_entity_to_record(user: User) -> tuple:
+    """A user as a flat tuple of plain values, for compact binary storage."""
+    return (
+        user.oid,
+        user.email.as_generic_type(),
+        user.username.as_generic_type(),
+        user.password.as_generic_type() if user.password is not None else None,
+        user.created_at.isoformat(),
+        user.group_id,
+        user.is_verified,
+    )
+
+
+def convert_user_record_to_entity(record: Sequence[Any]) -> User:
+    oid, email, username, password, created_at, group_oid, is_verified = record
+    return User(
+        oid=oid,
+        email=Email.from_trusted(email),
+        username=Username.from_trusted(username),
+        password=Password.from_trusted(password) if password is not None else None,
+        created_at=datetime.fromisoformat(created_at),
+        group_id=sys.intern(group_oid),
+        is_verified=is_verified,
+    )
@@ -1,57 +1,246 @@
+import asyncio
 from dataclasses import dataclass, field
-from typing import Iterable
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Iterable, Sequence
 
-from domain.entities.users import User
-from infrastructure.repositories.users.base import BaseUserRepository
+from domain.entities.users import User, VerificationToken
+from infrastructure.repositories.common.filters.base import CountMode
+from infrastructure.repositories.common.memory_repository import (
+    PageIndex,
+    ShardedIndex,
+)
+from infrastructure.repositories.common.operation_log import (
+    BaseOperationLog,
+    DummyOperationLog,
+    Record,
+    undo_unless_durable,
+)
+from infrastructure.repositories.users.base import (
+    BaseUserRepository,
+    BaseVerificationTokenRepository,
+)
+from infrastructure.repositories.users.converters import (
+    USER_PUBLIC_FIELDS,
+    convert_user_entity_to_document,
+    convert_user_entity_to_record,
+    convert_user_record_to_entity,
+)
 from infrastructure.repositories.users.filters.users import GetUsersFilters
 
 
+# Operation log records, a tag followed by the values of the operation
+USER_ADDED, USER_VERIFIED, USER_DELETED = "user_added", "user_verified", "user_deleted"
+
+
 @dataclass
 class InMemoryUserRepository(BaseUserRepository):
-    _saved_users: list[User] = field(default_factory=list, kw_only=True)
+    """Users kept in process, indexed by oid, username and email, and per
+    group in page order.
+
+    Writes hold a lock across the uniqueness checks and the index updates,
+    so concurrent writers can not sneak in a duplicate. Every write is
+    recorded in ``operation_log`` and only returns once the record is
+    durable, a write whose record fails is undone. ``open`` restores what
+    the log persisted.
+    """
+
+    shards: int = field(default=16, kw_only=True)
+    operation_log: BaseOperationLog = field(
+        default_factory=DummyOperationLog, kw_only=True
+    )
+    _users: ShardedIndex[str, User] = field(init=False)
+    _oids_by_username: ShardedIndex[str, str] = field(init=False)
+    _oids_by_email: ShardedIndex[str, str] = field(init=False)
+    _group_pages: dict[str, PageIndex] = field(default_factory=dict, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        self._users = ShardedIndex(self.shards)
+        self._oids_by_username = ShardedIndex(self.shards)
+        self._oids_by_email = ShardedIndex(self.shards)
+
+    async def open(self) -> int:
+        return await self.operation_log.open(replay=self._replay, dump=self._dump)
+
+    async def close(self) -> None:
+        await self.operation_log.close()
 
     async def check_user_exists_by_email_and_username(
         self, email: str, username: str
     ) -> bool:
-        return any(
-            user.email.as_generic_type() == email
-            or user.username.as_generic_type() == username
-            for user in self._saved_users
+        return email in self._oids_by_email or username in self._oids_by_username
+
+    async def get_existing_emails_and_usernames(
+        self, emails: Iterable[str], usernames: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        return (
+            {email for email in emails if email in self._oids_by_email},
+            {username for username in usernames if username in self._oids_by_username},
         )
 
     async def add_user(self, user: User) -> None:
-        self._saved_users.append(user)
+        async with self._lock:
+            self._index_user(user)
+            written = self.operation_log.append(_added(user))
+
+        await undo_unless_durable(written, self._lock, lambda: self._undo_add(user))
 
-    async def get_users(self, filters: GetUsersFilters) -> tuple[Iterable[User], int]:
-        total_count = len(self._saved_users)
-        limited_users = self._saved_users[
-            filters.offset : filters.offset + filters.limit
-        ]
-        return limited_users, total_count
+    async def add_users(self, users: Sequence[User]) -> set[int]:
+        rejected = set()
+        written = []
+        async with self._lock:
+            for index, user in enumerate(users):
+                if await self.check_user_exists_by_email_and_username(
+                    email=user.email.as_generic_type(),
+                    username=user.username.as_generic_type(),
+                ):
+                    rejected.add(index)
+                else:
+                    self._index_user(user)
+                    written.append(
+                        undo_unless_durable(
+                            self.operation_log.append(_added(user)),
+                            self._lock,
+                            partial(self._undo_add, user),
+                        )
+                    )
+
+        await asyncio.gather(*written)
+        return rejected
+
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]:
+        page_index = self._group_pages.get(group_oid)
+        if page_index is None:
+            return [], 0 if filters.count != CountMode.NONE else None
+
+        users = [self._users.get(oid) for oid in page_index.page(filters)]
+        total_count = len(page_index) if filters.count != CountMode.NONE else None
+        return users, total_count
+
+    async def iter_group_user_documents(
+        self, group_oid: str, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        # A snapshot, users deleted while streaming are still exported
+        oids = list(self._group_pages.get(group_oid, ()))
+        for oid in oids:
+            document = convert_user_entity_to_document(self._users.get(oid))
+            yield {field: document[field] for field in USER_PUBLIC_FIELDS}
 
     async def get_user_by_oid(self, user_oid: str) -> User | None:
-        for user in self._saved_users:
-            if user.oid == user_oid:
-                return user
-        return None
+        return self._users.get(user_oid)
+
+    async def get_users_by_oids(self, user_oids: Iterable[str]) -> dict[str, User]:
+        users = {}
+        for user_oid in user_oids:
+            user = self._users.get(user_oid)
+            if user is not None:
+                users[user_oid] = user
+
+        return users
 
     async def get_user_by_username(self, username: str) -> User | None:
-        for user in self._saved_users:
-            if user.username == username:
-                return user
-        return None
+        user_oid = self._oids_by_username.get(username)
+        return self._users.get(user_oid) if user_oid is not None else None
 
     async def verify_user(self, user_oid: str) -> None:
-        user = await self.get_user_by_oid(user_oid)
-        user.is_verified = True
+        async with self._lock:
+            user = self._users.get(user_oid)
+            if user is None:
+                return
+
+            was_verified, user.is_verified = user.is_verified, True
+            written = self.operation_log.append((USER_VERIFIED, user_oid))
 
-    async def check_password_is_valid(
-        self, password: str, hashed_password: str
-    ) -> bool: ...
+        def undo() -> None:
+            user.is_verified = was_verified
+
+        await undo_unless_durable(written, self._lock, undo)
 
     async def delete_user(self, user_oid: str) -> User | None:
-        for user in self._saved_users:
-            if user.oid == user_oid:
-                self._saved_users.remove(user)
-                return user
-        return None
+        async with self._lock:
+            user = self._unindex_user(user_oid)
+            if user is None:
+                return None
+
+            written = self.operation_log.append((USER_DELETED, user_oid))
+
+        await undo_unless_durable(written, self._lock, lambda: self._undo_delete(user))
+        return user
+
+    def _index_user(self, user: User) -> None:
+        self._users.set(user.oid, user)
+        self._oids_by_username.set(user.username.as_generic_type(), user.oid)
+        self._oids_by_email.set(user.email.as_generic_type(), user.oid)
+        self._group_pages.setdefault(user.group_id, PageIndex()).add(user)
+
+    def _unindex_user(self, user_oid: str) -> User | None:
+        user = self._users.pop(user_oid)
+        if user is not None:
+            self._oids_by_username.pop(user.username.as_generic_type())
+            self._oids_by_email.pop(user.email.as_generic_type())
+            self._group_pages[user.group_id].remove(user)
+
+        return user
+
+    def _undo_add(self, user: User) -> None:
+        if self._users.get(user.oid) is user:
+            self._unindex_user(user.oid)
+
+    def _undo_delete(self, user: User) -> None:
+        # Unless a user taking its place was added meanwhile
+        if not (
+            user.oid in self._users
+            or user.username.as_generic_type() in self._oids_by_username
+            or user.email.as_generic_type() in self._oids_by_email
+        ):
+            self._index_user(user)
+
+    def _replay(self, record: Record) -> None:
+        operation, *values = record
+        if operation == USER_ADDED:
+            user = convert_user_record_to_entity(values)
+            # An add replayed over a snapshot that already holds the user
+            self._unindex_user(user.oid)
+            self._index_user(user)
+        elif operation == USER_VERIFIED:
+            user = self._users.get(values[0])
+            if user is not None:
+                user.is_verified = True
+        elif operation == USER_DELETED:
+            self._unindex_user(values[0])
+
+    def _dump(self) -> Iterable[Record]:
+        # Only the references are taken now, records are built as consumed.
+        # Group by group in page order, so replaying rebuilds the page
+        # indexes by appending.
+        return map(
+            _added,
+            [
+                self._users.get(oid)
+                for page_index in self._group_pages.values()
+                for oid in page_index
+            ],
+        )
+
+
+def _added(user: User) -> Record:
+    return (USER_ADDED, *convert_user_entity_to_record(user))
+
+
+@dataclass
+class InMemoryVerificationTokenRepository(BaseVerificationTokenRepository):
+    _tokens: dict[str, VerificationToken] = field(default_factory=dict, kw_only=True)
+
+    async def add_token(self, token: VerificationToken) -> None:
+        self._tokens[token.token] = token
+
+    async def check_token_exists(self, token: str) -> bool:
+        # Single use and expiring, like the TTL-indexed collection in MongoDB
+        verification_token = self._tokens.pop(token, None)
+        return (
+            verification_token is not None
+            and verification_token.expires_at > datetime.now()
+        )
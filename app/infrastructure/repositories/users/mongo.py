@@ -1,15 +1,24 @@
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass
+from typing import Any, ClassVar
 
-import bcrypt
+from motor.core import AgnosticCursor
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import BulkWriteError
 
 from domain.entities.users import User, VerificationToken
-from infrastructure.repositories.common.base_repository import BaseMongoDBRepository
+from infrastructure.repositories.common.base_repository import (
+    PAGE_SORT,
+    BaseMongoDBRepository,
+)
 from infrastructure.repositories.users.base import (
     BaseUserRepository,
     BaseVerificationTokenRepository,
 )
 from infrastructure.repositories.users.converters import (
+    USER_CREDENTIALS_PROJECTION,
+    USER_ENTITY_PROJECTION,
+    USER_PUBLIC_FIELDS,
     convert_user_document_to_entity,
     convert_user_entity_to_document,
     convert_verification_token_entity_to_document,
@@ -18,58 +27,183 @@ from infrastructure.repositories.users.filters.users import (
     GetUsersFilters,
 )
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+def _email_or_username_filter(
+    emails: Iterable[str], usernames: Iterable[str]
+) -> dict[str, Any]:
+    return {
+        "$or": [
+            {"email": {"$in": list(emails)}},
+            {"username": {"$in": list(usernames)}},
+        ]
+    }
+
 
 @dataclass(frozen=True)
 class MongoDBUserRepository(BaseUserRepository, BaseMongoDBRepository):
+    indexes: ClassVar[tuple[IndexModel, ...]] = (
+        IndexModel("oid", name="oid_unique", unique=True),
+        IndexModel("email", name="email_unique", unique=True),
+        IndexModel("username", name="username_unique", unique=True),
+        IndexModel(
+            [("group_oid", ASCENDING), ("created_at", ASCENDING), ("oid", ASCENDING)],
+            name="group_oid_created_at_oid",
+        ),
+    )
+
+    def checked_queries(self) -> Iterable[AgnosticCursor]:
+        return (
+            self._collection.find({"oid": ""}),
+            self._collection.find({"username": ""}),
+            self._collection.find(_email_or_username_filter([""], [""])),
+            self._find_page(conditions={"group_oid": ""}, filters=GetUsersFilters()),
+            self._find_group_user_documents(group_oid="", projection=None),
+        )
+
     async def check_user_exists_by_email_and_username(
         self, email: str, username: str
     ) -> bool:
-        filter_query = {"$or": [{"email": email}, {"username": username}]}
-        return bool(await self._collection.find_one(filter=filter_query))
+        return bool(
+            await self._collection.find_one(
+                filter=_email_or_username_filter([email], [username]),
+                projection={"_id": True},
+                session=self._session,
+            )
+        )
+
+    async def get_existing_emails_and_usernames(
+        self, emails: Iterable[str], usernames: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        emails, usernames = set(emails), set(usernames)
+        documents = self._collection.find(
+            filter=_email_or_username_filter(emails, usernames),
+            projection={"_id": False, "email": True, "username": True},
+            session=self._session,
+        )
+
+        existing_emails: set[str] = set()
+        existing_usernames: set[str] = set()
+        async for document in documents:
+            if document["email"] in emails:
+                existing_emails.add(document["email"])
+            if document["username"] in usernames:
+                existing_usernames.add(document["username"])
+
+        return existing_emails, existing_usernames
 
     async def add_user(self, user: User) -> None:
-        await self._collection.insert_one(convert_user_entity_to_document(user))
+        await self._collection.insert_one(
+            convert_user_entity_to_document(user), session=self._session
+        )
+
+    async def add_users(self, users: Sequence[User]) -> set[int]:
+        if not users:
+            return set()
+
+        # Unordered, one duplicate does not stop the rest of the batch
+        try:
+            await self._collection.insert_many(
+                [convert_user_entity_to_document(user) for user in users],
+                ordered=False,
+                session=self._session,
+            )
+        except BulkWriteError as error:
+            write_errors = error.details["writeErrors"]
+            if any(
+                write_error["code"] != DUPLICATE_KEY_ERROR_CODE
+                for write_error in write_errors
+            ):
+                raise
+
+            return {write_error["index"] for write_error in write_errors}
+
+        return set()
 
     async def get_user_by_oid(self, user_oid: str) -> User | None:
-        user = await self._collection.find_one(filter={"oid": user_oid})
+        user = await self._collection.find_one(
+            filter={"oid": user_oid},
+            projection=USER_ENTITY_PROJECTION,
+            session=self._session,
+        )
         if user:
             return convert_user_document_to_entity(user_document=user)
 
+    async def get_users_by_oids(self, user_oids: Iterable[str]) -> dict[str, User]:
+        user_oids = list(set(user_oids))
+        if not user_oids:
+            return {}
+
+        documents = self._collection.find(
+            filter={"oid": {"$in": user_oids}},
+            projection=USER_ENTITY_PROJECTION,
+            session=self._session,
+        )
+        return {
+            document["oid"]: convert_user_document_to_entity(user_document=document)
+            async for document in documents
+        }
+
     async def get_user_by_username(self, username: str) -> User | None:
-        user = await self._collection.find_one(filter={"username": username})
+        # Logins check the password, the only read that fetches the hash
+        user = await self._collection.find_one(
+            filter={"username": username},
+            projection=USER_CREDENTIALS_PROJECTION,
+            session=self._session,
+        )
         if user:
             return convert_user_document_to_entity(user_document=user)
 
     async def get_users(
         self, group_oid: str, filters: GetUsersFilters
-    ) -> tuple[Iterable[User], int]:
+    ) -> tuple[Iterable[User], int | None]:
         find_conditions = {"group_oid": group_oid}
-        cursor = (
-            self._collection.find(find_conditions)
-            .skip(filters.offset)
-            .limit(filters.limit)
+        user_documents, count = await self._get_page(
+            conditions=find_conditions,
+            filters=filters,
+            projection=USER_ENTITY_PROJECTION,
         )
 
         users = [
             convert_user_document_to_entity(user_document=user_document)
-            async for user_document in cursor
+            for user_document in user_documents
         ]
-        count = await self._collection.count_documents(filter=find_conditions)
 
         return users, count
 
+    async def iter_group_user_documents(
+        self, group_oid: str, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        # Served by the group_oid_created_at_oid index, the cursor holds one
+        # batch at a time whatever the size of the group.
+        documents = self._find_group_user_documents(
+            group_oid=group_oid,
+            projection={"_id": False, **dict.fromkeys(USER_PUBLIC_FIELDS, True)},
+        ).batch_size(batch_size)
+        async for document in documents:
+            yield document
+
+    def _find_group_user_documents(
+        self, group_oid: str, projection: dict[str, bool] | None
+    ) -> AgnosticCursor:
+        return self._listing_collection.find(
+            {"group_oid": group_oid}, projection=projection, session=self._session
+        ).sort(PAGE_SORT)
+
     async def verify_user(self, user_oid: str) -> None:
         await self._collection.update_one(
-            filter={"oid": user_oid}, update={"$set": {"is_verified": True}}
+            filter={"oid": user_oid},
+            update={"$set": {"is_verified": True}},
+            session=self._session,
         )
 
-    async def check_password_is_valid(
-        self, password: str, hashed_password: str
-    ) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
-
     async def delete_user(self, user_oid: str) -> User | None:
-        user = await self._collection.find_one_and_delete(filter={"oid": user_oid})
+        user = await self._collection.find_one_and_delete(
+            filter={"oid": user_oid},
+            projection=USER_ENTITY_PROJECTION,
+            session=self._session,
+        )
         if user:
             return convert_user_document_to_entity(user_document=user)
 
@@ -78,10 +212,25 @@ class MongoDBUserRepository(BaseUserRepository, BaseMongoDBRepository):
 class MongoDBVerificationTokenRepository(
     BaseVerificationTokenRepository, BaseMongoDBRepository
 ):
+    indexes: ClassVar[tuple[IndexModel, ...]] = (
+        IndexModel("token", name="token_unique", unique=True),
+        IndexModel("expires_at", name="expires_at_ttl", expireAfterSeconds=0),
+    )
+
+    def checked_queries(self) -> Iterable[AgnosticCursor]:
+        return (self._collection.find({"token": ""}),)
+
     async def add_token(self, token: VerificationToken) -> None:
         await self._collection.insert_one(
-            convert_verification_token_entity_to_document(token=token)
+            convert_verification_token_entity_to_document(token=token),
+            session=self._session,
         )
 
     async def check_token_exists(self, token: str) -> bool:
-        return bool(await self._collection.find_one_and_delete(filter={"token": token}))
+        return bool(
+            await self._collection.find_one_and_delete(
+                filter={"token": token},
+                projection={"_id": True},
+                session=self._session,
+            )
+        )
@@ -0,0 +1,235 @@
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    String,
+    Table,
+    delete,
+    or_,
+    select,
+    update,
+)
+
+from domain.entities.users import User, VerificationToken
+from infrastructure.repositories.common.sql_repository import (
+    BaseSQLAlchemyRepository,
+    metadata,
+)
+from infrastructure.repositories.users.base import (
+    BaseUserRepository,
+    BaseVerificationTokenRepository,
+)
+from infrastructure.repositories.users.converters import (
+    USER_PUBLIC_FIELDS,
+    convert_user_document_to_entity,
+    convert_user_entity_to_document,
+    convert_verification_token_entity_to_document,
+)
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+
+
+users_table = Table(
+    "users",
+    metadata,
+    Column("oid", String, primary_key=True),
+    Column("email", String, nullable=False, unique=True),
+    Column("username", String, nullable=False, unique=True),
+    Column("password", String),
+    Column("created_at", DateTime, nullable=False),
+    Column("group_oid", String, nullable=False),
+    Column("is_verified", Boolean, nullable=False, default=False),
+    Index("users_group_oid_created_at_oid", "group_oid", "created_at", "oid"),
+)
+
+verification_tokens_table = Table(
+    "verification_tokens",
+    metadata,
+    Column("oid", String, primary_key=True),
+    Column("token", String, nullable=False, unique=True),
+    Column("created_at", DateTime, nullable=False),
+    Column("expires_at", DateTime, nullable=False, index=True),
+    Column("user_oid", String, nullable=False),
+)
+
+# Reads that never check credentials leave the password hash in the database
+USER_ENTITY_COLUMNS = tuple(
+    column for column in users_table.c if column.name != "password"
+)
+USER_CREDENTIALS_COLUMNS = tuple(users_table.c)
+USER_PUBLIC_COLUMNS = tuple(users_table.c[field] for field in USER_PUBLIC_FIELDS)
+
+
+@dataclass(frozen=True)
+class SQLAlchemyUserRepository(BaseUserRepository, BaseSQLAlchemyRepository):
+    async def check_user_exists_by_email_and_username(
+        self, email: str, username: str
+    ) -> bool:
+        async with self._connect() as connection:
+            user_oid = await connection.scalar(
+                select(users_table.c.oid)
+                .where(
+                    or_(
+                        users_table.c.email == email, users_table.c.username == username
+                    )
+                )
+                .limit(1)
+            )
+
+        return user_oid is not None
+
+    async def get_existing_emails_and_usernames(
+        self, emails: Iterable[str], usernames: Iterable[str]
+    ) -> tuple[set[str], set[str]]:
+        emails, usernames = set(emails), set(usernames)
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(users_table.c.email, users_table.c.username).where(
+                    or_(
+                        users_table.c.email.in_(emails),
+                        users_table.c.username.in_(usernames),
+                    )
+                )
+            )
+            rows = result.all()
+
+        return (
+            {row.email for row in rows if row.email in emails},
+            {row.username for row in rows if row.username in usernames},
+        )
+
+    async def add_user(self, user: User) -> None:
+        async with self._begin() as connection:
+            await connection.execute(
+                users_table.insert(), convert_user_entity_to_document(user)
+            )
+
+    async def add_users(self, users: Sequence[User]) -> set[int]:
+        if not users:
+            return set()
+
+        # One multi-row insert, duplicates are skipped instead of failing the
+        # batch and the oids of the inserted rows come back in its result
+        async with self._begin() as connection:
+            result = await connection.execute(
+                self._insert(users_table)
+                .on_conflict_do_nothing()
+                .returning(users_table.c.oid),
+                [convert_user_entity_to_document(user) for user in users],
+            )
+            inserted_oids = set(result.scalars())
+
+        return {
+            index for index, user in enumerate(users) if user.oid not in inserted_oids
+        }
+
+    async def get_user_by_oid(self, user_oid: str) -> User | None:
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(*USER_ENTITY_COLUMNS).where(users_table.c.oid == user_oid)
+            )
+            row = result.first()
+
+        return convert_user_document_to_entity(row._mapping) if row else None
+
+    async def get_users_by_oids(self, user_oids: Iterable[str]) -> dict[str, User]:
+        user_oids = list(set(user_oids))
+        if not user_oids:
+            return {}
+
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(*USER_ENTITY_COLUMNS).where(users_table.c.oid.in_(user_oids))
+            )
+            rows = result.all()
+
+        return {row.oid: convert_user_document_to_entity(row._mapping) for row in rows}
+
+    async def get_user_by_username(self, username: str) -> User | None:
+        # Logins check the password, the only read that fetches the hash
+        async with self._connect() as connection:
+            result = await connection.execute(
+                select(*USER_CREDENTIALS_COLUMNS).where(
+                    users_table.c.username == username
+                )
+            )
+            row = result.first()
+
+        return convert_user_document_to_entity(row._mapping) if row else None
+
+    async def get_users(
+        self, group_oid: str, filters: GetUsersFilters
+    ) -> tuple[Iterable[User], int | None]:
+        rows, count = await self._get_page(
+            statement=select(*USER_ENTITY_COLUMNS),
+            table=users_table,
+            conditions=(users_table.c.group_oid == group_oid,),
+            filters=filters,
+        )
+
+        return [convert_user_document_to_entity(row._mapping) for row in rows], count
+
+    async def iter_group_user_documents(
+        self, group_oid: str, batch_size: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        # Served by the users_group_oid_created_at_oid index, a server side
+        # cursor holds one batch at a time whatever the size of the group.
+        async with self._connect() as connection:
+            result = await connection.stream(
+                select(*USER_PUBLIC_COLUMNS)
+                .where(users_table.c.group_oid == group_oid)
+                .order_by(users_table.c.created_at, users_table.c.oid)
+                .execution_options(yield_per=batch_size)
+            )
+            async for row in result.mappings():
+                yield dict(row)
+
+    async def verify_user(self, user_oid: str) -> None:
+        async with self._begin() as connection:
+            await connection.execute(
+                update(users_table)
+                .where(users_table.c.oid == user_oid)
+                .values(is_verified=True)
+            )
+
+    async def delete_user(self, user_oid: str) -> User | None:
+        async with self._begin() as connection:
+            result = await connection.execute(
+                delete(users_table)
+                .where(users_table.c.oid == user_oid)
+                .returning(*USER_ENTITY_COLUMNS)
+            )
+            row = result.first()
+
+        return convert_user_document_to_entity(row._mapping) if row else None
+
+
+@dataclass(frozen=True)
+class SQLAlchemyVerificationTokenRepository(
+    BaseVerificationTokenRepository, BaseSQLAlchemyRepository
+):
+    async def add_token(self, token: VerificationToken) -> None:
+        async with self._begin() as connection:
+            await connection.execute(
+                verification_tokens_table.insert(),
+                convert_verification_token_entity_to_document(token=token),
+            )
+
+    async def check_token_exists(self, token: str) -> bool:
+        # Single use and expiring, like the TTL-indexed collection in MongoDB
+        async with self._begin() as connection:
+            token_oid = await connection.scalar(
+                delete(verification_tokens_table)
+                .where(
+                    verification_tokens_table.c.token == token,
+                    verification_tokens_table.c.expires_at > datetime.now(),
+                )
+                .returning(verification_tokens_table.c.oid)
+            )
+
+        return token_oid is not None
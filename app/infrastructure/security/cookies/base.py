@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Any
+
+from infrastructure.repositories.refresh_tokens.base import BaseRefreshTokenRepository
+from infrastructure.security.cookies.revocation import TokenRevocationList
 
 
 @dataclass
@@ -8,6 +12,8 @@ class BaseCookieManager(ABC):
     _algorithm: str
     _access_token_expire_minutes: int
     _refresh_token_expire_days: int
+    _refresh_token_repository: BaseRefreshTokenRepository
+    _revocation_list: TokenRevocationList
 
     @abstractmethod
     async def create_access_token(self, user_oid: str) -> str:
@@ -17,6 +23,29 @@ class BaseCookieManager(ABC):
     async def create_refresh_token(self, user_oid: str) -> str:
         pass
 
+    @abstractmethod
+    async def create_tokens(self, user_oid: str) -> tuple[str, str]:
+        """Access and refresh token of a new token family."""
+
     @abstractmethod
     async def get_payload(self, token: str) -> str:
         pass
+
+    @abstractmethod
+    async def rotate_refresh_token(self, refresh_token: str) -> tuple[str, str]:
+        """Exchange a refresh token for a new access and refresh token.
+
+        Presenting an already rotated token revokes its whole family.
+        """
+
+    @abstractmethod
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """Revoke the token's family along with its access tokens."""
+
+    @abstractmethod
+    async def revoke_user_tokens(self, user_oid: str) -> None:
+        """Revoke every token issued to the user so far."""
+
+    @abstractmethod
+    def get_jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Public keys tokens can be verified with, as a JSON Web Key Set."""
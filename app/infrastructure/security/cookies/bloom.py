@@ -0,0 +1,45 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import hashlib
+
+
+@dataclass
+class BloomFilter:
+    """Fixed size set membership with false positives but no false negatives.
+
+    Positions come from one 128 bit digest split in two and combined by
+    double hashing, instead of ``hashes`` separate digests.
+    """
+
+    size: int
+    hashes: int
+    count: int = field(default=0, init=False)
+    _bits: bytearray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8])
+        second = int.from_bytes(digest[8:]) | 1
+
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        # Most lookups are misses and stop at the first unset bit
+        if not self.count:
+            return False
+
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+
+        return True
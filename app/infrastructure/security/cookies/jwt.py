@@ -1,38 +1,237 @@
-from dataclasses import dataclass
+from base64 import urlsafe_b64encode
+from dataclasses import dataclass, field
+import hashlib
+import time
+from typing import Any
+from uuid import uuid4
+
 import jwt
-from datetime import UTC, datetime, timedelta
-from infrastructure.exceptions.cookies import ExpiredToken, InvalidToken
+from jwt.algorithms import Algorithm, HMACAlgorithm
+import orjson
+
+from infrastructure.cache.local import LocalCache
+from infrastructure.exceptions.cookies import (
+    ExpiredToken,
+    InvalidToken,
+    RefreshTokenReused,
+    RevokedToken,
+)
+from infrastructure.repositories.refresh_tokens.base import RotationResult
 from infrastructure.security.cookies.base import BaseCookieManager
 
 
+def _b64encode(data: bytes) -> bytes:
+    return urlsafe_b64encode(data).rstrip(b"=")
+
+
 @dataclass
 class PyJWTCookieManager(BaseCookieManager):
-    async def create_access_token(self, user_oid: str) -> str:
-        to_encode = {
-            "sub": user_oid,
-            "exp": datetime.now(UTC)
-            + timedelta(minutes=self._access_token_expire_minutes),
-        }
-        return jwt.encode(to_encode, self._token_secret_key, algorithm=self._algorithm)
+    """Issues and verifies JWTs with keys prepared once.
 
-    async def create_refresh_token(self, user_oid: str) -> str:
-        to_encode = {
+    For asymmetric algorithms (``EdDSA``, ``ES256``, ``RS256``...)
+    ``_token_secret_key`` holds the PEM encoded private key, the public key
+    is derived from it unless ``_public_key`` is given and is published
+    through :meth:`get_jwks`. Verified tokens are remembered by digest
+    until their ``exp`` claim, so repeated requests with the same cookie
+    skip the signature check, revocation is still checked in memory.
+
+    Every login starts a refresh-token family, access tokens carry its id
+    in the ``fam`` claim so revoking the family revokes them as well.
+    """
+
+    _public_key: str | None = None
+    _key_id: str | None = None
+    _verification_cache_maxsize: int = 10_000
+
+    _jwt_algorithm: Algorithm = field(init=False, repr=False)
+    _signing_key: Any = field(init=False, repr=False)
+    _verifying_key: Any = field(init=False, repr=False)
+    _jwk: dict[str, Any] | None = field(init=False, repr=False)
+    _encoded_header: bytes = field(init=False, repr=False)
+    _verified_tokens: LocalCache = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._jwt_algorithm = jwt.get_algorithm_by_name(self._algorithm)
+        self._signing_key = self._jwt_algorithm.prepare_key(self._token_secret_key)
+
+        if isinstance(self._jwt_algorithm, HMACAlgorithm):
+            # Shared secrets are never published
+            self._verifying_key = self._signing_key
+            self._jwk = None
+        else:
+            self._verifying_key = (
+                self._jwt_algorithm.prepare_key(self._public_key)
+                if self._public_key is not None
+                else self._signing_key.public_key()
+            )
+            self._jwk = self._jwt_algorithm.to_jwk(self._verifying_key, as_dict=True)
+            if self._key_id is None:
+                self._key_id = _b64encode(
+                    hashlib.sha256(
+                        orjson.dumps(self._jwk, option=orjson.OPT_SORT_KEYS)
+                    ).digest()
+                )[:16].decode()
+            self._jwk.update(kid=self._key_id, alg=self._algorithm, use="sig")
+
+        header = {"alg": self._algorithm, "typ": "JWT"}
+        if self._key_id is not None:
+            header["kid"] = self._key_id
+        self._encoded_header = _b64encode(orjson.dumps(header))
+        self._verified_tokens = LocalCache(
+            maxsize=self._verification_cache_maxsize, ttl=0
+        )
+
+    @property
+    def _access_token_expires_in(self) -> int:
+        return self._access_token_expire_minutes * 60
+
+    @property
+    def _refresh_token_expires_in(self) -> int:
+        return self._refresh_token_expire_days * 24 * 3600
+
+    def _encode(
+        self,
+        user_oid: str,
+        token_type: str,
+        expires_in: int,
+        family_id: str | None = None,
+        token_id: str | None = None,
+    ) -> str:
+        issued_at = int(time.time())
+        claims = {
             "sub": user_oid,
-            "exp": datetime.now(UTC) + timedelta(days=self._refresh_token_expire_days),
+            "typ": token_type,
+            "jti": token_id or uuid4().hex,
+            "iat": issued_at,
+            "exp": issued_at + expires_in,
         }
-        return jwt.encode(to_encode, self._token_secret_key, algorithm=self._algorithm)
+        if family_id is not None:
+            claims["fam"] = family_id
 
-    async def get_payload(self, token: str) -> str:
+        signing_input = self._encoded_header + b"." + _b64encode(orjson.dumps(claims))
+        signature = self._jwt_algorithm.sign(signing_input, self._signing_key)
+
+        return (signing_input + b"." + _b64encode(signature)).decode()
+
+    def _decode(self, token: str, token_type: str) -> dict[str, Any]:
         try:
-            payload: dict = jwt.decode(
-                token, self._token_secret_key, algorithms=[self._algorithm]
+            claims: dict = jwt.decode(
+                token,
+                self._verifying_key,
+                algorithms=[self._algorithm],
+                options={"require": ["sub", "jti", "iat", "exp"]},
             )
-            user_oid = payload.get("sub")
 
         except jwt.ExpiredSignatureError:
             raise ExpiredToken
 
-        except jwt.DecodeError:
+        except jwt.InvalidTokenError:
+            raise InvalidToken
+
+        if claims.get("typ") != token_type:
             raise InvalidToken
 
-        return user_oid
+        return claims
+
+    async def _start_family(self, user_oid: str) -> tuple[str, str]:
+        family_id = uuid4().hex
+        token_id = uuid4().hex
+        await self._refresh_token_repository.add_family(
+            family_id, token_id, expires_in=self._refresh_token_expires_in
+        )
+
+        refresh_token = self._encode(
+            user_oid, "refresh", self._refresh_token_expires_in, family_id, token_id
+        )
+        return family_id, refresh_token
+
+    async def create_access_token(self, user_oid: str) -> str:
+        return self._encode(user_oid, "access", self._access_token_expires_in)
+
+    async def create_refresh_token(self, user_oid: str) -> str:
+        _, refresh_token = await self._start_family(user_oid)
+        return refresh_token
+
+    async def create_tokens(self, user_oid: str) -> tuple[str, str]:
+        family_id, refresh_token = await self._start_family(user_oid)
+        access_token = self._encode(
+            user_oid, "access", self._access_token_expires_in, family_id
+        )
+
+        return access_token, refresh_token
+
+    async def get_payload(self, token: str) -> str:
+        digest = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        claims = self._verified_tokens.get(digest)
+        if claims is None:
+            claims = self._decode(token, "access")
+            expires_in = claims["exp"] - time.time()
+            if expires_in > 0:
+                self._verified_tokens.set(digest, claims, ttl=expires_in)
+
+        token_ids = (
+            (claims["jti"], claims["fam"]) if "fam" in claims else (claims["jti"],)
+        )
+        if await self._revocation_list.is_revoked(
+            claims["sub"], claims["iat"], token_ids
+        ):
+            raise RevokedToken
+
+        return claims["sub"]
+
+    async def rotate_refresh_token(self, refresh_token: str) -> tuple[str, str]:
+        claims = self._decode(refresh_token, "refresh")
+        user_oid, family_id = claims["sub"], claims.get("fam")
+        if family_id is None:
+            raise InvalidToken
+
+        watermark = await self._refresh_token_repository.get_watermark(user_oid)
+        if watermark is not None and claims["iat"] < watermark:
+            raise RevokedToken
+
+        token_id = uuid4().hex
+        result = await self._refresh_token_repository.rotate_token(
+            family_id,
+            claims["jti"],
+            token_id,
+            expires_in=self._refresh_token_expires_in,
+        )
+        if result is RotationResult.REUSED:
+            await self._revoke_ids([family_id])
+            raise RefreshTokenReused
+        if result is RotationResult.UNKNOWN:
+            raise RevokedToken
+
+        access_token = self._encode(
+            user_oid, "access", self._access_token_expires_in, family_id
+        )
+        refresh_token = self._encode(
+            user_oid, "refresh", self._refresh_token_expires_in, family_id, token_id
+        )
+        return access_token, refresh_token
+
+    async def _revoke_ids(self, token_ids: list[str]) -> None:
+        await self._refresh_token_repository.add_revoked_ids(
+            token_ids, revoked_at=time.time(), keep_for=self._access_token_expires_in
+        )
+        self._revocation_list.add_revoked_ids(token_ids)
+
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        claims = self._decode(refresh_token, "refresh")
+        family_id = claims.get("fam")
+        if family_id is None:
+            raise InvalidToken
+
+        await self._refresh_token_repository.delete_family(family_id)
+        await self._revoke_ids([family_id])
+
+    async def revoke_user_tokens(self, user_oid: str) -> None:
+        # Whole seconds, tokens issued in the current one are revoked too
+        issued_before = int(time.time()) + 1
+        await self._refresh_token_repository.set_watermark(
+            user_oid, issued_before, keep_for=self._refresh_token_expires_in
+        )
+        self._revocation_list.set_watermark(user_oid, issued_before)
+
+    def get_jwks(self) -> dict[str, list[dict[str, Any]]]:
+        return {"keys": [self._jwk] if self._jwk is not None else []}
@@ -0,0 +1,115 @@
+import asyncio
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+import logging
+import time
+
+from infrastructure.repositories.refresh_tokens.base import BaseRefreshTokenRepository
+from infrastructure.security.cookies.bloom import BloomFilter
+
+
+logger = logging.getLogger(__name__)
+
+# Revocations written by other processes are re-read this far back, so a
+# small clock skew between them cannot hide one.
+SYNC_OVERLAP = 5.0
+
+
+@dataclass(eq=False)
+class TokenRevocationList:
+    """In-process view of revoked access tokens.
+
+    Access tokens are revoked by id and by a per-user "issued before"
+    watermark. Both only matter during ``window``, the access-token
+    lifetime, after which the tokens expire anyway. Revoked ids live in two
+    bloom filter generations of one window each, so a check is a dict lookup
+    and a few bit tests. Only a filter hit is confirmed against the
+    repository, ruling out false positives. ``run`` pulls revocations made
+    by other processes every ``sync_interval`` seconds.
+    """
+
+    token_repository: BaseRefreshTokenRepository
+    window: float
+    sync_interval: float = 1.0
+    bloom_size: int = 1 << 20
+    bloom_hashes: int = 7
+    _filters: tuple[BloomFilter, BloomFilter] = field(init=False, repr=False)
+    _rotated_at: float = field(default_factory=time.monotonic, init=False)
+    _watermarks: dict[str, int] = field(default_factory=dict, init=False)
+    _synced_until: float = field(init=False)
+    _is_stopping: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _task: asyncio.Task | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._filters = (self._new_filter(), self._new_filter())
+        self._synced_until = time.time() - self.window
+
+    def _new_filter(self) -> BloomFilter:
+        return BloomFilter(size=self.bloom_size, hashes=self.bloom_hashes)
+
+    def add_revoked_ids(self, token_ids: Iterable[str]) -> None:
+        self._rotate_filters()
+        current_filter = self._filters[0]
+        for token_id in token_ids:
+            current_filter.add(token_id)
+
+    def set_watermark(self, user_oid: str, issued_before: int) -> None:
+        self._watermarks[user_oid] = max(
+            issued_before, self._watermarks.get(user_oid, issued_before)
+        )
+
+    async def is_revoked(
+        self, user_oid: str, issued_at: int, token_ids: Iterable[str]
+    ) -> bool:
+        watermark = self._watermarks.get(user_oid)
+        if watermark is not None and issued_at < watermark:
+            return True
+
+        current_filter, previous_filter = self._filters
+        for token_id in token_ids:
+            if (
+                token_id in current_filter or token_id in previous_filter
+            ) and await self.token_repository.is_revoked_id(token_id):
+                return True
+
+        return False
+
+    def _rotate_filters(self) -> None:
+        now = time.monotonic()
+        if now - self._rotated_at >= self.window:
+            self._filters = (self._new_filter(), self._filters[0])
+            self._rotated_at = now
+
+    async def sync(self) -> None:
+        started_at = time.time()
+        revoked_ids = await self.token_repository.get_revoked_ids(
+            since=self._synced_until - SYNC_OVERLAP
+        )
+        self.add_revoked_ids(token_id for token_id, _ in revoked_ids)
+        self._watermarks = await self.token_repository.get_watermarks(
+            since=started_at - self.window
+        )
+        self._synced_until = started_at
+
+    async def run(self) -> None:
+        while not self._is_stopping.is_set():
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Could not sync revoked tokens")
+
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._is_stopping.wait(), timeout=self.sync_interval
+                )
+
+    def start(self) -> None:
+        self._is_stopping.clear()
+        self._task = asyncio.create_task(self.run(), name="token-revocation-sync")
+
+    async def stop(self) -> None:
+        self._is_stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass
+class BasePasswordHasher(ABC):
+    @abstractmethod
+    async def hash_password(self, password: str) -> str: ...
+
+    @abstractmethod
+    async def hash_passwords(self, passwords: Sequence[str]) -> list[str]:
+        """Hash many passwords, in the order given, without starving logins."""
+
+    @abstractmethod
+    async def verify_password(self, password: str, hashed_password: str) -> bool: ...
+
+    @abstractmethod
+    async def shutdown(self) -> None: ...
@@ -0,0 +1,109 @@
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import bcrypt
+
+from infrastructure.exceptions.passwords import PasswordHasherOverloaded
+from infrastructure.security.passwords.base import BasePasswordHasher
+
+
+def _hash_password(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _hash_passwords(passwords: list[bytes], rounds: int) -> list[bytes]:
+    return [_hash_password(password, rounds) for password in passwords]
+
+
+def _check_password(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+@dataclass
+class BcryptPasswordHasher(BasePasswordHasher):
+    """Runs bcrypt in an executor so hashing never blocks the event loop.
+
+    At most ``max_pending`` operations may be running or queued at once,
+    anything above that is rejected with ``PasswordHasherOverloaded``.
+    Bulk hashing runs on its own ``bulk_executor`` so imports never queue
+    ahead of logins. It sends passwords in slices of ``bulk_slice_size``
+    per executor call and waits for one of ``bulk_max_pending`` slots,
+    shared by every bulk call, instead of failing.
+    """
+
+    executor: Executor
+    max_pending: int = 64
+    rounds: int = 12
+    bulk_executor: Executor = field(
+        default_factory=lambda: ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="password-hasher-bulk"
+        )
+    )
+    bulk_max_pending: int = 2
+    bulk_slice_size: int = 8
+    _pending: int = field(default=0, init=False)
+    _bulk_slots: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._bulk_slots = asyncio.Semaphore(max(1, self.bulk_max_pending))
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash_password(self, password: str) -> str:
+        hashed_password = await self._run(
+            _hash_password, password.encode("utf-8"), self.rounds
+        )
+        return hashed_password.decode("utf-8")
+
+    async def hash_passwords(self, passwords: Sequence[str]) -> list[str]:
+        slices = [
+            [
+                password.encode("utf-8")
+                for password in passwords[start : start + self.bulk_slice_size]
+            ]
+            for start in range(0, len(passwords), self.bulk_slice_size)
+        ]
+
+        async def hash_slice(passwords_slice: list[bytes]) -> list[bytes]:
+            async with self._bulk_slots:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self.bulk_executor, _hash_passwords, passwords_slice, self.rounds
+                )
+
+        hashed_slices = await asyncio.gather(*map(hash_slice, slices))
+        return [
+            hashed_password.decode("utf-8")
+            for hashed_slice in hashed_slices
+            for hashed_password in hashed_slice
+        ]
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        return await self._run(
+            _check_password, password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+
+    async def shutdown(self) -> None:
+        # Waiting for running hashes blocks, so it happens off the event loop.
+        await asyncio.gather(
+            asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=True),
+            asyncio.to_thread(
+                self.bulk_executor.shutdown, wait=True, cancel_futures=True
+            ),
+        )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            raise PasswordHasherOverloaded(self.max_pending)
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._pending -= 1
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextvars import ContextVar
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+AfterCommit = Callable[[], Awaitable[None]]
+
+# Callbacks of the transaction the current task runs in, run once it commits
+after_commit_callbacks: ContextVar[list[AfterCommit] | None] = ContextVar(
+    "after_commit_callbacks", default=None
+)
+
+
+class BaseTransactionManager(ABC):
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """Run the block atomically, nested blocks join the outer transaction."""
+
+    @property
+    @abstractmethod
+    def in_transaction(self) -> bool: ...
+
+    async def run_after_commit(self, callback: AfterCommit) -> None:
+        """Run ``callback`` once the current transaction has committed, right
+        away outside of one. Callbacks of a rolled back transaction are
+        dropped."""
+        callbacks = after_commit_callbacks.get()
+        if callbacks is None or not self.in_transaction:
+            await callback()
+            return
+
+        callbacks.append(callback)
+
+    @asynccontextmanager
+    async def _running_after_commit(self) -> AsyncIterator[None]:
+        """Wraps the outermost transaction, the block has to commit it."""
+        callbacks: list[AfterCommit] = []
+        token = after_commit_callbacks.set(callbacks)
+        try:
+            yield
+        finally:
+            after_commit_callbacks.reset(token)
+
+        # Every callback runs even if an earlier one fails, the first error
+        # is raised once they all ran
+        errors = []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as error:
+                logger.exception("After commit callback failed")
+                errors.append(error)
+        if errors:
+            raise errors[0]
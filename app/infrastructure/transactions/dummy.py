@@ -0,0 +1,18 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from infrastructure.transactions.base import BaseTransactionManager
+
+
+@dataclass(frozen=True)
+class DummyTransactionManager(BaseTransactionManager):
+    """Runs every block as is, for storages without transactions."""
+
+    @property
+    def in_transaction(self) -> bool:
+        return False
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        yield
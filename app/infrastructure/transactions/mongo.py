@@ -0,0 +1,44 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from motor.core import AgnosticClient, AgnosticClientSession
+from pymongo import WriteConcern
+
+from infrastructure.transactions.base import BaseTransactionManager
+
+
+# Session of the transaction the current task runs in, picked up by every
+# MongoDB repository so their writes commit or abort together.
+current_session: ContextVar[AgnosticClientSession | None] = ContextVar(
+    "current_session", default=None
+)
+
+
+@dataclass(frozen=True)
+class MongoDBTransactionManager(BaseTransactionManager):
+    """Multi-document transactions, requires a replica set or a sharded cluster."""
+
+    client: AgnosticClient
+    # Applies to the commit, the writes of a transaction ignore their own
+    write_concern: WriteConcern = field(default_factory=WriteConcern)
+
+    @property
+    def in_transaction(self) -> bool:
+        return current_session.get() is not None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        if self.in_transaction:
+            yield
+            return
+
+        async with self._running_after_commit():
+            async with await self.client.start_session() as session:
+                async with session.start_transaction(write_concern=self.write_concern):
+                    token = current_session.set(session)
+                    try:
+                        yield
+                    finally:
+                        current_session.reset(token)
@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from infrastructure.transactions.base import BaseTransactionManager
+
+
+# Connection of the transaction the current task runs in, picked up by every
+# SQL repository so their writes commit or roll back together.
+current_connection: ContextVar[AsyncConnection | None] = ContextVar(
+    "current_connection", default=None
+)
+
+
+@dataclass(frozen=True)
+class SQLAlchemyTransactionManager(BaseTransactionManager):
+    engine: AsyncEngine
+
+    @property
+    def in_transaction(self) -> bool:
+        return current_connection.get() is not None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        if self.in_transaction:
+            yield
+            return
+
+        async with self._running_after_commit():
+            async with self.engine.begin() as connection:
+                token = current_connection.set(connection)
+                try:
+                    yield
+                finally:
+                    current_connection.reset(token)
@@ -1,8 +1,10 @@
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
 
-import bcrypt
+import orjson
 
 from domain.entities.users import User, VerificationToken
+from domain.exceptions.base import ApplicationException
 from domain.values.users import Email, Password, Username
 from infrastructure.repositories.users.base import (
     BaseUserRepository,
@@ -11,9 +13,12 @@ from infrastructure.repositories.users.base import (
 from infrastructure.repositories.groups.base import (
     BaseGroupRepository,
 )
+from infrastructure.security.cookies.base import BaseCookieManager
+from infrastructure.security.passwords.base import BasePasswordHasher
 from logic.commands.base import BaseCommand, CommandHandler
 from logic.exceptions.users import (
     InvalidCredentialsException,
+    InvalidUserImportRowException,
     TokenNotFoundException,
     UserAlreadyExistsException,
     UserNotFoundException,
@@ -21,6 +26,7 @@ from logic.exceptions.users import (
 from logic.exceptions.groups import (
     GroupNotFoundException,
 )
+from logic.queries.users import Tokens
 
 
 @dataclass(frozen=True)
@@ -32,12 +38,13 @@ class UserLoginCommand(BaseCommand):
 @dataclass(frozen=True)
 class UserLoginCommandHandler(CommandHandler[UserLoginCommand, User]):
     user_repository: BaseUserRepository
+    password_hasher: BasePasswordHasher
 
     async def handle(self, command: UserLoginCommand) -> User:
         user = await self.user_repository.get_user_by_username(
             username=command.username
         )
-        if user and await self.user_repository.check_password_is_valid(
+        if user and await self.password_hasher.verify_password(
             password=command.password, hashed_password=user.password.as_generic_type()
         ):
             return user
@@ -45,6 +52,55 @@ class UserLoginCommandHandler(CommandHandler[UserLoginCommand, User]):
         raise InvalidCredentialsException()
 
 
+@dataclass(frozen=True)
+class CreateTokensCommand(BaseCommand):
+    user_oid: str
+
+
+@dataclass(frozen=True)
+class CreateTokensCommandHandler(CommandHandler[CreateTokensCommand, Tokens]):
+    """Starts a session for an authenticated user."""
+
+    cookie_manager: BaseCookieManager
+
+    async def handle(self, command: CreateTokensCommand) -> Tokens:
+        access_token, refresh_token = await self.cookie_manager.create_tokens(
+            command.user_oid
+        )
+
+        return Tokens(access_token=access_token, refresh_token=refresh_token)
+
+
+@dataclass(frozen=True)
+class RefreshTokensCommand(BaseCommand):
+    refresh_token: str
+
+
+@dataclass(frozen=True)
+class RefreshTokensCommandHandler(CommandHandler[RefreshTokensCommand, Tokens]):
+    cookie_manager: BaseCookieManager
+
+    async def handle(self, command: RefreshTokensCommand) -> Tokens:
+        access_token, refresh_token = await self.cookie_manager.rotate_refresh_token(
+            command.refresh_token
+        )
+
+        return Tokens(access_token=access_token, refresh_token=refresh_token)
+
+
+@dataclass(frozen=True)
+class UserLogoutCommand(BaseCommand):
+    refresh_token: str
+
+
+@dataclass(frozen=True)
+class UserLogoutCommandHandler(CommandHandler[UserLogoutCommand, None]):
+    cookie_manager: BaseCookieManager
+
+    async def handle(self, command: UserLogoutCommand) -> None:
+        await self.cookie_manager.revoke_refresh_token(command.refresh_token)
+
+
 @dataclass(frozen=True)
 class DeleteUserCommand(BaseCommand):
     user_oid: str
@@ -85,11 +141,13 @@ class VerifyUserCommandHandler(CommandHandler[VerifyUserCommand, None]):
         if not user:
             raise UserNotFoundException(value=command.user_oid)
 
-        if await self.token_repository.check_token_exists(token=command.token):
-            await self.user_repository.verify_user(user_oid=user.oid)
-        else:
+        if not await self.token_repository.check_token_exists(token=command.token):
             raise TokenNotFoundException()
 
+        user.verify()
+        await self.user_repository.verify_user(user_oid=user.oid)
+        await self._mediator.publish(user.pull_events())
+
 
 @dataclass(frozen=True)
 class CreateVerificationTokenCommandHandler(
@@ -124,6 +182,7 @@ class CreateUserCommand(BaseCommand):
 class CreateUserCommandHandler(CommandHandler[CreateUserCommand, User]):
     user_repository: BaseUserRepository
     group_repository: BaseGroupRepository
+    password_hasher: BasePasswordHasher
 
     async def handle(self, command: CreateUserCommand) -> User:
         group = await self.group_repository.get_group_by_oid(
@@ -138,9 +197,7 @@ class CreateUserCommandHandler(CommandHandler[CreateUserCommand, User]):
         ):
             raise UserAlreadyExistsException()
 
-        hashed_password = bcrypt.hashpw(
-            command.password.encode("utf-8"), bcrypt.gensalt()
-        ).decode("utf-8")
+        hashed_password = await self.password_hasher.hash_password(command.password)
 
         new_user = await User.create(
             username=Username(value=command.username),
@@ -153,3 +210,157 @@ class CreateUserCommandHandler(CommandHandler[CreateUserCommand, User]):
         await self._mediator.publish(new_user.pull_events())
 
         return new_user
+
+
+@dataclass(frozen=True)
+class UserImportResult:
+    row: int
+    user_oid: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BulkCreateUsersCommand(BaseCommand):
+    group_oid: str
+    rows: AsyncIterable[bytes]
+
+
+@dataclass(frozen=True)
+class BulkCreateUsersCommandHandler(
+    CommandHandler[BulkCreateUsersCommand, list[UserImportResult]]
+):
+    """Creates users from NDJSON rows, ``chunk_size`` rows at a time.
+
+    Every chunk costs one uniqueness query, one bulk hash, one unordered
+    insert and one batch of events. A bad row only fails itself, the result
+    of each non-blank row is returned in row order. With transactions
+    enabled the whole import is one transaction, so keep imports small
+    enough for its time limit.
+    """
+
+    user_repository: BaseUserRepository
+    group_repository: BaseGroupRepository
+    password_hasher: BasePasswordHasher
+    chunk_size: int = 500
+
+    async def handle(self, command: BulkCreateUsersCommand) -> list[UserImportResult]:
+        group = await self.group_repository.get_group_by_oid(
+            group_oid=command.group_oid
+        )
+
+        if not group:
+            raise GroupNotFoundException(oid=command.group_oid)
+
+        results: list[UserImportResult] = []
+        seen_emails: set[str] = set()
+        seen_usernames: set[str] = set()
+        chunk: list[tuple[int, bytes]] = []
+
+        row = 0
+        async for line in command.rows:
+            row += 1
+            if not line.strip():
+                continue
+
+            chunk.append((row, line))
+            if len(chunk) >= self.chunk_size:
+                results.extend(
+                    await self._import_chunk(
+                        command.group_oid, chunk, seen_emails, seen_usernames
+                    )
+                )
+                chunk = []
+
+        if chunk:
+            results.extend(
+                await self._import_chunk(
+                    command.group_oid, chunk, seen_emails, seen_usernames
+                )
+            )
+
+        return results
+
+    async def _import_chunk(
+        self,
+        group_oid: str,
+        chunk: list[tuple[int, bytes]],
+        seen_emails: set[str],
+        seen_usernames: set[str],
+    ) -> list[UserImportResult]:
+        results: dict[int, UserImportResult] = {}
+        valid_rows: list[tuple[int, Username, Email, str]] = []
+
+        for row, line in chunk:
+            try:
+                data = orjson.loads(line)
+                username = Username(value=data["username"])
+                email = Email(value=data["email"])
+                password = Password(value=data["password"]).as_generic_type()
+            except ApplicationException as e:
+                results[row] = UserImportResult(row=row, error=e.message)
+                continue
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                results[row] = UserImportResult(
+                    row=row, error=InvalidUserImportRowException().message
+                )
+                continue
+
+            # Duplicates within the import itself
+            if email.value in seen_emails or username.value in seen_usernames:
+                results[row] = UserImportResult(
+                    row=row, error=UserAlreadyExistsException().message
+                )
+                continue
+
+            seen_emails.add(email.value)
+            seen_usernames.add(username.value)
+            valid_rows.append((row, username, email, password))
+
+        existing_emails, existing_usernames = (
+            await self.user_repository.get_existing_emails_and_usernames(
+                emails=[email.value for _, _, email, _ in valid_rows],
+                usernames=[username.value for _, username, _, _ in valid_rows],
+            )
+            if valid_rows
+            else (set(), set())
+        )
+        new_rows = []
+        for row, username, email, password in valid_rows:
+            if email.value in existing_emails or username.value in existing_usernames:
+                results[row] = UserImportResult(
+                    row=row, error=UserAlreadyExistsException().message
+                )
+            else:
+                new_rows.append((row, username, email, password))
+
+        hashed_passwords = await self.password_hasher.hash_passwords(
+            [password for _, _, _, password in new_rows]
+        )
+        new_users = [
+            await User.create(
+                username=username,
+                email=email,
+                password=Password(hashed_password),
+                group_id=group_oid,
+            )
+            for (_, username, email, _), hashed_password in zip(
+                new_rows, hashed_passwords
+            )
+        ]
+
+        # Rows that raced with another writer fail on the unique indexes
+        rejected = await self.user_repository.add_users(new_users)
+        events = []
+        for index, ((row, *_), user) in enumerate(zip(new_rows, new_users)):
+            if index in rejected:
+                results[row] = UserImportResult(
+                    row=row, error=UserAlreadyExistsException().message
+                )
+            else:
+                results[row] = UserImportResult(row=row, user_oid=user.oid)
+                events.extend(user.pull_events())
+
+        if events:
+            await self._mediator.publish_batch(events)
+
+        return [results[row] for row, _ in chunk]
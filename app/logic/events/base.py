@@ -1,9 +1,9 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
 from domain.events.base import BaseEvent
-from infrastructure.message_brokers.base import BaseMessageBroker
 
 
 ET = TypeVar("ET", bound=BaseEvent)
@@ -11,8 +11,10 @@ ER = TypeVar("ER", bound=Any)
 
 
 @dataclass
-class EventHandler(ABC, Generic[ET, ER]):
-    message_broker: BaseMessageBroker
-    broker_topic: str | None = None
+class BaseEventHandler(ABC, Generic[ET, ER]):
+    @abstractmethod
+    async def handle(self, event: ET) -> ER: ...
 
-    def handle(self, event: ET) -> ER: ...
+    async def handle_batch(self, events: Sequence[ET]) -> list[ER]:
+        """Handle events of one type at once, one by one unless overridden."""
+        return [await self.handle(event) for event in events]
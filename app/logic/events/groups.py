@@ -4,25 +4,27 @@ from domain.events.groups import (
     GroupDeletedEvent,
     GroupCreatedEvent,
 )
-from infrastructure.message_brokers.converters import convert_event_to_broker_message
-from logic.events.base import EventHandler
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.tags import GROUPS_CACHE_TAG, build_group_cache_tag
+from infrastructure.repositories.groups.cached import GroupEntityCache
+from logic.events.base import BaseEventHandler
 
 
 @dataclass
-class NewGroupCreatedEventHandler(EventHandler[GroupCreatedEvent, None]):
-    async def handle(self, event: GroupCreatedEvent) -> None:
-        await self.message_broker.send_message(
-            topic=self.broker_topic,
-            value=convert_event_to_broker_message(event=event),
-            key=event.event_id.encode(),
+class InvalidateGroupsCacheEventHandler(
+    BaseEventHandler[GroupCreatedEvent | GroupDeletedEvent, None]
+):
+    cache_service: AbstractCacheService
+
+    async def handle(self, event: GroupCreatedEvent | GroupDeletedEvent) -> None:
+        await self.cache_service.invalidate_tags(
+            GROUPS_CACHE_TAG, build_group_cache_tag(event.group_oid)
         )
 
 
 @dataclass
-class GroupDeletedEventHandler(EventHandler[GroupDeletedEvent, None]):
+class EvictGroupEntityCacheEventHandler(BaseEventHandler[GroupDeletedEvent, None]):
+    group_cache: GroupEntityCache
+
     async def handle(self, event: GroupDeletedEvent) -> None:
-        await self.message_broker.send_message(
-            topic=self.broker_topic,
-            value=convert_event_to_broker_message(event=event),
-            key=event.event_id.encode(),
-        )
+        await self.group_cache.evict(event.group_oid)
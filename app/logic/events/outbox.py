@@ -0,0 +1,38 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from domain.events.base import BaseEvent
+from infrastructure.message_brokers.converters import convert_event_to_broker_message
+from infrastructure.repositories.outbox.base import BaseOutboxRepository, OutboxMessage
+from logic.events.base import BaseEventHandler
+
+
+@dataclass
+class OutboxEventHandler(BaseEventHandler[BaseEvent, None]):
+    """Stores the event for the outbox relay instead of sending it right away.
+
+    Runs inside the command's transaction, so the event is persisted if and
+    only if the aggregate change is. Messages are keyed by ``aggregate_oid``,
+    the events of one aggregate share a partition and are consumed in order.
+    """
+
+    outbox_repository: BaseOutboxRepository
+    broker_topic: str
+    aggregate_oid: Callable[[BaseEvent], str]
+    convert_event: Callable[[BaseEvent], bytes] = convert_event_to_broker_message
+
+    def _build_message(self, event: BaseEvent) -> OutboxMessage:
+        return OutboxMessage(
+            topic=self.broker_topic,
+            key=self.aggregate_oid(event).encode(),
+            value=self.convert_event(event),
+        )
+
+    async def handle(self, event: BaseEvent) -> None:
+        await self.outbox_repository.add_message(self._build_message(event))
+
+    async def handle_batch(self, events: Sequence[BaseEvent]) -> list[None]:
+        await self.outbox_repository.add_messages(
+            [self._build_message(event) for event in events]
+        )
+        return [None] * len(events)
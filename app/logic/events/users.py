@@ -1,41 +1,81 @@
+from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from domain.events.users import (
     UserCreatedEvent,
     UserDeletedEvent,
-    VerificationTokenCreatedEvent,
+    UserVerifiedEvent,
 )
-from infrastructure.message_brokers.converters import convert_event_to_broker_message
-from logic.events.base import EventHandler
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.tags import build_group_cache_tag
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.users.cached import UserEntityCache
+from infrastructure.security.cookies.base import BaseCookieManager
+from logic.events.base import BaseEventHandler
 
 
 @dataclass
-class NewUserCreatedEventHandler(EventHandler[UserCreatedEvent, None]):
+class IncrementGroupUsersCountEventHandler(BaseEventHandler[UserCreatedEvent, None]):
+    group_repository: BaseGroupRepository
+
     async def handle(self, event: UserCreatedEvent) -> None:
-        await self.message_broker.send_message(
-            topic=self.broker_topic,
-            value=convert_event_to_broker_message(event=event),
-            key=event.event_id.encode(),
+        await self.group_repository.update_users_count(
+            group_oid=event.group_oid, delta=1
         )
 
+    async def handle_batch(self, events: Sequence[UserCreatedEvent]) -> list[None]:
+        # One update per group instead of one per user
+        for group_oid, delta in Counter(event.group_oid for event in events).items():
+            await self.group_repository.update_users_count(
+                group_oid=group_oid, delta=delta
+            )
+        return [None] * len(events)
+
 
 @dataclass
-class UserDeletedEventHandler(EventHandler[UserDeletedEvent, None]):
+class DecrementGroupUsersCountEventHandler(BaseEventHandler[UserDeletedEvent, None]):
+    group_repository: BaseGroupRepository
+
     async def handle(self, event: UserDeletedEvent) -> None:
-        await self.message_broker.send_message(
-            topic=self.broker_topic,
-            value=convert_event_to_broker_message(event=event),
-            key=event.event_id.encode(),
+        await self.group_repository.update_users_count(
+            group_oid=event.group_oid, delta=-1
         )
 
 
 @dataclass
-class VerificationTokenCreatedEventHandler(
-    EventHandler[VerificationTokenCreatedEvent, None]
+class InvalidateGroupUsersCacheEventHandler(
+    BaseEventHandler[UserCreatedEvent | UserDeletedEvent | UserVerifiedEvent, None]
 ):
-    async def handle(self, event: VerificationTokenCreatedEvent) -> None:
-        await self.message_broker.send_message(
-            topic=self.broker_topic,
-            value=convert_event_to_broker_message(event=event),
-            key=event.event_id.encode(),
+    cache_service: AbstractCacheService
+
+    async def handle(
+        self, event: UserCreatedEvent | UserDeletedEvent | UserVerifiedEvent
+    ) -> None:
+        await self.cache_service.invalidate_tags(build_group_cache_tag(event.group_oid))
+
+    async def handle_batch(
+        self, events: Sequence[UserCreatedEvent | UserDeletedEvent | UserVerifiedEvent]
+    ) -> list[None]:
+        await self.cache_service.invalidate_tags(
+            *{build_group_cache_tag(event.group_oid) for event in events}
         )
+        return [None] * len(events)
+
+
+@dataclass
+class EvictUserEntityCacheEventHandler(
+    BaseEventHandler[UserDeletedEvent | UserVerifiedEvent, None]
+):
+    user_cache: UserEntityCache
+
+    async def handle(self, event: UserDeletedEvent | UserVerifiedEvent) -> None:
+        await self.user_cache.evict(event.user_oid)
+
+
+@dataclass
+class RevokeUserTokensEventHandler(BaseEventHandler[UserDeletedEvent, None]):
+    cookie_manager: BaseCookieManager
+
+    async def handle(self, event: UserDeletedEvent) -> None:
+        await self.cookie_manager.revoke_user_tokens(event.user_oid)
@@ -28,3 +28,33 @@ class QueryHandlersNotRegisteredException(LogicException):
     @property
     def message(self):
         return f"Could not find handlers for the query: {self.query_type}"
+
+
+@dataclass(eq=False)
+class MediatorFrozenException(LogicException):
+    @property
+    def message(self):
+        return "Handlers can not be registered after the mediator was frozen"
+
+
+@dataclass(eq=False)
+class EventHandlerTimeoutException(LogicException):
+    handler_name: str
+    timeout: float
+
+    @property
+    def message(self):
+        return f"Event handler {self.handler_name} timed out after {self.timeout}s"
+
+
+@dataclass(eq=False)
+class HandlersFailedException(LogicException):
+    message_type: type
+    errors: tuple[Exception, ...]
+
+    @property
+    def message(self):
+        return (
+            f"{len(self.errors)} handlers failed for {self.message_type}: "
+            + "; ".join(repr(error) for error in self.errors)
+        )
@@ -48,3 +48,14 @@ class InvalidCredentialsException(LogicException):
     @property
     def status_code(self) -> int:
         return HTTPStatus.UNAUTHORIZED.value
+
+
+@dataclass(eq=False)
+class InvalidUserImportRowException(LogicException):
+    @property
+    def message(self) -> str:
+        return "Row is not a JSON object with username, email and password"
+
+    @property
+    def status_code(self) -> int:
+        return HTTPStatus.UNPROCESSABLE_ENTITY.value
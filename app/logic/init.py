@@ -1,21 +1,46 @@
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from functools import lru_cache
-from uuid import uuid4
+from operator import attrgetter
+from pathlib import Path
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
 from punq import Container, Scope
 
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import WriteConcern
+from pymongo.read_preferences import (
+    _ServerMode,
+    make_read_preference,
+    read_pref_mode_from_name,
+)
+from redis.asyncio import ConnectionPool, Redis
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from domain.events.base import BaseEvent
 from domain.events.users import (
     UserCreatedEvent,
     UserDeletedEvent,
+    UserVerifiedEvent,
     VerificationTokenCreatedEvent,
 )
 from domain.events.groups import (
     GroupDeletedEvent,
     GroupCreatedEvent,
 )
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.local import LocalCache
+from infrastructure.cache.redis import RedisCacheService
+from infrastructure.mail.base import BaseMailSender
+from infrastructure.mail.dummy import DummyMailSender
+from infrastructure.mail.smtp import SMTPMailSender
 from infrastructure.message_brokers.base import BaseMessageBroker
+from infrastructure.message_brokers.converters import (
+    convert_event_to_binary_message,
+    convert_event_to_broker_message,
+)
 from infrastructure.message_brokers.kafka import KafkaMessageBroker
+from infrastructure.message_brokers.outbox_relay import OutboxRelay
 from infrastructure.repositories.users.base import (
     BaseUserRepository,
     BaseVerificationTokenRepository,
@@ -23,24 +48,79 @@ from infrastructure.repositories.users.base import (
 from infrastructure.repositories.groups.base import (
     BaseGroupRepository,
 )
+from infrastructure.repositories.groups.cached import (
+    CachedGroupRepository,
+    GroupEntityCache,
+)
+from infrastructure.repositories.users.cached import (
+    CachedUserRepository,
+    UserEntityCache,
+)
+from infrastructure.repositories.users.memory_repository import (
+    InMemoryUserRepository,
+    InMemoryVerificationTokenRepository,
+)
+from infrastructure.repositories.users.sql import (
+    SQLAlchemyUserRepository,
+    SQLAlchemyVerificationTokenRepository,
+)
 from infrastructure.repositories.users.mongo import (
     MongoDBUserRepository,
     MongoDBVerificationTokenRepository,
 )
+from infrastructure.repositories.groups.memory_repository import (
+    InMemoryGroupRepository,
+)
+from infrastructure.repositories.groups.sql import SQLAlchemyGroupRepository
 from infrastructure.repositories.groups.mongo import (
     MongoDBGroupRepository,
 )
+from infrastructure.repositories.common.indexes import MongoDBIndexManager
+from infrastructure.repositories.common.schema import SQLAlchemySchemaManager
+from infrastructure.repositories.common.operation_log import (
+    BaseOperationLog,
+    DummyOperationLog,
+    FileOperationLog,
+)
+from infrastructure.repositories.outbox.base import BaseOutboxRepository
+from infrastructure.repositories.outbox.memory_repository import (
+    InMemoryOutboxRepository,
+)
+from infrastructure.repositories.outbox.mongo import MongoDBOutboxRepository
+from infrastructure.repositories.outbox.sql import SQLAlchemyOutboxRepository
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.read_models.primary import PrimaryReadModel
+from infrastructure.repositories.read_models.redis import RedisReadModel
+from infrastructure.repositories.refresh_tokens.base import BaseRefreshTokenRepository
+from infrastructure.repositories.refresh_tokens.redis import (
+    RedisRefreshTokenRepository,
+)
 from infrastructure.security.cookies.base import BaseCookieManager
 from infrastructure.security.cookies.jwt import PyJWTCookieManager
+from infrastructure.security.cookies.revocation import TokenRevocationList
+from infrastructure.security.passwords.base import BasePasswordHasher
+from infrastructure.security.passwords.bcrypt import BcryptPasswordHasher
+from infrastructure.transactions.base import BaseTransactionManager
+from infrastructure.transactions.dummy import DummyTransactionManager
+from infrastructure.transactions.mongo import MongoDBTransactionManager
+from infrastructure.transactions.sqlalchemy import SQLAlchemyTransactionManager
 from logic.commands.users import (
+    BulkCreateUsersCommand,
+    BulkCreateUsersCommandHandler,
+    CreateTokensCommand,
+    CreateTokensCommandHandler,
     CreateUserCommand,
     CreateUserCommandHandler,
     CreateVerificationTokenCommand,
     CreateVerificationTokenCommandHandler,
     DeleteUserCommand,
     DeleteUserCommandHandler,
+    RefreshTokensCommand,
+    RefreshTokensCommandHandler,
     UserLoginCommand,
     UserLoginCommandHandler,
+    UserLogoutCommand,
+    UserLogoutCommandHandler,
     VerifyUserCommand,
     VerifyUserCommandHandler,
 )
@@ -51,16 +131,20 @@ from logic.commands.groups import (
     DeleteGroupCommandHandler,
 )
 from logic.events.users import (
-    NewUserCreatedEventHandler,
-    UserDeletedEventHandler,
-    VerificationTokenCreatedEventHandler,
+    DecrementGroupUsersCountEventHandler,
+    EvictUserEntityCacheEventHandler,
+    IncrementGroupUsersCountEventHandler,
+    InvalidateGroupUsersCacheEventHandler,
+    RevokeUserTokensEventHandler,
 )
 from logic.events.groups import (
-    GroupDeletedEventHandler,
-    NewGroupCreatedEventHandler,
+    EvictGroupEntityCacheEventHandler,
+    InvalidateGroupsCacheEventHandler,
 )
+from logic.events.outbox import OutboxEventHandler
 from logic.mediator.base import Mediator
 from logic.mediator.event import EventMediator
+from logic.mediator.supervisor import BackgroundTaskSupervisor
 from logic.queries.groups import (
     GetGroupQuery,
     GetGroupQueryHandler,
@@ -68,10 +152,12 @@ from logic.queries.groups import (
     GetGroupsQueryHandler,
 )
 from logic.queries.users import (
-    GetTokensQuery,
-    GetTokensQueryHandler,
+    ExportGroupUsersQuery,
+    ExportGroupUsersQueryHandler,
     GetUserQuery,
     GetUserQueryHandler,
+    GetUsersByOidsQuery,
+    GetUsersByOidsQueryHandler,
     GetUsersQuery,
     GetUsersQueryHandler,
 )
@@ -92,19 +178,48 @@ def _init_container() -> Container:
 
     def create_mongodb_client():
         return AsyncIOMotorClient(
-            settings.mongo_db_connection_uri, serverSelectionTimeoutMS=3000
+            settings.mongo_db_connection_uri,
+            serverSelectionTimeoutMS=3000,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            compressors=settings.mongodb_compressors,
         )
 
     container.register(
         AsyncIOMotorClient, factory=create_mongodb_client, scope=Scope.singleton
     )
+
+    def create_sql_engine() -> AsyncEngine:
+        url = make_url(settings.sql_database_url)
+        if url.get_backend_name() == "sqlite":
+            return create_async_engine(url)
+
+        return create_async_engine(
+            url,
+            pool_size=settings.sql_pool_size,
+            max_overflow=settings.sql_max_overflow,
+            pool_recycle=settings.sql_pool_recycle,
+        )
+
+    container.register(AsyncEngine, factory=create_sql_engine, scope=Scope.singleton)
     client = container.resolve(AsyncIOMotorClient)
 
+    def init_read_preference(name: str) -> _ServerMode:
+        return make_read_preference(read_pref_mode_from_name(name), tag_sets=None)
+
     def init_group_mongodb_repository() -> BaseGroupRepository:
         return MongoDBGroupRepository(
             mongo_db_client=client,
             mongo_db_db_name=settings.mongodb_group_database,
             mongo_db_collection_name=settings.mongodb_group_collection,
+            listing_read_preference=init_read_preference(
+                settings.mongodb_group_read_preference
+            ),
+            write_concern=WriteConcern(
+                w=settings.mongodb_group_write_concern_w,
+                j=settings.mongodb_group_write_concern_j,
+            ),
         )
 
     def init_user_mongodb_repository() -> BaseUserRepository:
@@ -112,6 +227,13 @@ def _init_container() -> Container:
             mongo_db_client=client,
             mongo_db_db_name=settings.mongodb_group_database,
             mongo_db_collection_name=settings.mongodb_user_collection,
+            listing_read_preference=init_read_preference(
+                settings.mongodb_user_read_preference
+            ),
+            write_concern=WriteConcern(
+                w=settings.mongodb_user_write_concern_w,
+                j=settings.mongodb_user_write_concern_j,
+            ),
         )
 
     def init_verification_token_mongodb_repository() -> BaseVerificationTokenRepository:
@@ -119,6 +241,69 @@ def _init_container() -> Container:
             mongo_db_client=client,
             mongo_db_db_name=settings.mongodb_group_database,
             mongo_db_collection_name=settings.mongodb_verification_token_collection,
+            write_concern=WriteConcern(
+                w=settings.mongodb_user_write_concern_w,
+                j=settings.mongodb_user_write_concern_j,
+            ),
+        )
+
+    def init_outbox_mongodb_repository() -> BaseOutboxRepository:
+        return MongoDBOutboxRepository(
+            mongo_db_client=client,
+            mongo_db_db_name=settings.mongodb_group_database,
+            mongo_db_collection_name=settings.mongodb_outbox_collection,
+            write_concern=WriteConcern(
+                w=settings.mongodb_outbox_write_concern_w,
+                j=settings.mongodb_outbox_write_concern_j,
+            ),
+        )
+
+    def init_index_manager() -> MongoDBIndexManager:
+        if settings.storage_backend != "mongodb":
+            return MongoDBIndexManager(repositories=[])
+
+        return MongoDBIndexManager(
+            repositories=[
+                init_group_mongodb_repository(),
+                init_user_mongodb_repository(),
+                init_verification_token_mongodb_repository(),
+                init_outbox_mongodb_repository(),
+            ]
+        )
+
+    def init_transaction_manager() -> BaseTransactionManager:
+        if settings.storage_backend == "sqlalchemy":
+            return SQLAlchemyTransactionManager(engine=container.resolve(AsyncEngine))
+
+        if settings.mongodb_use_transactions and settings.storage_backend == "mongodb":
+            return MongoDBTransactionManager(
+                client=client,
+                write_concern=WriteConcern(
+                    w=settings.mongodb_transaction_write_concern_w,
+                    j=settings.mongodb_transaction_write_concern_j,
+                ),
+            )
+
+        return DummyTransactionManager()
+
+    def init_redis_client() -> Redis:
+        return Redis(
+            connection_pool=ConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_max_connections,
+            )
+        )
+
+    def init_refresh_token_repository() -> BaseRefreshTokenRepository:
+        return RedisRefreshTokenRepository(client=container.resolve(Redis))
+
+    def init_token_revocation_list() -> TokenRevocationList:
+        return TokenRevocationList(
+            token_repository=container.resolve(BaseRefreshTokenRepository),
+            window=settings.access_token_expire_minutes * 60,
+            sync_interval=settings.token_revocation_sync_interval,
+            bloom_size=settings.token_revocation_bloom_size,
+            bloom_hashes=settings.token_revocation_bloom_hashes,
         )
 
     def init_cookie_manager() -> BaseCookieManager:
@@ -127,24 +312,218 @@ def _init_container() -> Container:
             _algorithm=settings.algorithm,
             _access_token_expire_minutes=settings.access_token_expire_minutes,
             _refresh_token_expire_days=settings.refresh_token_expire_days,
+            _refresh_token_repository=container.resolve(BaseRefreshTokenRepository),
+            _revocation_list=container.resolve(TokenRevocationList),
+            _public_key=settings.token_public_key,
+            _key_id=settings.token_key_id,
+            _verification_cache_maxsize=settings.token_verification_cache_maxsize,
+        )
+
+    def init_cache_service() -> AbstractCacheService:
+        return RedisCacheService(client=container.resolve(Redis))
+
+    def init_local_cache() -> LocalCache:
+        return LocalCache(
+            maxsize=settings.entity_cache_local_maxsize,
+            ttl=settings.entity_cache_local_ttl,
+        )
+
+    def init_group_entity_cache() -> GroupEntityCache:
+        return GroupEntityCache(
+            cache_service=container.resolve(AbstractCacheService),
+            local_cache=init_local_cache(),
+            ttl=settings.entity_cache_ttl,
+        )
+
+    def init_user_entity_cache() -> UserEntityCache:
+        return UserEntityCache(
+            cache_service=container.resolve(AbstractCacheService),
+            local_cache=init_local_cache(),
+            ttl=settings.entity_cache_ttl,
+        )
+
+    def init_operation_log(name: str) -> BaseOperationLog:
+        if settings.memory_repository_data_dir is None:
+            return DummyOperationLog()
+
+        return FileOperationLog(
+            directory=Path(settings.memory_repository_data_dir),
+            name=name,
+            fsync_interval=settings.memory_repository_fsync_interval,
+            snapshot_interval=settings.memory_repository_snapshot_interval,
+        )
+
+    def init_group_repository() -> BaseGroupRepository:
+        if settings.storage_backend == "memory":
+            return InMemoryGroupRepository(
+                shards=settings.memory_repository_shards,
+                operation_log=init_operation_log("groups"),
+            )
+
+        repository: BaseGroupRepository
+        if settings.storage_backend == "sqlalchemy":
+            repository = SQLAlchemyGroupRepository(
+                engine=container.resolve(AsyncEngine)
+            )
+        else:
+            repository = init_group_mongodb_repository()
+
+        return CachedGroupRepository(
+            repository=repository,
+            transaction_manager=container.resolve(BaseTransactionManager),
+            cache=container.resolve(GroupEntityCache),
+            max_batch_size=settings.entity_loader_max_batch_size,
+        )
+
+    def init_user_repository() -> BaseUserRepository:
+        if settings.storage_backend == "memory":
+            return InMemoryUserRepository(
+                shards=settings.memory_repository_shards,
+                operation_log=init_operation_log("users"),
+            )
+
+        repository: BaseUserRepository
+        if settings.storage_backend == "sqlalchemy":
+            repository = SQLAlchemyUserRepository(engine=container.resolve(AsyncEngine))
+        else:
+            repository = init_user_mongodb_repository()
+
+        return CachedUserRepository(
+            repository=repository,
+            transaction_manager=container.resolve(BaseTransactionManager),
+            cache=container.resolve(UserEntityCache),
+            max_batch_size=settings.entity_loader_max_batch_size,
+        )
+
+    def init_read_model() -> BaseReadModel:
+        if settings.read_model_backend == "primary":
+            return PrimaryReadModel(
+                user_repository=container.resolve(BaseUserRepository),
+                group_repository=container.resolve(BaseGroupRepository),
+            )
+
+        if settings.read_model_redis_url is None:
+            client = container.resolve(Redis)
+        else:
+            client = Redis(
+                connection_pool=ConnectionPool.from_url(
+                    settings.read_model_redis_url,
+                    max_connections=settings.redis_max_connections,
+                )
+            )
+
+        return RedisReadModel(
+            client=client, tombstone_ttl=settings.read_model_tombstone_ttl
+        )
+
+    def init_mail_sender() -> BaseMailSender:
+        if settings.smtp_host is None:
+            return DummyMailSender()
+
+        return SMTPMailSender(
+            host=settings.smtp_host,
+            port=settings.smtp_port,
+            sender=settings.smtp_sender,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+        )
+
+    def init_password_hasher_executor(max_workers: int, name: str) -> Executor:
+        if settings.password_hasher_executor == "process":
+            return ProcessPoolExecutor(max_workers=max_workers)
+
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    def init_password_hasher() -> BasePasswordHasher:
+        return BcryptPasswordHasher(
+            executor=init_password_hasher_executor(
+                settings.password_hasher_max_workers, "password-hasher"
+            ),
+            max_pending=settings.password_hasher_max_pending,
+            rounds=settings.password_hasher_rounds,
+            bulk_executor=init_password_hasher_executor(
+                settings.password_hasher_bulk_max_workers, "password-hasher-bulk"
+            ),
+            bulk_max_pending=settings.password_hasher_bulk_max_pending,
         )
 
+    container.register(
+        GroupEntityCache, factory=init_group_entity_cache, scope=Scope.singleton
+    )
+    container.register(
+        UserEntityCache, factory=init_user_entity_cache, scope=Scope.singleton
+    )
     container.register(
         BaseGroupRepository,
-        factory=init_group_mongodb_repository,
+        factory=init_group_repository,
         scope=Scope.singleton,
     )
     container.register(
-        BaseUserRepository, factory=init_user_mongodb_repository, scope=Scope.singleton
+        BaseUserRepository, factory=init_user_repository, scope=Scope.singleton
+    )
+    container.register(BaseReadModel, factory=init_read_model, scope=Scope.singleton)
+    if settings.storage_backend == "memory":
+        container.register(
+            BaseVerificationTokenRepository,
+            instance=InMemoryVerificationTokenRepository(),
+        )
+        container.register(BaseOutboxRepository, instance=InMemoryOutboxRepository())
+    elif settings.storage_backend == "sqlalchemy":
+        container.register(
+            BaseVerificationTokenRepository,
+            factory=lambda: SQLAlchemyVerificationTokenRepository(
+                engine=container.resolve(AsyncEngine)
+            ),
+            scope=Scope.singleton,
+        )
+        container.register(
+            BaseOutboxRepository,
+            factory=lambda: SQLAlchemyOutboxRepository(
+                engine=container.resolve(AsyncEngine)
+            ),
+            scope=Scope.singleton,
+        )
+    else:
+        container.register(
+            BaseVerificationTokenRepository,
+            factory=init_verification_token_mongodb_repository,
+            scope=Scope.singleton,
+        )
+        container.register(
+            BaseOutboxRepository,
+            factory=init_outbox_mongodb_repository,
+            scope=Scope.singleton,
+        )
+    container.register(
+        BaseTransactionManager, factory=init_transaction_manager, scope=Scope.singleton
     )
     container.register(
-        BaseVerificationTokenRepository,
-        factory=init_verification_token_mongodb_repository,
+        MongoDBIndexManager, factory=init_index_manager, scope=Scope.singleton
+    )
+    container.register(
+        SQLAlchemySchemaManager,
+        factory=lambda: SQLAlchemySchemaManager(engine=container.resolve(AsyncEngine)),
+        scope=Scope.singleton,
+    )
+    container.register(Redis, factory=init_redis_client, scope=Scope.singleton)
+    container.register(
+        BaseRefreshTokenRepository,
+        factory=init_refresh_token_repository,
         scope=Scope.singleton,
     )
+    container.register(
+        TokenRevocationList, factory=init_token_revocation_list, scope=Scope.singleton
+    )
     container.register(
         BaseCookieManager, factory=init_cookie_manager, scope=Scope.singleton
     )
+    container.register(
+        BasePasswordHasher, factory=init_password_hasher, scope=Scope.singleton
+    )
+    container.register(BaseMailSender, factory=init_mail_sender, scope=Scope.singleton)
+    container.register(
+        AbstractCacheService, factory=init_cache_service, scope=Scope.singleton
+    )
 
     # Command handlers
     container.register(CreateGroupCommandHandler)
@@ -154,17 +533,26 @@ def _init_container() -> Container:
 
     # Query Handlers
     container.register(GetGroupQueryHandler)
-    container.register(GetUsersQueryHandler)
-    container.register(GetGroupsQueryHandler)
+    container.register(GetUsersQueryHandler, cache_ttl=settings.get_users_cache_ttl)
+    container.register(GetGroupsQueryHandler, cache_ttl=settings.get_groups_cache_ttl)
     container.register(GetUserQueryHandler)
-    container.register(GetTokensQueryHandler)
+    container.register(GetUsersByOidsQueryHandler)
+    container.register(
+        ExportGroupUsersQueryHandler, batch_size=settings.user_export_batch_size
+    )
 
     def create_message_broker() -> BaseMessageBroker:
         return KafkaMessageBroker(
-            producer=AIOKafkaProducer(bootstrap_servers=settings.kafka_url),
+            producer=AIOKafkaProducer(
+                bootstrap_servers=settings.kafka_url,
+                linger_ms=settings.kafka_producer_linger_ms,
+                max_batch_size=settings.kafka_producer_max_batch_size,
+                compression_type=settings.kafka_producer_compression_type,
+                enable_idempotence=settings.kafka_producer_enable_idempotence,
+            ),
             consumer=AIOKafkaConsumer(
                 bootstrap_servers=settings.kafka_url,
-                group_id=f"{uuid4()}",
+                group_id=settings.kafka_consumer_group_id,
                 metadata_max_age_ms=30000,
             ),
         )
@@ -174,127 +562,254 @@ def _init_container() -> Container:
         BaseMessageBroker, factory=create_message_broker, scope=Scope.singleton
     )
 
+    def init_outbox_relay() -> OutboxRelay:
+        return OutboxRelay(
+            outbox_repository=container.resolve(BaseOutboxRepository),
+            message_broker=container.resolve(BaseMessageBroker),
+            batch_size=settings.outbox_relay_batch_size,
+            poll_interval=settings.outbox_relay_poll_interval,
+        )
+
+    container.register(OutboxRelay, factory=init_outbox_relay, scope=Scope.singleton)
+
     # Mediator
-    def init_mediator() -> Mediator:
-        mediator = Mediator()
+    container.register(
+        BackgroundTaskSupervisor,
+        instance=BackgroundTaskSupervisor(max_tasks=settings.background_tasks_max),
+        scope=Scope.singleton,
+    )
+    container.register(
+        Mediator, factory=lambda: init_mediator(container), scope=Scope.singleton
+    )
+    container.register(EventMediator, factory=lambda: container.resolve(Mediator))
 
-        # Command Handlers
-        create_group_handler = CreateGroupCommandHandler(
-            _mediator=mediator, group_repository=container.resolve(BaseGroupRepository)
-        )
-        create_user_handler = CreateUserCommandHandler(
-            _mediator=mediator,
-            user_repository=container.resolve(BaseUserRepository),
-            group_repository=container.resolve(BaseGroupRepository),
-        )
-        delete_group_handler = DeleteGroupCommandHandler(
-            _mediator=mediator, group_repository=container.resolve(BaseGroupRepository)
-        )
-        delete_user_handler = DeleteUserCommandHandler(
-            _mediator=mediator, user_repository=container.resolve(BaseUserRepository)
-        )
-        user_login_handler = UserLoginCommandHandler(
-            _mediator=mediator, user_repository=container.resolve(BaseUserRepository)
-        )
-        verify_user_handler = VerifyUserCommandHandler(
-            _mediator=mediator,
-            user_repository=container.resolve(BaseUserRepository),
-            token_repository=container.resolve(BaseVerificationTokenRepository),
-        )
-        create_verification_token_handler = CreateVerificationTokenCommandHandler(
-            _mediator=mediator,
-            user_repository=container.resolve(BaseUserRepository),
-            token_repository=container.resolve(BaseVerificationTokenRepository),
-        )
+    return container
 
-        mediator.register_command(
-            CreateGroupCommand,
-            [create_group_handler],
-        )
-        mediator.register_command(
-            CreateUserCommand,
-            [create_user_handler],
-        )
-        mediator.register_command(
-            DeleteGroupCommand,
-            [delete_group_handler],
-        )
-        mediator.register_command(
-            DeleteUserCommand,
-            [delete_user_handler],
-        )
-        mediator.register_command(
-            UserLoginCommand,
-            [user_login_handler],
-        )
-        mediator.register_command(
-            VerifyUserCommand,
-            [verify_user_handler],
-        )
-        mediator.register_command(
-            CreateVerificationTokenCommand, [create_verification_token_handler]
-        )
 
-        # Event Handlers
-        new_group_created_event_handler = NewGroupCreatedEventHandler(
-            broker_topic=settings.new_group_event_topic,
-            message_broker=container.resolve(BaseMessageBroker),
-        )
-        new_user_created_event_handler = NewUserCreatedEventHandler(
-            broker_topic=settings.new_user_event_topic,
-            message_broker=container.resolve(BaseMessageBroker),
-        )
-        group_deleted_event_handler = GroupDeletedEventHandler(
-            broker_topic=settings.group_deleted_event_topic,
-            message_broker=container.resolve(BaseMessageBroker),
-        )
-        user_deleted_event_handler = UserDeletedEventHandler(
-            broker_topic=settings.user_deleted_event_topic,
-            message_broker=container.resolve(BaseMessageBroker),
-        )
-        verification_token_created_event_handler = VerificationTokenCreatedEventHandler(
-            broker_topic=settings.verification_token_event_topic,
-            message_broker=container.resolve(BaseMessageBroker),
-        )
-        mediator.register_event(
-            GroupCreatedEvent,
-            [new_group_created_event_handler],
-        )
-        mediator.register_event(
-            UserCreatedEvent,
-            [new_user_created_event_handler],
-        )
-        mediator.register_event(GroupDeletedEvent, [group_deleted_event_handler])
-        mediator.register_event(UserDeletedEvent, [user_deleted_event_handler])
-        mediator.register_event(
-            VerificationTokenCreatedEvent, [verification_token_created_event_handler]
-        )
+def init_mediator(container: Container) -> Mediator:
+    settings: Settings = container.resolve(Settings)
+    mediator = Mediator(
+        handler_timeout=settings.event_handler_timeout,
+        supervisor=container.resolve(BackgroundTaskSupervisor),
+        transaction_manager=container.resolve(BaseTransactionManager),
+    )
 
-        # Query Handlers
-        mediator.register_query(
-            GetGroupQuery,
-            container.resolve(GetGroupQueryHandler),
-        )
-        mediator.register_query(
-            GetGroupsQuery,
-            container.resolve(GetGroupsQueryHandler),
-        )
-        mediator.register_query(
-            GetUsersQuery,
-            container.resolve(GetUsersQueryHandler),
-        )
-        mediator.register_query(
-            GetUserQuery,
-            container.resolve(GetUserQueryHandler),
-        )
+    # Command Handlers
+    create_group_handler = CreateGroupCommandHandler(
+        _mediator=mediator, group_repository=container.resolve(BaseGroupRepository)
+    )
+    create_user_handler = CreateUserCommandHandler(
+        _mediator=mediator,
+        user_repository=container.resolve(BaseUserRepository),
+        group_repository=container.resolve(BaseGroupRepository),
+        password_hasher=container.resolve(BasePasswordHasher),
+    )
+    bulk_create_users_handler = BulkCreateUsersCommandHandler(
+        _mediator=mediator,
+        user_repository=container.resolve(BaseUserRepository),
+        group_repository=container.resolve(BaseGroupRepository),
+        password_hasher=container.resolve(BasePasswordHasher),
+        chunk_size=settings.user_import_chunk_size,
+    )
+    delete_group_handler = DeleteGroupCommandHandler(
+        _mediator=mediator, group_repository=container.resolve(BaseGroupRepository)
+    )
+    delete_user_handler = DeleteUserCommandHandler(
+        _mediator=mediator, user_repository=container.resolve(BaseUserRepository)
+    )
+    user_login_handler = UserLoginCommandHandler(
+        _mediator=mediator,
+        user_repository=container.resolve(BaseUserRepository),
+        password_hasher=container.resolve(BasePasswordHasher),
+    )
+    create_tokens_handler = CreateTokensCommandHandler(
+        _mediator=mediator, cookie_manager=container.resolve(BaseCookieManager)
+    )
+    refresh_tokens_handler = RefreshTokensCommandHandler(
+        _mediator=mediator, cookie_manager=container.resolve(BaseCookieManager)
+    )
+    user_logout_handler = UserLogoutCommandHandler(
+        _mediator=mediator, cookie_manager=container.resolve(BaseCookieManager)
+    )
+    verify_user_handler = VerifyUserCommandHandler(
+        _mediator=mediator,
+        user_repository=container.resolve(BaseUserRepository),
+        token_repository=container.resolve(BaseVerificationTokenRepository),
+    )
+    create_verification_token_handler = CreateVerificationTokenCommandHandler(
+        _mediator=mediator,
+        user_repository=container.resolve(BaseUserRepository),
+        token_repository=container.resolve(BaseVerificationTokenRepository),
+    )
+
+    mediator.register_command(
+        CreateGroupCommand,
+        [create_group_handler],
+    )
+    mediator.register_command(
+        CreateUserCommand,
+        [create_user_handler],
+    )
+    mediator.register_command(
+        BulkCreateUsersCommand,
+        [bulk_create_users_handler],
+    )
+    mediator.register_command(
+        DeleteGroupCommand,
+        [delete_group_handler],
+    )
+    mediator.register_command(
+        DeleteUserCommand,
+        [delete_user_handler],
+    )
+    mediator.register_command(
+        UserLoginCommand,
+        [user_login_handler],
+    )
+    mediator.register_command(
+        CreateTokensCommand,
+        [create_tokens_handler],
+    )
+    mediator.register_command(
+        RefreshTokensCommand,
+        [refresh_tokens_handler],
+    )
+    mediator.register_command(
+        UserLogoutCommand,
+        [user_logout_handler],
+    )
+    mediator.register_command(
+        VerifyUserCommand,
+        [verify_user_handler],
+    )
+    mediator.register_command(
+        CreateVerificationTokenCommand, [create_verification_token_handler]
+    )
 
-        mediator.register_query(
-            GetTokensQuery, container.resolve(GetTokensQueryHandler)
+    # Event Handlers
+    def init_outbox_handler(
+        broker_topic: str, aggregate_oid: Callable[[BaseEvent], str]
+    ) -> OutboxEventHandler:
+        return OutboxEventHandler(
+            outbox_repository=container.resolve(BaseOutboxRepository),
+            broker_topic=broker_topic,
+            aggregate_oid=aggregate_oid,
+            convert_event=(
+                convert_event_to_binary_message
+                if settings.broker_message_format == "msgpack"
+                else convert_event_to_broker_message
+            ),
         )
 
-        return mediator
+    group_oid = attrgetter("group_oid")
+    user_oid = attrgetter("user_oid")
+    new_group_created_event_handler = init_outbox_handler(
+        settings.new_group_event_topic, group_oid
+    )
+    new_user_created_event_handler = init_outbox_handler(
+        settings.new_user_event_topic, user_oid
+    )
+    group_deleted_event_handler = init_outbox_handler(
+        settings.group_deleted_event_topic, group_oid
+    )
+    user_deleted_event_handler = init_outbox_handler(
+        settings.user_deleted_event_topic, user_oid
+    )
+    user_verified_event_handler = init_outbox_handler(
+        settings.user_verified_event_topic, user_oid
+    )
+    verification_token_created_event_handler = init_outbox_handler(
+        settings.verification_token_event_topic, user_oid
+    )
+    increment_group_users_count_handler = IncrementGroupUsersCountEventHandler(
+        group_repository=container.resolve(BaseGroupRepository)
+    )
+    decrement_group_users_count_handler = DecrementGroupUsersCountEventHandler(
+        group_repository=container.resolve(BaseGroupRepository)
+    )
+    invalidate_groups_cache_handler = InvalidateGroupsCacheEventHandler(
+        cache_service=container.resolve(AbstractCacheService)
+    )
+    invalidate_group_users_cache_handler = InvalidateGroupUsersCacheEventHandler(
+        cache_service=container.resolve(AbstractCacheService)
+    )
+    evict_group_entity_cache_handler = EvictGroupEntityCacheEventHandler(
+        group_cache=container.resolve(GroupEntityCache)
+    )
+    evict_user_entity_cache_handler = EvictUserEntityCacheEventHandler(
+        user_cache=container.resolve(UserEntityCache)
+    )
+    revoke_user_tokens_handler = RevokeUserTokensEventHandler(
+        cookie_manager=container.resolve(BaseCookieManager)
+    )
+    # Broker notifications go through the outbox, written with the aggregate
+    mediator.register_event(GroupCreatedEvent, [new_group_created_event_handler])
+    mediator.register_event(GroupDeletedEvent, [group_deleted_event_handler])
+    mediator.register_event(UserCreatedEvent, [new_user_created_event_handler])
+    mediator.register_event(UserDeletedEvent, [user_deleted_event_handler])
+    mediator.register_event(UserVerifiedEvent, [user_verified_event_handler])
+    mediator.register_event(
+        VerificationTokenCreatedEvent, [verification_token_created_event_handler]
+    )
+
+    mediator.register_event(UserCreatedEvent, [increment_group_users_count_handler])
+    mediator.register_event(
+        UserDeletedEvent,
+        [decrement_group_users_count_handler, revoke_user_tokens_handler],
+        ordered=True,
+    )
+
+    # A new tag generation or an eviction is only safe once the change is
+    # visible, a read racing the commit would cache the old rows under it.
+    # Outside of a transaction these run after the inline handlers, so the
+    # counter has already moved when the cached pages are dropped.
+    mediator.register_event(
+        GroupCreatedEvent, [invalidate_groups_cache_handler], after_commit=True
+    )
+    mediator.register_event(
+        GroupDeletedEvent,
+        [invalidate_groups_cache_handler, evict_group_entity_cache_handler],
+        after_commit=True,
+    )
+    mediator.register_event(
+        UserCreatedEvent, [invalidate_group_users_cache_handler], after_commit=True
+    )
+    mediator.register_event(
+        UserDeletedEvent,
+        [invalidate_group_users_cache_handler, evict_user_entity_cache_handler],
+        after_commit=True,
+    )
+    mediator.register_event(
+        UserVerifiedEvent,
+        [invalidate_group_users_cache_handler, evict_user_entity_cache_handler],
+        after_commit=True,
+    )
+
+    # Query Handlers
+    mediator.register_query(
+        GetGroupQuery,
+        container.resolve(GetGroupQueryHandler),
+    )
+    mediator.register_query(
+        GetGroupsQuery,
+        container.resolve(GetGroupsQueryHandler),
+    )
+    mediator.register_query(
+        GetUsersQuery,
+        container.resolve(GetUsersQueryHandler),
+    )
+    mediator.register_query(
+        GetUserQuery,
+        container.resolve(GetUserQueryHandler),
+    )
+
+    mediator.register_query(
+        GetUsersByOidsQuery, container.resolve(GetUsersByOidsQueryHandler)
+    )
+    mediator.register_query(
+        ExportGroupUsersQuery, container.resolve(ExportGroupUsersQueryHandler)
+    )
 
-    container.register(Mediator, factory=init_mediator)
-    container.register(EventMediator, factory=init_mediator)
+    mediator.freeze()
 
-    return container
+    return mediator
@@ -1,25 +1,56 @@
+import asyncio
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
 
 from domain.events.base import BaseEvent
+from infrastructure.transactions.base import BaseTransactionManager
+from infrastructure.transactions.dummy import DummyTransactionManager
 from logic.commands.base import CR, CT, BaseCommand, CommandHandler
-from logic.events.base import ER, ET, EventHandler
+from logic.events.base import ER, ET, BaseEventHandler
 from logic.exceptions.mediator import (
     CommandHandlersNotRegisteredException,
+    EventHandlerTimeoutException,
+    HandlersFailedException,
+    MediatorFrozenException,
+    QueryHandlersNotRegisteredException,
 )
 from logic.mediator.command import CommandMediator
 from logic.mediator.event import EventMediator
 from logic.mediator.query import QueryMediator
+from logic.mediator.supervisor import BackgroundTaskSupervisor
 from logic.queries.base import QR, QT, BaseQuery, BaseQueryHandler
 
 
 @dataclass(eq=False)
 class Mediator(EventMediator, CommandMediator, QueryMediator):
-    events_map: dict[ET, list[EventHandler]] = field(
+    """Dispatches commands, queries and events to the registered handlers.
+
+    Handlers of one event run concurrently unless the event was registered
+    as ``ordered``, background handlers are handed to the ``supervisor`` and
+    never delay the caller. ``handler_timeout`` bounds every event handler.
+
+    Every command runs in a transaction of ``transaction_manager`` together
+    with the inline handlers of the events it publishes. ``after_commit``
+    handlers run once that transaction has committed, so whatever they
+    derive from the change, like cache invalidation, never runs ahead of it.
+    """
+
+    events_map: dict[ET, list[BaseEventHandler]] = field(
+        default_factory=lambda: defaultdict(list),
+        kw_only=True,
+    )
+    background_events_map: dict[ET, list[BaseEventHandler]] = field(
         default_factory=lambda: defaultdict(list),
         kw_only=True,
     )
+    after_commit_events_map: dict[ET, list[BaseEventHandler]] = field(
+        default_factory=lambda: defaultdict(list),
+        kw_only=True,
+    )
+    ordered_events: set[ET] = field(default_factory=set, kw_only=True)
     commands_map: dict[CT, list[CommandHandler]] = field(
         default_factory=lambda: defaultdict(list),
         kw_only=True,
@@ -29,27 +60,150 @@ class Mediator(EventMediator, CommandMediator, QueryMediator):
         default_factory=dict,
         kw_only=True,
     )
+    handler_timeout: float | None = field(default=None, kw_only=True)
+    supervisor: BackgroundTaskSupervisor = field(
+        default_factory=BackgroundTaskSupervisor, kw_only=True
+    )
+    transaction_manager: BaseTransactionManager = field(
+        default_factory=DummyTransactionManager, kw_only=True
+    )
+    is_frozen: bool = field(default=False, kw_only=True)
 
     def register_event(
-        self, event: ET, event_handlers: Iterable[EventHandler[ET, ER]]
+        self,
+        event: ET,
+        event_handlers: Iterable[BaseEventHandler[ET, ER]],
+        *,
+        ordered: bool = False,
+        background: bool = False,
+        after_commit: bool = False,
     ) -> ER:
-        self.events_map[event].extend(event_handlers)
+        self._ensure_not_frozen()
+        if background:
+            self.background_events_map[event].extend(event_handlers)
+        elif after_commit:
+            self.after_commit_events_map[event].extend(event_handlers)
+        else:
+            self.events_map[event].extend(event_handlers)
+
+        if ordered:
+            self.ordered_events.add(event)
 
     def register_command(
         self, command: CT, command_handlers: Iterable[CommandHandler[CT, CR]]
     ) -> CR:
+        self._ensure_not_frozen()
         self.commands_map[command].extend(command_handlers)
 
     def register_query(self, query: QT, query_handler: BaseQueryHandler[QT, QR]) -> QR:
+        self._ensure_not_frozen()
         self.queries_map[query] = query_handler
 
+    def freeze(self) -> None:
+        """Compile the registered handlers into read-only lookup tables.
+
+        Called once the dispatch graph is built, afterwards every dispatch is
+        a single dict lookup over prebuilt tuples.
+        """
+        self.events_map = _freeze_handlers_map(self.events_map)
+        self.background_events_map = _freeze_handlers_map(self.background_events_map)
+        self.after_commit_events_map = _freeze_handlers_map(
+            self.after_commit_events_map
+        )
+        self.ordered_events = frozenset(self.ordered_events)
+        self.commands_map = _freeze_handlers_map(self.commands_map)
+        self.queries_map = MappingProxyType(dict(self.queries_map))
+        self.is_frozen = True
+
     async def publish(self, events: Iterable[BaseEvent]) -> Iterable[ER]:
         if not events:
             raise Exception(events)
         result = []
         for event in events:
-            handlers: Iterable[EventHandler] = self.events_map[event.__class__]
-            result.extend([await handler.handle(event) for handler in handlers])
+            event_type = event.__class__
+            # A transaction's session serves one operation at a time.
+            ordered = (
+                event_type in self.ordered_events
+                or self.transaction_manager.in_transaction
+            )
+
+            background_handlers = self.background_events_map.get(event_type, ())
+            if background_handlers:
+                await self._spawn_background(
+                    lambda handler, event=event: self._handle_event(handler, event),
+                    background_handlers,
+                    ordered,
+                    name=event_type.__name__,
+                )
+
+            handlers: Iterable[BaseEventHandler] = self.events_map.get(event_type, ())
+            if ordered:
+                for handler in handlers:
+                    result.append(await self._handle_event(handler, event))
+            else:
+                result.extend(
+                    await _gather(
+                        event_type,
+                        [self._handle_event(handler, event) for handler in handlers],
+                    )
+                )
+
+            after_commit_handlers = self.after_commit_events_map.get(event_type, ())
+            if after_commit_handlers:
+                await self._run_after_commit(
+                    lambda handler, event=event: self._handle_event(handler, event),
+                    after_commit_handlers,
+                    event_type in self.ordered_events,
+                    event_type,
+                )
+
+        return result
+
+    async def publish_batch(self, events: Iterable[BaseEvent]) -> Iterable[ER]:
+        """Publish many events with one ``handle_batch`` call per handler.
+
+        Events are grouped by type, each handler gets all events of a type
+        in the order they were given, so it can write them in one go.
+        """
+        batches: dict[type[BaseEvent], list[BaseEvent]] = defaultdict(list)
+        for event in events:
+            batches[event.__class__].append(event)
+
+        result = []
+        for event_type, batch in batches.items():
+            ordered = (
+                event_type in self.ordered_events
+                or self.transaction_manager.in_transaction
+            )
+
+            background_handlers = self.background_events_map.get(event_type, ())
+            if background_handlers:
+                await self._spawn_background(
+                    lambda handler, batch=batch: self._handle_batch(handler, batch),
+                    background_handlers,
+                    ordered,
+                    name=event_type.__name__,
+                )
+
+            handlers: Iterable[BaseEventHandler] = self.events_map.get(event_type, ())
+            if ordered:
+                for handler in handlers:
+                    result.extend(await self._handle_batch(handler, batch))
+            else:
+                for results in await _gather(
+                    event_type,
+                    [self._handle_batch(handler, batch) for handler in handlers],
+                ):
+                    result.extend(results)
+
+            after_commit_handlers = self.after_commit_events_map.get(event_type, ())
+            if after_commit_handlers:
+                await self._run_after_commit(
+                    lambda handler, batch=batch: self._handle_batch(handler, batch),
+                    after_commit_handlers,
+                    event_type in self.ordered_events,
+                    event_type,
+                )
 
         return result
 
@@ -59,7 +213,113 @@ class Mediator(EventMediator, CommandMediator, QueryMediator):
         if not handlers:
             raise CommandHandlersNotRegisteredException(command_type)
 
-        return [await handler.handle(command) for handler in handlers]
+        async with self.transaction_manager.transaction():
+            if self.transaction_manager.in_transaction:
+                return [await handler.handle(command) for handler in handlers]
+
+            return await _gather(
+                command_type, [handler.handle(command) for handler in handlers]
+            )
 
     async def handle_query(self, query: BaseQuery) -> QR:
-        return await self.queries_map[query.__class__].handle(query=query)
+        query_type = query.__class__
+        handler = self.queries_map.get(query_type)
+        if not handler:
+            raise QueryHandlersNotRegisteredException(query_type)
+
+        return await handler.handle(query=query)
+
+    async def _handle_event(self, handler: BaseEventHandler, event: BaseEvent) -> Any:
+        if self.handler_timeout is None:
+            return await handler.handle(event)
+
+        try:
+            return await asyncio.wait_for(handler.handle(event), self.handler_timeout)
+        except TimeoutError:
+            raise EventHandlerTimeoutException(
+                handler.__class__.__name__, self.handler_timeout
+            )
+
+    async def _handle_batch(
+        self, handler: BaseEventHandler, events: Sequence[BaseEvent]
+    ) -> list[Any]:
+        if self.handler_timeout is None:
+            return await handler.handle_batch(events)
+
+        try:
+            return await asyncio.wait_for(
+                handler.handle_batch(events), self.handler_timeout
+            )
+        except TimeoutError:
+            raise EventHandlerTimeoutException(
+                handler.__class__.__name__, self.handler_timeout
+            )
+
+    async def _spawn_background(
+        self,
+        handle: Callable[[BaseEventHandler], Awaitable[Any]],
+        handlers: Iterable[BaseEventHandler],
+        ordered: bool,
+        name: str,
+    ) -> None:
+        if ordered:
+
+            async def handle_in_order() -> None:
+                for handler in handlers:
+                    await handle(handler)
+
+            await self.supervisor.spawn(handle_in_order, name=name)
+            return
+
+        for handler in handlers:
+            await self.supervisor.spawn(
+                lambda handler=handler: handle(handler),
+                name=handler.__class__.__name__,
+            )
+
+    async def _run_after_commit(
+        self,
+        handle: Callable[[BaseEventHandler], Awaitable[Any]],
+        handlers: Iterable[BaseEventHandler],
+        ordered: bool,
+        event_type: type[BaseEvent],
+    ) -> None:
+        async def handle_all() -> None:
+            if ordered:
+                for handler in handlers:
+                    await handle(handler)
+            else:
+                await _gather(event_type, [handle(handler) for handler in handlers])
+
+        await self.transaction_manager.run_after_commit(handle_all)
+
+    def _ensure_not_frozen(self) -> None:
+        if self.is_frozen:
+            raise MediatorFrozenException()
+
+
+async def _gather(message_type: type, awaitables: list[Awaitable[Any]]) -> list[Any]:
+    """Await all handlers at once and surface their failures together.
+
+    A single failure is re-raised as is, several are wrapped into
+    ``HandlersFailedException`` so none of them gets lost.
+    """
+    if len(awaitables) == 1:
+        return [await awaitables[0]]
+
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    errors = tuple(result for result in results if isinstance(result, BaseException))
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise HandlersFailedException(message_type, errors)
+
+    return results
+
+
+def _freeze_handlers_map(
+    handlers_map: Mapping[type, Iterable],
+) -> Mapping[type, tuple]:
+    return MappingProxyType(
+        {key: tuple(handlers) for key, handlers in handlers_map.items()}
+    )
@@ -4,20 +4,28 @@ from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from domain.events.base import BaseEvent
-from logic.events.base import ER, ET, EventHandler
+from logic.events.base import ER, ET, BaseEventHandler
 
 
 @dataclass(eq=False)
 class EventMediator(ABC):
-    events_map: dict[ET, list[EventHandler]] = field(
+    events_map: dict[ET, list[BaseEventHandler]] = field(
         default_factory=lambda: defaultdict(list),
         kw_only=True,
     )
 
     @abstractmethod
     def register_event(
-        self, event: ET, event_handlers: Iterable[EventHandler[ET, ER]]
+        self,
+        event: ET,
+        event_handlers: Iterable[BaseEventHandler[ET, ER]],
+        *,
+        ordered: bool = False,
+        background: bool = False,
     ) -> ER: ...
 
     @abstractmethod
     async def publish(self, events: Iterable[BaseEvent]) -> Iterable[ER]: ...
+
+    @abstractmethod
+    async def publish_batch(self, events: Iterable[BaseEvent]) -> Iterable[ER]: ...
@@ -0,0 +1,63 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import contextvars
+from dataclasses import dataclass, field
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class BackgroundTaskSupervisor:
+    """Runs fire-and-forget coroutines off the request path.
+
+    Every task starts in an empty ``contextvars`` context, so request scoped
+    state (sessions, transactions) never leaks into it. Failures are logged,
+    never propagated. Once ``max_tasks`` are running, new work is awaited
+    inline instead, which pushes back on the caller rather than piling up.
+    """
+
+    max_tasks: int = 1000
+    _tasks: set[asyncio.Task] = field(default_factory=set, init=False)
+    _is_closed: bool = field(default=False, init=False)
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    async def spawn(self, factory: Callable[[], Awaitable[None]], name: str) -> None:
+        if self._is_closed or len(self._tasks) >= self.max_tasks:
+            await self._run(factory, name)
+            return
+
+        task = asyncio.create_task(
+            self._run(factory, name), name=name, context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def join(self) -> None:
+        """Wait until every task spawned so far has finished."""
+        while self._tasks:
+            await asyncio.wait(tuple(self._tasks))
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        self._is_closed = True
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(tuple(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            logger.warning("Cancelled %d background tasks on shutdown", len(pending))
+            await asyncio.wait(pending)
+
+    @staticmethod
+    async def _run(factory: Callable[[], Awaitable[None]], name: str) -> None:
+        try:
+            await factory()
+        except Exception:
+            logger.exception("Background task %s failed", name)
@@ -2,13 +2,20 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 from domain.entities.groups import UserGroup
-from domain.entities.users import User
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.decorators import cached_query
+from infrastructure.cache.tags import GROUPS_CACHE_TAG
 from infrastructure.repositories.groups.base import (
     BaseGroupRepository,
 )
+from infrastructure.repositories.groups.converters import (
+    convert_group_entity_to_document,
+    convert_group_json_to_entity,
+)
 from infrastructure.repositories.groups.filters.groups import (
     GetGroupsFilters,
 )
+from infrastructure.repositories.read_models.base import BaseReadModel
 from logic.exceptions.groups import GroupNotFoundException
 from logic.queries.base import BaseQuery, BaseQueryHandler
 
@@ -36,9 +43,30 @@ class GetGroupQueryHandler(BaseQueryHandler):
         return group
 
 
+def encode_groups_page(page: tuple[Iterable[UserGroup], int | None]) -> dict:
+    groups, count = page
+    return {
+        "items": [convert_group_entity_to_document(group) for group in groups],
+        "count": count,
+    }
+
+
+def decode_groups_page(data: dict) -> tuple[list[UserGroup], int | None]:
+    return [convert_group_json_to_entity(item) for item in data["items"]], data["count"]
+
+
 @dataclass(frozen=True)
 class GetGroupsQueryHandler(BaseQueryHandler):
-    groups_repository: BaseGroupRepository
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+    cache_ttl: int = 5
 
-    async def handle(self, query: GetGroupsQuery) -> Iterable[User]:
-        return await self.groups_repository.get_groups(filters=query.filters)
+    @cached_query(
+        encoder=encode_groups_page,
+        decoder=decode_groups_page,
+        tags=lambda query: (GROUPS_CACHE_TAG,),
+    )
+    async def handle(
+        self, query: GetGroupsQuery
+    ) -> tuple[Iterable[UserGroup], int | None]:
+        return await self.read_model.get_groups(filters=query.filters)
@@ -1,14 +1,24 @@
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
+from typing import Any
 
 from domain.entities.users import User
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.decorators import cached_query
+from infrastructure.cache.tags import build_group_cache_tag
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.read_models.base import BaseReadModel
 from infrastructure.repositories.users.base import (
     BaseUserRepository,
 )
+from infrastructure.repositories.users.converters import (
+    convert_user_entity_to_document,
+    convert_user_json_to_entity,
+)
 from infrastructure.repositories.users.filters.users import (
     GetUsersFilters,
 )
-from infrastructure.security.cookies.base import BaseCookieManager
+from logic.exceptions.groups import GroupNotFoundException
 from logic.exceptions.users import UserNotFoundException
 from logic.queries.base import BaseQuery, BaseQueryHandler
 
@@ -19,11 +29,6 @@ class Tokens:
     refresh_token: str
 
 
-@dataclass(frozen=True)
-class GetTokensQuery(BaseQuery):
-    username: str
-
-
 @dataclass(frozen=True)
 class GetUsersQuery(BaseQuery):
     group_oid: str
@@ -36,27 +41,21 @@ class GetUserQuery(BaseQuery):
 
 
 @dataclass(frozen=True)
-class GetTokensQueryHandler(BaseQueryHandler):
-    cookie_manager: BaseCookieManager
-    user_repository: BaseUserRepository
-
-    async def handle(self, query: GetTokensQuery) -> Tokens:
-        user = await self.user_repository.get_user_by_username(query.username)
-        if not user:
-            raise UserNotFoundException(query.username)
+class GetUsersByOidsQuery(BaseQuery):
+    user_oids: tuple[str, ...]
 
-        access_token = await self.cookie_manager.create_access_token(user.oid)
-        refresh_token = await self.cookie_manager.create_refresh_token(user.oid)
 
-        return Tokens(access_token=access_token, refresh_token=refresh_token)
+@dataclass(frozen=True)
+class ExportGroupUsersQuery(BaseQuery):
+    group_oid: str
 
 
 @dataclass(frozen=True)
 class GetUserQueryHandler(BaseQueryHandler):
-    user_repository: BaseUserRepository
+    read_model: BaseReadModel
 
     async def handle(self, query: GetUserQuery) -> User:
-        user = await self.user_repository.get_user_by_oid(user_oid=query.user_oid)
+        user = await self.read_model.get_user(user_oid=query.user_oid)
         if not user:
             raise UserNotFoundException(value=query.user_oid)
 
@@ -64,10 +63,64 @@ class GetUserQueryHandler(BaseQueryHandler):
 
 
 @dataclass(frozen=True)
-class GetUsersQueryHandler(BaseQueryHandler):
+class GetUsersByOidsQueryHandler(BaseQueryHandler):
+    """Found users keyed by oid in request order, unknown oids are left out."""
+
     user_repository: BaseUserRepository
 
-    async def handle(self, query: GetUsersQuery) -> Iterable[User]:
-        return await self.user_repository.get_users(
+    async def handle(self, query: GetUsersByOidsQuery) -> dict[str, User]:
+        users = await self.user_repository.get_users_by_oids(user_oids=query.user_oids)
+        return {
+            user_oid: users[user_oid]
+            for user_oid in dict.fromkeys(query.user_oids)
+            if user_oid in users
+        }
+
+
+def encode_users_page(page: tuple[Iterable[User], int | None]) -> dict:
+    users, count = page
+    return {
+        "items": [convert_user_entity_to_document(user) for user in users],
+        "count": count,
+    }
+
+
+def decode_users_page(data: dict) -> tuple[list[User], int | None]:
+    return [convert_user_json_to_entity(item) for item in data["items"]], data["count"]
+
+
+@dataclass(frozen=True)
+class GetUsersQueryHandler(BaseQueryHandler):
+    read_model: BaseReadModel
+    cache_service: AbstractCacheService
+    cache_ttl: int = 60
+
+    @cached_query(
+        encoder=encode_users_page,
+        decoder=decode_users_page,
+        tags=lambda query: (build_group_cache_tag(query.group_oid),),
+    )
+    async def handle(self, query: GetUsersQuery) -> tuple[Iterable[User], int | None]:
+        return await self.read_model.get_users(
             group_oid=query.group_oid, filters=query.filters
         )
+
+
+@dataclass(frozen=True)
+class ExportGroupUsersQueryHandler(BaseQueryHandler):
+    """Checks the group up front, so a missing one fails before streaming."""
+
+    user_repository: BaseUserRepository
+    group_repository: BaseGroupRepository
+    batch_size: int = 1000
+
+    async def handle(
+        self, query: ExportGroupUsersQuery
+    ) -> AsyncIterator[dict[str, Any]]:
+        group = await self.group_repository.get_group_by_oid(group_oid=query.group_oid)
+        if not group:
+            raise GroupNotFoundException(oid=query.group_oid)
+
+        return self.user_repository.iter_group_user_documents(
+            group_oid=query.group_oid, batch_size=self.batch_size
+        )
@@ -19,3 +19,12 @@ def app() -> FastAPI:
 @pytest.fixture
 def client(app: FastAPI) -> TestClient:
     return TestClient(app=app)
+
+
+@pytest.fixture
+def shared_client(app: FastAPI) -> TestClient:
+    # One container for every request, so later requests see earlier writes
+    container = init_dummy_container()
+    app.dependency_overrides[init_container] = lambda: container
+
+    return TestClient(app=app)
@@ -43,3 +43,15 @@ async def test_create_group_title_empty(
     json_data = response.json()
 
     assert json_data["detail"]
+
+
+@pytest.mark.asyncio
+async def test_import_users_into_missing_group(app: FastAPI, client: TestClient):
+    url = app.url_path_for("import_users", group_oid="missing")
+    response: Response = client.post(
+        url=url,
+        content=b'{"username": "user", "email": "user@example.com", "password": "pw1"}',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.json()
@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from httpx import Response
+import orjson
+import pytest
+
+from application.api.common.export import encode_csv, encode_ndjson
+
+
+async def iter_documents(count: int):
+    for index in range(count):
+        yield {
+            "oid": str(index),
+            "username": f"user,{index}",
+            "created_at": datetime(2024, 1, 1),
+        }
+
+
+@pytest.mark.asyncio
+async def test_encode_ndjson_writes_one_document_per_line():
+    content = b"".join([chunk async for chunk in encode_ndjson(iter_documents(3))])
+
+    lines = content.splitlines()
+    assert len(lines) == 3
+    assert orjson.loads(lines[1]) == {
+        "oid": "1",
+        "username": "user,1",
+        "created_at": "2024-01-01T00:00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_encode_csv_flushes_in_chunks():
+    chunks = [
+        chunk async for chunk in encode_csv(iter_documents(5000), ("oid", "username"))
+    ]
+
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(chunks) > 1
+    assert lines[0] == "oid,username"
+    assert lines[1] == '0,"user,0"'
+    assert len(lines) == 5001
+
+
+@pytest.mark.asyncio
+async def test_export_users_reads_the_format_query_parameter(
+    app: FastAPI, shared_client: TestClient
+):
+    group = shared_client.post("/groups/", json={"title": "group"}).json()
+    url = app.url_path_for("export_users", group_oid=group["oid"])
+
+    csv_response: Response = shared_client.get(url, params={"format": "csv"})
+    invalid_response: Response = shared_client.get(url, params={"format": "xml"})
+
+    assert csv_response.is_success
+    assert csv_response.headers["content-type"].startswith("text/csv")
+    assert csv_response.text.splitlines()[0].startswith("oid,")
+    assert invalid_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,64 @@
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from httpx import Response
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_batch_get_users_lists_missing_oids(app: FastAPI, client: TestClient):
+    url = app.url_path_for("batch_get_users")
+    response: Response = client.post(url=url, json={"oids": ["a", "b", "a"]})
+
+    assert response.is_success, response.json()
+    assert response.json() == {"items": [], "missing": ["a", "b"]}
+
+
+@pytest.mark.asyncio
+async def test_batch_get_users_limits_oids(app: FastAPI, client: TestClient):
+    url = app.url_path_for("batch_get_users")
+    response: Response = client.post(
+        url=url, json={"oids": [str(index) for index in range(1001)]}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_static_post_routes_are_not_shadowed(app: FastAPI, client: TestClient):
+    response: Response = client.post(url=app.url_path_for("refresh"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_the_login_tokens(shared_client: TestClient):
+    group = shared_client.post("/groups/", json={"title": "group"}).json()
+    created = shared_client.post(
+        f"/users/{group['oid']}/",
+        json={"username": "user", "email": "user@example.com", "password": "pw1"},
+    )
+    assert created.is_success, created.json()
+
+    login: Response = shared_client.post(
+        "/users/", json={"username": "user", "password": "pw1"}
+    )
+    assert login.is_success, login.json()
+    login_refresh_token = login.cookies["refresh_token"]
+
+    shared_client.cookies = {"refresh_token": login_refresh_token}
+    refreshed: Response = shared_client.post("/users/refresh/")
+    assert refreshed.status_code == status.HTTP_204_NO_CONTENT
+    assert refreshed.cookies["access_token"]
+    assert refreshed.cookies["refresh_token"] != login_refresh_token
+
+    shared_client.cookies = {"refresh_token": login_refresh_token}
+    reused: Response = shared_client.post("/users/refresh/")
+    assert reused.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_refresh_rejects_an_invalid_token(client: TestClient):
+    client.cookies = {"refresh_token": "invalid"}
+    response: Response = client.post("/users/refresh/")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,54 @@
+"""Constructions per second of the domain value objects.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_domain_values
+
+``validated`` is the constructor requests and commands go through,
+``trusted`` is ``from_trusted`` used when reading stored entities.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from domain.values.base import BaseValueObject
+from domain.values.groups import Title
+from domain.values.users import Email, Password, Username
+
+
+VALUES = 100_000
+ROUNDS = 5
+
+
+def measure(func: Callable[[Any], Any], values: list[Any]) -> float:
+    """Best constructions per second over a few rounds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - started)
+    return len(values) / best
+
+
+def main() -> None:
+    hashed_password = "$2b$12$" + "x" * 53
+    cases: tuple[tuple[type[BaseValueObject], list[str]], ...] = (
+        (Username, [f"user{index}" for index in range(VALUES)]),
+        (Email, [f"user{index}@example.com" for index in range(VALUES)]),
+        (Password, [hashed_password] * VALUES),
+        (Title, [f"group {index % 1000}" for index in range(VALUES)]),
+    )
+
+    for value_type, values in cases:
+        validated = measure(value_type, values)
+        trusted = measure(value_type.from_trusted, values)
+        print(
+            f"{value_type.__name__:>8}: validated {validated:>10.0f}/s, "
+            f"trusted {trusted:>10.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Encode and decode throughput and message size of the event codecs.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_event_codec
+
+``json`` is the orjson encoding consumers used to ``orjson.loads`` into a
+plain dict, ``json -> event`` additionally rebuilds the event from it,
+``msgpack`` is the versioned binary codec decoding straight into events.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from domain.events.base import BaseEvent
+from domain.events.users import UserCreatedEvent
+from infrastructure.message_brokers.converters import (
+    convert_binary_message_to_event,
+    convert_event_to_binary_message,
+    convert_event_to_broker_message,
+    convert_json_to_event,
+)
+
+
+EVENTS = 100_000
+
+
+def measure(func: Callable[[Any], Any], values: list[Any]) -> float:
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    return len(values) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    events: list[BaseEvent] = [
+        UserCreatedEvent(
+            username=f"user{index}",
+            email=f"user{index}@example.com",
+            user_oid=f"{index:032x}",
+            group_oid="5d7a3c30-2b57-4c1e-9a3b-0d1b6c8f4e21",
+        )
+        for index in range(EVENTS)
+    ]
+    json_messages = [convert_event_to_broker_message(event) for event in events]
+    binary_messages = [convert_event_to_binary_message(event) for event in events]
+
+    rows = (
+        (
+            "json",
+            measure(convert_event_to_broker_message, events),
+            measure(orjson.loads, json_messages),
+            json_messages,
+        ),
+        (
+            "json -> event",
+            measure(convert_event_to_broker_message, events),
+            measure(
+                lambda message: convert_json_to_event(
+                    UserCreatedEvent, orjson.loads(message)
+                ),
+                json_messages,
+            ),
+            json_messages,
+        ),
+        (
+            "msgpack",
+            measure(convert_event_to_binary_message, events),
+            measure(convert_binary_message_to_event, binary_messages),
+            binary_messages,
+        ),
+    )
+    for name, encodes, decodes, messages in rows:
+        size = sum(map(len, messages)) / len(messages)
+        print(
+            f"{name:>13}: encode {encodes:>9.0f}/s, decode {decodes:>9.0f}/s, "
+            f"{size:.1f} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
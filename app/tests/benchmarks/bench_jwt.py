@@ -0,0 +1,110 @@
+"""Token issue and verification throughput of the cookie manager.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_jwt
+
+``pyjwt`` is a plain ``jwt.encode``/``jwt.decode`` per token, ``manager
+cold`` verifies every token once, ``manager warm`` verifies tokens already
+in the verified-token cache, as for repeated requests with the same cookie,
+``warm revoked`` does the same with other tokens in the revocation list.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
+
+from infrastructure.repositories.refresh_tokens.memory_repository import (
+    InMemoryRefreshTokenRepository,
+)
+from infrastructure.security.cookies.jwt import PyJWTCookieManager
+from infrastructure.security.cookies.revocation import TokenRevocationList
+
+
+TOKENS = 20_000
+REVOKED = 10_000
+SECRET_KEY = "benchmark-secret-key-of-at-least-32-bytes"
+
+
+async def measure(func: Callable[[Any], Awaitable[Any]], values: list[Any]) -> float:
+    started = time.perf_counter()
+    for value in values:
+        await func(value)
+    return len(values) / (time.perf_counter() - started)
+
+
+async def run(algorithm: str, secret_key: str) -> None:
+    refresh_token_repository = InMemoryRefreshTokenRepository()
+    cookie_manager = PyJWTCookieManager(
+        _token_secret_key=secret_key,
+        _algorithm=algorithm,
+        _access_token_expire_minutes=15,
+        _refresh_token_expire_days=30,
+        _refresh_token_repository=refresh_token_repository,
+        _revocation_list=TokenRevocationList(
+            token_repository=refresh_token_repository, window=900
+        ),
+        _verification_cache_maxsize=TOKENS,
+    )
+    verifying_key = cookie_manager._verifying_key
+    user_oids = [str(index) for index in range(TOKENS)]
+
+    async def pyjwt_encode(user_oid: str) -> str:
+        return jwt.encode(
+            {
+                "sub": user_oid,
+                "typ": "access",
+                "jti": user_oid,
+                "iat": int(time.time()),
+                "exp": int(time.time()) + 900,
+            },
+            secret_key,
+            algorithm=algorithm,
+        )
+
+    async def pyjwt_decode(token: str) -> dict:
+        return jwt.decode(token, verifying_key, algorithms=[algorithm])
+
+    tokens = [await cookie_manager.create_access_token(oid) for oid in user_oids]
+    results = {
+        "pyjwt": (
+            await measure(pyjwt_encode, user_oids),
+            await measure(pyjwt_decode, tokens),
+        ),
+        "manager cold": (
+            await measure(cookie_manager.create_access_token, user_oids),
+            await measure(cookie_manager.get_payload, tokens),
+        ),
+        "manager warm": (None, await measure(cookie_manager.get_payload, tokens)),
+    }
+    cookie_manager._revocation_list.add_revoked_ids(
+        f"revoked-{index}" for index in range(REVOKED)
+    )
+    results["warm revoked"] = (
+        None,
+        await measure(cookie_manager.get_payload, tokens),
+    )
+    for name, (encoded, decoded) in results.items():
+        encode = f"{encoded:9.0f}/s" if encoded is not None else f"{'-':>11}"
+        print(f"{algorithm:>5} {name:>12}: encode {encode}, verify {decoded:9.0f}/s")
+
+
+async def main() -> None:
+    private_key = Ed25519PrivateKey.generate().private_bytes(
+        Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+    )
+    await run("HS256", SECRET_KEY)
+    await run("EdDSA", private_key.decode())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
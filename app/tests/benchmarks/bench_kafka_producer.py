@@ -0,0 +1,188 @@
+"""Producer throughput and bytes on the wire per message.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_kafka_producer
+
+Messages go through ``KafkaMessageBroker`` into a stand-in producer that
+batches and compresses them with aiokafka's own record batch builder, then
+spends a round trip plus the batch size over the link per request, one
+request in flight at a time like a single partition leader. ``awaited``
+waits for every delivery before the next send, the way a caller of the old
+``send_message`` had to for delivery guarantees.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import time
+
+from aiokafka.record.default_records import DefaultRecordBatchBuilder
+
+from domain.events.users import UserCreatedEvent
+from infrastructure.message_brokers.base import BrokerMessage
+from infrastructure.message_brokers.converters import convert_event_to_broker_message
+from infrastructure.message_brokers.kafka import KafkaMessageBroker
+
+
+MESSAGES = 20_000
+ROUND_TRIP = 0.001
+BANDWIDTH = 12.5e6  # bytes per second, 100 Mbit/s
+
+COMPRESSION_CODECS = {None: 0, "gzip": 1, "snappy": 2, "zstd": 4}
+
+
+@dataclass(eq=False)
+class StandInProducer:
+    linger_ms: int = 0
+    max_batch_size: int = 16384
+    compression_type: str | None = None
+    requests: int = 0
+    wire_bytes: int = 0
+    _ready: deque = field(default_factory=deque, init=False)
+    _builder: DefaultRecordBatchBuilder | None = field(default=None, init=False)
+    _futures: list[asyncio.Future] = field(default_factory=list, init=False)
+    _pending: set[asyncio.Future] = field(default_factory=set, init=False)
+    _has_data: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _sender: asyncio.Task | None = field(default=None, init=False)
+
+    async def start(self) -> None:
+        self._sender = asyncio.create_task(self._send_forever())
+
+    async def stop(self) -> None:
+        await self.flush()
+        self._sender.cancel()
+
+    async def send(self, topic: str, key: bytes, value: bytes) -> asyncio.Future:
+        if self._builder is None or not self._append(key, value):
+            if self._builder is not None:
+                self._ready.append((self._builder, self._futures))
+            self._builder = self._new_builder()
+            self._futures = []
+            self._append(key, value)
+
+        delivery = asyncio.get_running_loop().create_future()
+        self._futures.append(delivery)
+        self._pending.add(delivery)
+        delivery.add_done_callback(self._pending.discard)
+        self._has_data.set()
+        return delivery
+
+    async def flush(self) -> None:
+        await asyncio.gather(*self._pending)
+
+    def _new_builder(self) -> DefaultRecordBatchBuilder:
+        return DefaultRecordBatchBuilder(
+            magic=2,
+            compression_type=COMPRESSION_CODECS[self.compression_type],
+            is_transactional=0,
+            producer_id=-1,
+            producer_epoch=-1,
+            base_sequence=-1,
+            batch_size=self.max_batch_size,
+        )
+
+    def _append(self, key: bytes, value: bytes) -> bool:
+        metadata = self._builder.append(
+            len(self._futures), timestamp=None, key=key, value=value, headers=[]
+        )
+        return metadata is not None
+
+    async def _send_forever(self) -> None:
+        while True:
+            await self._has_data.wait()
+            if not self._ready and self.linger_ms:
+                await asyncio.sleep(self.linger_ms / 1000)
+
+            if self._ready:
+                builder, futures = self._ready.popleft()
+            else:
+                builder, futures = self._builder, self._futures
+                self._builder, self._futures = None, []
+            if not self._ready and self._builder is None:
+                self._has_data.clear()
+
+            buffer = builder.build()
+            self.requests += 1
+            self.wire_bytes += len(buffer)
+            await asyncio.sleep(ROUND_TRIP + len(buffer) / BANDWIDTH)
+
+            for delivery in futures:
+                delivery.set_result(None)
+
+
+def build_messages() -> list[BrokerMessage]:
+    events = [
+        UserCreatedEvent(
+            username=f"user{index}",
+            email=f"user{index}@example.com",
+            user_oid=f"{index:032x}",
+            group_oid="5d7a3c30-2b57-4c1e-9a3b-0d1b6c8f4e21",
+        )
+        for index in range(MESSAGES)
+    ]
+    return [
+        BrokerMessage(
+            topic="new-users-topic",
+            key=event.user_oid.encode(),
+            value=convert_event_to_broker_message(event=event),
+        )
+        for event in events
+    ]
+
+
+async def run(producer: StandInProducer, awaited: bool) -> float:
+    broker = KafkaMessageBroker(producer=producer, consumer=None)
+    messages = build_messages()
+    await producer.start()
+
+    started = time.perf_counter()
+    if awaited:
+        for message in messages:
+            await await_delivery(broker, message)
+    else:
+        await broker.send_batch(messages)
+    await broker.flush()
+    elapsed = time.perf_counter() - started
+
+    await producer.stop()
+    return MESSAGES / elapsed
+
+
+async def await_delivery(broker: KafkaMessageBroker, message: BrokerMessage) -> None:
+    delivery = await broker.send_message(
+        key=message.key, topic=message.topic, value=message.value
+    )
+    await delivery
+
+
+async def main() -> None:
+    scenarios = (
+        ("awaited, defaults", StandInProducer(), True),
+        ("batched, defaults", StandInProducer(), False),
+        (
+            "batched, linger 10ms, 64KiB, gzip",
+            StandInProducer(
+                linger_ms=10, max_batch_size=64 * 1024, compression_type="gzip"
+            ),
+            False,
+        ),
+        (
+            "batched, linger 10ms, 64KiB, zstd",
+            StandInProducer(
+                linger_ms=10, max_batch_size=64 * 1024, compression_type="zstd"
+            ),
+            False,
+        ),
+    )
+    for name, producer, awaited in scenarios:
+        throughput = await run(producer, awaited)
+        print(
+            f"{name:>34}: {throughput:>8.0f} msg/s, "
+            f"{producer.requests:>5} requests, "
+            f"{producer.wire_bytes / MESSAGES:>6.1f} bytes/msg"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""Requests per second on ``GET /users/{user_oid}/``.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_mediator
+
+``per-request`` rebuilds the mediator and all of its handlers on every
+resolve, the way the container used to, ``singleton`` uses the prebuilt one.
+"""
+
+import asyncio
+import time
+
+from httpx import ASGITransport, AsyncClient
+from punq import Container
+
+from application.api.main import create_app
+from logic.init import init_container, init_mediator
+from logic.mediator.base import Mediator
+from tests.fixtures import init_dummy_container
+
+
+REQUESTS = 5000
+
+
+async def run(container: Container) -> float:
+    app = create_app()
+    app.dependency_overrides[init_container] = lambda: container
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        group = (await client.post("/groups/", json={"title": "benchmark"})).json()
+        user = (
+            await client.post(
+                f"/users/{group['oid']}/",
+                json={
+                    "username": "benchmark",
+                    "password": "benchmark",
+                    "email": "benchmark@example.com",
+                },
+            )
+        ).json()
+        url = f"/users/{user['oid']}/"
+
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await client.get(url)
+
+        return REQUESTS / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    per_request_container = init_dummy_container()
+    per_request_container.register(
+        Mediator, factory=lambda: init_mediator(per_request_container)
+    )
+
+    for name, container in (
+        ("per-request", per_request_container),
+        ("singleton", init_dummy_container()),
+    ):
+        print(f"{name:>11}: {await run(container):.0f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""Lookup cost of the in-memory user repository as it grows to 1M users.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_memory_repository
+
+Lookups by oid, username and email, and cursor pages deep into a group,
+should cost the same at every size. ``worst insert`` is the slowest single
+``add_user`` while filling the repository, where the index resizes show up:
+one shard resizes the whole index at once, 16 shards a sixteenth of it. The
+garbage collector is paused while filling, its full collections over a
+million live users would hide the resizes.
+"""
+
+import asyncio
+import gc
+from datetime import datetime, timedelta
+import random
+import time
+from collections.abc import Awaitable, Callable
+
+from domain.entities.users import User
+from domain.values.users import Email, Password, Username
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from infrastructure.repositories.users.memory_repository import (
+    InMemoryUserRepository,
+)
+
+
+SIZES = (10_000, 100_000, 1_000_000)
+GROUPS = 100
+LOOKUPS = 20_000
+
+
+def build_users(count: int) -> list[User]:
+    started = datetime(2024, 1, 1)
+    password = Password.from_trusted("$2b$12$" + "x" * 53)
+    group_oids = [f"group-{index}" for index in range(GROUPS)]
+    return [
+        User(
+            oid=f"{index:032x}",
+            email=Email.from_trusted(f"user{index}@example.com"),
+            username=Username.from_trusted(f"user{index}"),
+            password=password,
+            group_id=group_oids[index % GROUPS],
+            created_at=started + timedelta(milliseconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+async def fill(repository: InMemoryUserRepository, users: list[User]) -> float:
+    """Slowest single insert in milliseconds."""
+    worst = 0.0
+    gc.disable()
+    try:
+        for user in users:
+            started = time.perf_counter()
+            await repository.add_user(user)
+            worst = max(worst, time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return worst * 1e3
+
+
+async def measure(lookup: Callable[[int], Awaitable[object]], keys: list[int]) -> float:
+    """Microseconds per lookup."""
+    started = time.perf_counter()
+    for key in keys:
+        await lookup(key)
+    return (time.perf_counter() - started) / len(keys) * 1e6
+
+
+async def main() -> None:
+    users = build_users(max(SIZES))
+    for size in SIZES:
+        repository = InMemoryUserRepository(shards=16)
+        worst_insert = await fill(repository, users[:size])
+        single_shard_worst_insert = await fill(
+            InMemoryUserRepository(shards=1), users[:size]
+        )
+        keys = [random.randrange(size) for _ in range(LOOKUPS)]
+
+        by_oid = await measure(
+            lambda key: repository.get_user_by_oid(users[key].oid), keys
+        )
+        by_username = await measure(
+            lambda key: repository.get_user_by_username(f"user{key}"), keys
+        )
+        exists = await measure(
+            lambda key: repository.check_user_exists_by_email_and_username(
+                email=f"user{key}@example.com", username="missing"
+            ),
+            keys,
+        )
+        page = await measure(
+            lambda key: repository.get_users(
+                users[key].group_id,
+                GetUsersFilters(
+                    limit=50,
+                    offset=0,
+                    cursor=PageCursor.from_entity(users[key]),
+                    count=CountMode.EXACT,
+                ),
+            ),
+            keys[:2000],
+        )
+        print(
+            f"{size:>9} users: oid {by_oid:5.2f} us, username {by_username:5.2f} us, "
+            f"exists {exists:5.2f} us, page of 50 {page:6.1f} us, "
+            f"worst insert {worst_insert:5.1f} ms "
+            f"(1 shard {single_shard_worst_insert:5.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""Wire size of MongoDB replies under the compressors the client negotiates.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_mongodb_compression
+
+Encodes the reply to a page of users as BSON, as the server sends it, and
+compresses it the way ``MONGODB_COMPRESSORS`` would: zstd at its default
+level, zlib at pymongo's default level -1. Needs no server, the cost on a
+real link is the bytes saved against the time spent on both ends.
+"""
+
+import time
+import zlib
+
+import bson
+import zstandard
+
+from infrastructure.repositories.users.converters import (
+    convert_user_entity_to_document,
+)
+from tests.benchmarks.bench_memory_repository import build_users
+
+
+PAGE_SIZES = (10, 50, 500)
+ROUNDS = 2000
+
+
+def measure(operation, data: bytes) -> float:
+    """Microseconds per call."""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        operation(data)
+    return (time.perf_counter() - started) / ROUNDS * 1e6
+
+
+def main() -> None:
+    zstd_compressor = zstandard.ZstdCompressor()
+    zstd_decompressor = zstandard.ZstdDecompressor()
+    for page_size in PAGE_SIZES:
+        documents = [
+            convert_user_entity_to_document(user) for user in build_users(page_size)
+        ]
+        for document in documents:
+            del document["password"]
+        reply = bson.encode({"cursor": {"firstBatch": documents, "id": 0}, "ok": 1})
+
+        zstd_reply = zstd_compressor.compress(reply)
+        zlib_reply = zlib.compress(reply, -1)
+        print(
+            f"page of {page_size:>3}: {len(reply):>6} B, "
+            f"zstd {len(zstd_reply):>6} B "
+            f"({measure(zstd_compressor.compress, reply):6.1f} us + "
+            f"{measure(zstd_decompressor.decompress, zstd_reply):5.1f} us), "
+            f"zlib {len(zlib_reply):>6} B "
+            f"({measure(lambda data: zlib.compress(data, -1), reply):6.1f} us + "
+            f"{measure(zlib.decompress, zlib_reply):5.1f} us)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Healthcheck latency while logins are running.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_password_hasher
+
+The ``inline`` mode runs bcrypt on the event loop the way the handlers used
+to, the ``pool`` mode goes through ``BcryptPasswordHasher``.
+"""
+
+import asyncio
+import statistics
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from httpx import ASGITransport, AsyncClient
+
+from application.api.main import create_app
+from infrastructure.security.passwords.base import BasePasswordHasher
+from infrastructure.security.passwords.bcrypt import BcryptPasswordHasher
+from logic.init import init_container
+from tests.fixtures import init_dummy_container
+
+
+LOGINS = 64
+CONCURRENCY = 16
+ROUNDS = 12
+PROBE_INTERVAL = 0.005
+
+
+class InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1]
+
+
+async def run(executor: Executor) -> list[float]:
+    container = init_dummy_container()
+    container.register(
+        BasePasswordHasher,
+        instance=BcryptPasswordHasher(
+            executor=executor, max_pending=LOGINS, rounds=ROUNDS
+        ),
+    )
+    app = create_app()
+    app.dependency_overrides[init_container] = lambda: container
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        group = (await client.post("/groups/", json={"title": "benchmark"})).json()
+        credentials = {"username": "benchmark", "password": "benchmark"}
+        await client.post(
+            f"/users/{group['oid']}/",
+            json={**credentials, "email": "benchmark@example.com"},
+        )
+
+        latencies: list[float] = []
+        done = asyncio.Event()
+
+        async def probe() -> None:
+            # Latency is measured from the moment the probe was due, so time
+            # spent waiting for a blocked event loop is included.
+            due_at = time.perf_counter()
+            while not done.is_set():
+                due_at += PROBE_INTERVAL
+                await asyncio.sleep(max(0.0, due_at - time.perf_counter()))
+                await client.get("/healthcheck/")
+                latencies.append(time.perf_counter() - due_at)
+
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def login() -> None:
+            async with semaphore:
+                await client.post("/users/", json=credentials)
+
+        probe_task = asyncio.create_task(probe())
+        await asyncio.gather(*(login() for _ in range(LOGINS)))
+        done.set()
+        await probe_task
+
+    return latencies
+
+
+async def main() -> None:
+    for name, executor in (
+        ("inline", InlineExecutor()),
+        ("pool", ThreadPoolExecutor(max_workers=4)),
+    ):
+        latencies = await run(executor)
+        print(
+            f"{name:>6}: healthcheck samples={len(latencies)} "
+            f"p50={percentile(latencies, 50) * 1000:.1f}ms "
+            f"p99={percentile(latencies, 99) * 1000:.1f}ms"
+        )
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+"""The users queries against the primary repositories and the projection.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_read_models
+
+The primary read model reads a SQLite file in a temporary directory, the
+Redis projection a scratch key prefix on ``REDIS_URL`` and is skipped when
+no server answers. Both hold the same users, neither has a cache in front.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+import os
+from pathlib import Path
+import random
+import tempfile
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.common.schema import SQLAlchemySchemaManager
+from infrastructure.repositories.groups.sql import SQLAlchemyGroupRepository
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.read_models.primary import PrimaryReadModel
+from infrastructure.repositories.read_models.redis import RedisReadModel
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from infrastructure.repositories.users.sql import SQLAlchemyUserRepository
+from tests.benchmarks.bench_memory_repository import GROUPS, build_users
+
+
+USERS = 20_000
+BATCH_SIZE = 1000
+OPERATIONS = 2000
+
+
+@asynccontextmanager
+async def primary_read_model() -> AsyncIterator[BaseReadModel | None]:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        )
+        await SQLAlchemySchemaManager(engine=engine).create_tables()
+        user_repository = SQLAlchemyUserRepository(engine=engine)
+        users = build_users(USERS)
+        for offset in range(0, USERS, BATCH_SIZE):
+            await user_repository.add_users(users[offset : offset + BATCH_SIZE])
+        try:
+            yield PrimaryReadModel(
+                user_repository=user_repository,
+                group_repository=SQLAlchemyGroupRepository(engine=engine),
+            )
+        finally:
+            await engine.dispose()
+
+
+@asynccontextmanager
+async def redis_read_model() -> AsyncIterator[BaseReadModel | None]:
+    client = Redis.from_url(os.environ.get("REDIS_URL", "redis://localhost:6379"))
+    try:
+        await client.ping()
+    except RedisError:
+        await client.aclose()
+        yield None
+        return
+
+    read_model = RedisReadModel(client=client, key_prefix="read-model-bench")
+    users = build_users(USERS)
+    for offset in range(0, USERS, BATCH_SIZE):
+        await read_model.add_users(users[offset : offset + BATCH_SIZE])
+    try:
+        yield read_model
+    finally:
+        keys = [key async for key in client.scan_iter("read-model-bench:*")]
+        for offset in range(0, len(keys), BATCH_SIZE):
+            await client.delete(*keys[offset : offset + BATCH_SIZE])
+        await client.aclose()
+
+
+async def measure(operation: Callable[[int], Awaitable[object]], count: int) -> float:
+    """Microseconds per operation."""
+    started = time.perf_counter()
+    for index in range(count):
+        await operation(index)
+    return (time.perf_counter() - started) / count * 1e6
+
+
+async def run(read_model: BaseReadModel) -> dict[str, float]:
+    users = build_users(USERS)
+    keys = [random.randrange(USERS) for _ in range(OPERATIONS)]
+
+    return {
+        "by oid us": await measure(
+            lambda index: read_model.get_user(users[keys[index]].oid), OPERATIONS
+        ),
+        "first page us": await measure(
+            lambda index: read_model.get_users(
+                users[keys[index]].group_id, GetUsersFilters(limit=50)
+            ),
+            OPERATIONS,
+        ),
+        "deep page us": await measure(
+            lambda index: read_model.get_users(
+                users[keys[index]].group_id,
+                GetUsersFilters(
+                    limit=50,
+                    cursor=PageCursor.from_entity(users[keys[index]]),
+                    count=CountMode.NONE,
+                ),
+            ),
+            OPERATIONS,
+        ),
+    }
+
+
+async def main() -> None:
+    print(f"{USERS} users in {GROUPS} groups, pages of 50")
+    for name, open_read_model in (
+        ("primary", primary_read_model),
+        ("redis", redis_read_model),
+    ):
+        async with open_read_model() as read_model:
+            if read_model is None:
+                print(f"{name:>8}: skipped, no server")
+                continue
+
+            results = await run(read_model)
+            print(
+                f"{name:>8}: "
+                + ", ".join(f"{label} {value:,.0f}" for label, value in results.items())
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""Per-document cost of turning a 10k user page into entities.
+
+Run from the ``app`` directory::
+
+    python -m tests.benchmarks.bench_user_decode
+
+``validated`` rebuilds the value objects through their constructors, the
+way reads did before, ``trusted`` is the converter used now. The ``bson``
+rows also decode the raw documents, once as stored and once with the
+projection the user reads use.
+"""
+
+from datetime import datetime, timedelta
+import time
+from collections.abc import Callable
+from typing import Any, Mapping
+
+import bcrypt
+import bson
+from bson import ObjectId
+
+from domain.entities.users import User
+from domain.values.users import Email, Password, Username
+from infrastructure.repositories.users.converters import (
+    USER_ENTITY_PROJECTION,
+    convert_user_document_to_entity,
+)
+
+
+PAGE_SIZE = 10_000
+ROUNDS = 5
+
+
+def convert_validated(user_document: Mapping[str, Any]) -> User:
+    return User(
+        oid=user_document["oid"],
+        email=Email(value=user_document["email"]),
+        username=Username(value=user_document["username"]),
+        password=Password(value=user_document["password"]),
+        created_at=user_document["created_at"],
+        group_id=user_document["group_oid"],
+        is_verified=user_document["is_verified"],
+    )
+
+
+def project(document: dict[str, Any], projection: Mapping[str, bool]) -> dict:
+    return {key: value for key, value in document.items() if projection.get(key, True)}
+
+
+def measure(func: Callable[[Any], Any], values: list[Any]) -> float:
+    """Best microseconds per value over a few rounds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - started)
+    return best / len(values) * 1e6
+
+
+def main() -> None:
+    hashed_password = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)).decode()
+    created_at = datetime(2024, 1, 1)
+    documents = [
+        {
+            "_id": ObjectId(),
+            "oid": f"{index:032x}",
+            "email": f"user{index}@example.com",
+            "username": f"user{index}",
+            "password": hashed_password,
+            "created_at": created_at + timedelta(seconds=index),
+            "group_oid": "5d7a3c30-2b57-4c1e-9a3b-0d1b6c8f4e21",
+            "is_verified": index % 2 == 0,
+        }
+        for index in range(PAGE_SIZE)
+    ]
+    projected = [project(document, USER_ENTITY_PROJECTION) for document in documents]
+    raw = [bson.encode(document) for document in documents]
+    raw_projected = [bson.encode(document) for document in projected]
+
+    rows = (
+        ("validated", measure(convert_validated, documents), 0),
+        ("trusted", measure(convert_user_document_to_entity, documents), 0),
+        (
+            "trusted, projected",
+            measure(convert_user_document_to_entity, projected),
+            0,
+        ),
+        (
+            "bson + validated",
+            measure(lambda data: convert_validated(bson.decode(data)), raw),
+            sum(map(len, raw)) / len(raw),
+        ),
+        (
+            "bson + trusted, projected",
+            measure(
+                lambda data: convert_user_document_to_entity(bson.decode(data)),
+                raw_projected,
+            ),
+            sum(map(len, raw_projected)) / len(raw_projected),
+        ),
+    )
+    for name, cost, size in rows:
+        size_column = f", {size:.0f} bytes" if size else ""
+        print(f"{name:>25}: {cost:6.2f} us/document{size_column}")
+
+
+if __name__ == "__main__":
+    main()
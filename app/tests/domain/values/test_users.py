@@ -1,3 +1,4 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from uuid import uuid4
 from faker import Faker
@@ -65,3 +66,18 @@ def test_create_user_long_password(faker: Faker) -> None:
 def test_create_user_invalid_email() -> None:
     with pytest.raises(InvalidEmail):
         Email("invalid_email")
+
+
+def test_email_must_match_whole_value() -> None:
+    with pytest.raises(InvalidEmail):
+        Email("user@example.com\n")
+
+
+def test_value_objects_are_frozen_and_slotted() -> None:
+    username = Username("user")
+
+    with pytest.raises(FrozenInstanceError):
+        username.value = "other"
+
+    assert not hasattr(username, "__dict__")
+    assert Username.from_trusted("user") == username
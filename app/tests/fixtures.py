@@ -1,24 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from punq import Container, Scope
 
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.memory import InMemoryCacheService
 from infrastructure.message_brokers.base import BaseMessageBroker
 from infrastructure.message_brokers.dummy_kafka import DummyKafkaMessageBroker
 from infrastructure.repositories.groups.base import BaseGroupRepository
 from infrastructure.repositories.users.base import BaseUserRepository
 from infrastructure.repositories.users.memory_repository import InMemoryUserRepository
 from infrastructure.repositories.groups.memory_repository import InMemoryGroupRepository
+from infrastructure.repositories.outbox.base import BaseOutboxRepository
+from infrastructure.repositories.outbox.memory_repository import (
+    InMemoryOutboxRepository,
+)
+from infrastructure.repositories.refresh_tokens.base import BaseRefreshTokenRepository
+from infrastructure.repositories.refresh_tokens.memory_repository import (
+    InMemoryRefreshTokenRepository,
+)
+from infrastructure.security.passwords.base import BasePasswordHasher
+from infrastructure.security.passwords.bcrypt import BcryptPasswordHasher
 from logic.init import _init_container
 
 
 def init_dummy_container() -> Container:
     container = _init_container()
+    container.register(BaseGroupRepository, instance=InMemoryGroupRepository())
+    container.register(BaseUserRepository, instance=InMemoryUserRepository())
+    container.register(BaseOutboxRepository, instance=InMemoryOutboxRepository())
     container.register(
-        BaseGroupRepository, InMemoryGroupRepository, scope=Scope.singleton
+        BaseMessageBroker, DummyKafkaMessageBroker, scope=Scope.singleton
     )
+    container.register(AbstractCacheService, instance=InMemoryCacheService())
     container.register(
-        BaseUserRepository, InMemoryUserRepository, scope=Scope.singleton
+        BaseRefreshTokenRepository, instance=InMemoryRefreshTokenRepository()
     )
     container.register(
-        BaseMessageBroker, DummyKafkaMessageBroker, scope=Scope.singleton
+        BasePasswordHasher,
+        instance=BcryptPasswordHasher(
+            executor=ThreadPoolExecutor(max_workers=2), max_pending=8, rounds=4
+        ),
     )
 
     return container
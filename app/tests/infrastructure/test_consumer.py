@@ -0,0 +1,187 @@
+import asyncio
+from dataclasses import replace
+from operator import attrgetter
+
+import pytest
+from aiokafka import ConsumerRecord
+
+from application.consumers.handlers import SendVerificationEmailMessageHandler
+from domain.events.users import VerificationTokenCreatedEvent
+from infrastructure.mail.dummy import DummyMailSender
+from infrastructure.message_brokers.consumer import (
+    BaseMessageHandler,
+    KafkaConsumerWorker,
+)
+from infrastructure.message_brokers.converters import (
+    convert_event_to_binary_message,
+    convert_event_to_broker_message,
+)
+from infrastructure.repositories.outbox.memory_repository import (
+    InMemoryOutboxRepository,
+)
+from logic.events.outbox import OutboxEventHandler
+
+
+class RecordingProducer:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, bytes, list]] = []
+
+    async def send_and_wait(self, topic: str, key: bytes, value: bytes, headers: list):
+        self.sent.append((topic, value, headers))
+
+
+class RecordingMessageHandler(BaseMessageHandler):
+    event_type = VerificationTokenCreatedEvent
+
+    def __init__(self) -> None:
+        self.handled: list[tuple[str, int]] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, event: VerificationTokenCreatedEvent) -> None:
+        if event.email == "fail@example.com":
+            raise ValueError(event)
+
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.handled.append((event.user_oid, int(event.token)))
+        self.active -= 1
+
+
+class SlowFirstTokenMessageHandler(RecordingMessageHandler):
+    async def handle(self, event: VerificationTokenCreatedEvent) -> None:
+        if event.token == "0":
+            await asyncio.sleep(0.01)
+        await super().handle(event)
+
+
+def build_record(
+    key: str, index: int, offset: int, email: str = "user@example.com"
+) -> ConsumerRecord:
+    event = VerificationTokenCreatedEvent(user_oid=key, email=email, token=str(index))
+    # Consumers have to read both formats while producers are switched over.
+    value = (
+        convert_event_to_binary_message(event)
+        if offset % 2
+        else convert_event_to_broker_message(event)
+    )
+    return build_consumer_record(key.encode(), value, offset)
+
+
+def build_consumer_record(key: bytes, value: bytes, offset: int) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="topic",
+        partition=0,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=key,
+        value=value,
+        checksum=None,
+        serialized_key_size=len(key),
+        serialized_value_size=len(value),
+        headers=(),
+    )
+
+
+def build_worker(
+    handler: BaseMessageHandler, producer: RecordingProducer
+) -> KafkaConsumerWorker:
+    return KafkaConsumerWorker(
+        consumer=None,
+        producer=producer,
+        handlers={"topic": handler},
+        dead_letter_topic="dead-letters",
+        max_in_flight=2,
+        max_attempts=2,
+        retry_backoff=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_key_order_and_bounds_concurrency():
+    handler = RecordingMessageHandler()
+    worker = build_worker(handler, RecordingProducer())
+    records = [
+        build_record(key, index, offset)
+        for offset, (key, index) in enumerate(
+            [("a", 0), ("b", 0), ("c", 0), ("a", 1), ("b", 1), ("a", 2)]
+        )
+    ]
+
+    await worker.process([records])
+
+    assert [index for key, index in handler.handled if key == "a"] == [0, 1, 2]
+    assert len(handler.handled) == 6
+    assert handler.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_events_of_one_aggregate_are_handled_in_order():
+    outbox_repository = InMemoryOutboxRepository()
+    outbox_handler = OutboxEventHandler(
+        outbox_repository=outbox_repository,
+        broker_topic="topic",
+        aggregate_oid=attrgetter("user_oid"),
+    )
+    await outbox_handler.handle_batch(
+        [
+            VerificationTokenCreatedEvent(
+                user_oid=user_oid, email="user@example.com", token=str(index)
+            )
+            for index, user_oid in enumerate(["a", "a", "b"])
+        ]
+    )
+    handler = SlowFirstTokenMessageHandler()
+    worker = build_worker(handler, RecordingProducer())
+
+    await worker.process(
+        [
+            [
+                build_consumer_record(message.key, message.value, offset)
+                for offset, message in enumerate(
+                    await outbox_repository.get_pending_messages(limit=10)
+                )
+            ]
+        ]
+    )
+
+    assert [index for key, index in handler.handled if key == "a"] == [0, 1]
+    assert len(handler.handled) == 3
+
+
+@pytest.mark.asyncio
+async def test_worker_moves_failing_messages_to_dead_letter_topic():
+    handler = RecordingMessageHandler()
+    producer = RecordingProducer()
+    worker = build_worker(handler, producer)
+    poisoned = build_record("a", 0, 0, email="fail@example.com")
+    undecodable = replace(build_record("b", 0, 1), value=b"{")
+
+    await worker.process([[poisoned, undecodable, build_record("a", 1, 2)]])
+
+    assert handler.handled == [("a", 1)]
+    assert sorted(value for _, value, _ in producer.sent) == sorted(
+        [b"{", poisoned.value]
+    )
+    assert all(topic == "dead-letters" for topic, _, _ in producer.sent)
+
+
+@pytest.mark.asyncio
+async def test_send_verification_email_message_handler():
+    mail_sender = DummyMailSender()
+    handler = SendVerificationEmailMessageHandler(
+        mail_sender=mail_sender,
+        verification_url_template="http://test/users/{user_oid}/verify/{token}/",
+    )
+
+    await handler.handle(
+        VerificationTokenCreatedEvent(
+            user_oid="oid", email="user@example.com", token="token"
+        )
+    )
+
+    ((recipient, _, body),) = mail_sender.sent
+    assert recipient == "user@example.com"
+    assert "http://test/users/oid/verify/token/" in body
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+
+from domain.events.groups import GroupCreatedEvent
+from domain.events.users import UserCreatedEvent
+from infrastructure.exceptions.message_brokers import (
+    UnknownEventTypeException,
+    UnsupportedEventVersionException,
+)
+from infrastructure.message_brokers.converters import (
+    convert_binary_message_to_event,
+    convert_broker_message_to_event,
+    convert_event_to_binary_message,
+    convert_event_to_broker_message,
+)
+from infrastructure.repositories.users.converters import (
+    USER_ENTITY_PROJECTION,
+    convert_user_document_to_entity,
+    convert_user_entity_to_document,
+)
+
+
+def build_event() -> UserCreatedEvent:
+    return UserCreatedEvent(
+        username="user", user_oid="oid", group_oid="group", email="user@example.com"
+    )
+
+
+def test_binary_message_round_trip():
+    event = build_event()
+    message = convert_event_to_binary_message(event)
+
+    assert convert_binary_message_to_event(message) == event
+    assert len(message) < len(convert_event_to_broker_message(event))
+
+
+@pytest.mark.parametrize(
+    "convert_event", [convert_event_to_binary_message, convert_event_to_broker_message]
+)
+def test_broker_message_is_decoded_from_both_formats(convert_event):
+    event = build_event()
+
+    decoded = convert_broker_message_to_event(convert_event(event), UserCreatedEvent)
+
+    assert decoded == event
+    assert type(decoded) is UserCreatedEvent
+
+
+def test_binary_message_header_is_checked():
+    message = bytearray(convert_event_to_binary_message(build_event()))
+    message[1] += 1
+
+    with pytest.raises(UnsupportedEventVersionException):
+        convert_binary_message_to_event(message)
+
+    with pytest.raises(UnknownEventTypeException):
+        convert_binary_message_to_event(
+            convert_event_to_binary_message(GroupCreatedEvent("oid", "title")).replace(
+                b"GroupCreatedEvent", b"GroupRenamedEvent"
+            )
+        )
+
+
+def test_stored_user_is_hydrated_without_validation():
+    document = {
+        "oid": "oid",
+        "email": "legacy address",
+        "username": "u",
+        "password": "hash",
+        "created_at": datetime(2024, 1, 1),
+        "group_oid": "group",
+        "is_verified": True,
+    }
+
+    user = convert_user_document_to_entity(document)
+    projected_user = convert_user_document_to_entity(
+        {
+            key: value
+            for key, value in document.items()
+            if key not in USER_ENTITY_PROJECTION
+        }
+    )
+
+    assert user.email.as_generic_type() == "legacy address"
+    assert convert_user_entity_to_document(user) == document
+    assert projected_user.password is None
+    assert "password" not in convert_user_entity_to_document(projected_user)
@@ -0,0 +1,187 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
+
+from infrastructure.exceptions.cookies import (
+    ExpiredToken,
+    InvalidToken,
+    RefreshTokenReused,
+    RevokedToken,
+)
+from infrastructure.repositories.refresh_tokens.memory_repository import (
+    InMemoryRefreshTokenRepository,
+)
+from infrastructure.security.cookies.bloom import BloomFilter
+from infrastructure.security.cookies.jwt import PyJWTCookieManager
+from infrastructure.security.cookies.revocation import TokenRevocationList
+
+
+SECRET_KEY = "test-secret-key-of-at-least-32-bytes"
+
+
+def build_cookie_manager(
+    secret_key: str = SECRET_KEY,
+    algorithm: str = "HS256",
+    refresh_token_repository: InMemoryRefreshTokenRepository | None = None,
+) -> PyJWTCookieManager:
+    refresh_token_repository = (
+        refresh_token_repository or InMemoryRefreshTokenRepository()
+    )
+    return PyJWTCookieManager(
+        _token_secret_key=secret_key,
+        _algorithm=algorithm,
+        _access_token_expire_minutes=15,
+        _refresh_token_expire_days=30,
+        _refresh_token_repository=refresh_token_repository,
+        _revocation_list=TokenRevocationList(
+            token_repository=refresh_token_repository, window=15 * 60
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_compatible_with_pyjwt():
+    cookie_manager = build_cookie_manager()
+
+    token = await cookie_manager.create_access_token("oid")
+
+    assert jwt.decode(token, SECRET_KEY, algorithms=["HS256"])["sub"] == "oid"
+    assert await cookie_manager.get_payload(token) == "oid"
+    assert cookie_manager.get_jwks() == {"keys": []}
+
+
+@pytest.mark.asyncio
+async def test_verified_tokens_are_cached(monkeypatch: pytest.MonkeyPatch):
+    cookie_manager = build_cookie_manager()
+    token = await cookie_manager.create_access_token("oid")
+    await cookie_manager.get_payload(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token verified twice")
+
+    monkeypatch.setattr(jwt, "decode", fail)
+
+    assert await cookie_manager.get_payload(token) == "oid"
+
+
+@pytest.mark.asyncio
+async def test_invalid_and_expired_tokens_are_rejected():
+    cookie_manager = build_cookie_manager()
+    token = await cookie_manager.create_access_token("oid")
+
+    with pytest.raises(InvalidToken):
+        await build_cookie_manager(secret_key=SECRET_KEY[::-1]).get_payload(token)
+
+    refresh_token = await cookie_manager.create_refresh_token("oid")
+    with pytest.raises(InvalidToken):
+        await cookie_manager.get_payload(refresh_token)
+
+    expired_token = jwt.encode(
+        {"sub": "oid", "typ": "access", "jti": "jti", "iat": 0, "exp": 1},
+        SECRET_KEY,
+        algorithm="HS256",
+    )
+    with pytest.raises(ExpiredToken):
+        await cookie_manager.get_payload(expired_token)
+
+
+@pytest.mark.asyncio
+async def test_eddsa_tokens_are_verifiable_with_jwks():
+    private_key = Ed25519PrivateKey.generate().private_bytes(
+        Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+    )
+    cookie_manager = build_cookie_manager(private_key.decode(), "EdDSA")
+
+    token = await cookie_manager.create_access_token("oid")
+    (jwk,) = cookie_manager.get_jwks()["keys"]
+
+    assert "d" not in jwk
+    assert jwt.get_unverified_header(token)["kid"] == jwk["kid"]
+    assert jwt.decode(token, jwt.PyJWK(jwk).key, algorithms=["EdDSA"])["sub"] == "oid"
+    assert await cookie_manager.get_payload(token) == "oid"
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_are_rotated_once():
+    cookie_manager = build_cookie_manager()
+    access_token, refresh_token = await cookie_manager.create_tokens("oid")
+
+    new_access_token, new_refresh_token = await cookie_manager.rotate_refresh_token(
+        refresh_token
+    )
+    assert await cookie_manager.get_payload(new_access_token) == "oid"
+
+    # Replaying the old token revokes the whole family, access tokens included
+    with pytest.raises(RefreshTokenReused):
+        await cookie_manager.rotate_refresh_token(refresh_token)
+    with pytest.raises(RevokedToken):
+        await cookie_manager.rotate_refresh_token(new_refresh_token)
+    with pytest.raises(RevokedToken):
+        await cookie_manager.get_payload(access_token)
+    with pytest.raises(RevokedToken):
+        await cookie_manager.get_payload(new_access_token)
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_the_session_only():
+    cookie_manager = build_cookie_manager()
+    access_token, refresh_token = await cookie_manager.create_tokens("oid")
+    other_access_token, _ = await cookie_manager.create_tokens("oid")
+
+    await cookie_manager.revoke_refresh_token(refresh_token)
+
+    with pytest.raises(RevokedToken):
+        await cookie_manager.get_payload(access_token)
+    with pytest.raises(RevokedToken):
+        await cookie_manager.rotate_refresh_token(refresh_token)
+    assert await cookie_manager.get_payload(other_access_token) == "oid"
+
+
+@pytest.mark.asyncio
+async def test_user_tokens_issued_before_the_watermark_are_revoked():
+    cookie_manager = build_cookie_manager()
+    access_token, refresh_token = await cookie_manager.create_tokens("oid")
+    other_access_token, _ = await cookie_manager.create_tokens("other")
+
+    await cookie_manager.revoke_user_tokens("oid")
+
+    with pytest.raises(RevokedToken):
+        await cookie_manager.get_payload(access_token)
+    with pytest.raises(RevokedToken):
+        await cookie_manager.rotate_refresh_token(refresh_token)
+    assert await cookie_manager.get_payload(other_access_token) == "other"
+
+
+@pytest.mark.asyncio
+async def test_revocations_are_synced_between_processes():
+    refresh_token_repository = InMemoryRefreshTokenRepository()
+    cookie_manager = build_cookie_manager(
+        refresh_token_repository=refresh_token_repository
+    )
+    other_cookie_manager = build_cookie_manager(
+        refresh_token_repository=refresh_token_repository
+    )
+    access_token, refresh_token = await cookie_manager.create_tokens("oid")
+    assert await other_cookie_manager.get_payload(access_token) == "oid"
+
+    await cookie_manager.revoke_refresh_token(refresh_token)
+    await other_cookie_manager._revocation_list.sync()
+
+    with pytest.raises(RevokedToken):
+        await other_cookie_manager.get_payload(access_token)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter(size=1 << 16, hashes=7)
+    items = [str(index) for index in range(1000)]
+    for item in items:
+        bloom_filter.add(item)
+
+    assert all(item in bloom_filter for item in items)
+    false_positives = sum(str(index) in bloom_filter for index in range(1000, 11000))
+    assert false_positives < 100
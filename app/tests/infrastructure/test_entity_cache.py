@@ -0,0 +1,202 @@
+import asyncio
+from collections.abc import Iterable
+
+import pytest
+from faker import Faker
+from punq import Container
+
+from domain.entities.groups import UserGroup
+from domain.events.groups import GroupDeletedEvent
+from domain.events.users import UserDeletedEvent, UserVerifiedEvent
+from domain.values.groups import Title
+from infrastructure.cache.local import LocalCache
+from infrastructure.cache.memory import InMemoryCacheService
+from infrastructure.repositories.common.loader import BatchLoader
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.cached import (
+    CachedGroupRepository,
+    GroupEntityCache,
+)
+from infrastructure.repositories.groups.memory_repository import (
+    InMemoryGroupRepository,
+)
+from logic.commands.groups import DeleteGroupCommand
+from logic.events.groups import EvictGroupEntityCacheEventHandler
+from logic.events.users import EvictUserEntityCacheEventHandler
+from logic.mediator.base import Mediator
+
+
+class CountingGroupRepository(InMemoryGroupRepository):
+    loads: int = 0
+
+    async def get_groups_by_oids(
+        self, group_oids: Iterable[str]
+    ) -> dict[str, UserGroup]:
+        self.loads += 1
+        await asyncio.sleep(0)
+        return await super().get_groups_by_oids(group_oids=group_oids)
+
+
+def init_group_cache() -> GroupEntityCache:
+    return GroupEntityCache(
+        cache_service=InMemoryCacheService(),
+        local_cache=LocalCache(maxsize=2, ttl=60),
+        ttl=60,
+    )
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_group_repository_tiers_and_single_flight(faker: Faker):
+    group = UserGroup(title=Title(faker.text(15)))
+    repository = CountingGroupRepository()
+    await repository.add_group(group)
+    cache = init_group_cache()
+    cached_repository = CachedGroupRepository(repository=repository, cache=cache)
+
+    groups = await asyncio.gather(
+        *(cached_repository.get_group_by_oid(group.oid) for _ in range(5))
+    )
+    await cached_repository.get_group_by_oid(group.oid)
+    cache.local_cache.delete(group.oid)
+    await cached_repository.get_group_by_oid(group.oid)
+
+    assert repository.loads == 1
+    assert all(cached.title == group.title for cached in groups)
+    assert len({id(cached) for cached in groups}) == 5
+    assert cache.metrics.snapshot() == {
+        "local": {"hits": 1, "misses": 6},
+        "single_flight": {"coalesced": 4},
+        "redis": {"hits": 1, "misses": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_merges_lookups_of_one_tick():
+    batches = []
+
+    async def load_many(keys: list[int]) -> dict[int, int]:
+        batches.append(keys)
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = BatchLoader(load_many=load_many, max_batch_size=2)
+
+    values = await asyncio.gather(*(loader.load(key) for key in (1, 2, 1, 3)))
+    await loader.load(4)
+
+    assert values == [10, 20, 10, None]
+    assert batches == [[1, 2], [3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_cached_group_repository_batches_lookups(faker: Faker):
+    groups = [UserGroup(title=Title(faker.text(15))) for _ in range(3)]
+    repository = CountingGroupRepository()
+    for group in groups:
+        await repository.add_group(group)
+    cache = init_group_cache()
+    cached_repository = CachedGroupRepository(repository=repository, cache=cache)
+
+    single = await asyncio.gather(
+        *(cached_repository.get_group_by_oid(group.oid) for group in groups[:2])
+    )
+    cache.local_cache.delete(groups[0].oid)
+    found = await cached_repository.get_groups_by_oids(
+        [group.oid for group in groups] + ["missing"]
+    )
+
+    assert repository.loads == 2
+    assert [group.oid for group in single] == [group.oid for group in groups[:2]]
+    assert set(found) == {group.oid for group in groups}
+    assert cache.metrics.snapshot() == {
+        "local": {"hits": 1, "misses": 5},
+        "redis": {"hits": 1, "misses": 4},
+    }
+
+
+@pytest.mark.asyncio
+async def test_group_deleted_event_evicts_cached_group(
+    container: Container, mediator: Mediator, faker: Faker
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    repository = container.resolve(BaseGroupRepository)
+    await repository.add_group(group)
+    cached_repository = CachedGroupRepository(
+        repository=repository, cache=container.resolve(GroupEntityCache)
+    )
+
+    assert await cached_repository.get_group_by_oid(group.oid) is not None
+
+    await mediator.handle_command(DeleteGroupCommand(group_oid=group.oid))
+
+    assert await cached_repository.get_group_by_oid(group.oid) is None
+
+
+def test_entity_caches_are_evicted_after_commit(mediator: Mediator):
+    # An eviction ahead of the commit lets a racing read cache the old row
+    evicting = {
+        event_type
+        for event_type, handlers in mediator.after_commit_events_map.items()
+        for handler in handlers
+        if isinstance(
+            handler,
+            EvictGroupEntityCacheEventHandler | EvictUserEntityCacheEventHandler,
+        )
+    }
+    inline = {
+        handler.__class__
+        for handlers in mediator.events_map.values()
+        for handler in handlers
+    }
+
+    assert evicting == {GroupDeletedEvent, UserDeletedEvent, UserVerifiedEvent}
+    assert not inline & {
+        EvictGroupEntityCacheEventHandler,
+        EvictUserEntityCacheEventHandler,
+    }
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_eviction_elsewhere_is_not_written_back(faker: Faker):
+    stale = UserGroup(title=Title(faker.text(15)))
+    fresh = UserGroup(oid=stale.oid, title=Title(faker.text(15)))
+    cache_service = InMemoryCacheService()
+    # Two processes sharing Redis
+    cache, other_cache = (
+        GroupEntityCache(
+            cache_service=cache_service,
+            local_cache=LocalCache(maxsize=2, ttl=60),
+            ttl=60,
+        )
+        for _ in range(2)
+    )
+
+    async def load_evicted_elsewhere() -> UserGroup:
+        await other_cache.evict(stale.oid)
+        return stale
+
+    async def load_many_evicted_elsewhere(oids: list[str]) -> dict[str, UserGroup]:
+        return {stale.oid: await load_evicted_elsewhere()}
+
+    async def load_fresh() -> UserGroup:
+        return fresh
+
+    await cache.get_or_load(stale.oid, load_evicted_elsewhere)
+    loaded = await other_cache.get_or_load(stale.oid, load_fresh)
+    await other_cache.evict(stale.oid)
+    await cache.get_many_or_load([stale.oid], load_many_evicted_elsewhere)
+    reloaded = await other_cache.get_or_load(stale.oid, load_fresh)
+
+    assert loaded.title == fresh.title
+    assert reloaded.title == fresh.title
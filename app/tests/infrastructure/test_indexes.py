@@ -0,0 +1,137 @@
+import pytest
+
+from infrastructure.exceptions.repositories import MissingIndexesException
+from infrastructure.repositories.common.base_repository import (
+    PAGE_SORT,
+    BaseMongoDBRepository,
+)
+from infrastructure.repositories.common.indexes import (
+    MongoDBIndexManager,
+    get_queried_fields,
+    get_unindexed_stages,
+    is_query_covered,
+)
+from infrastructure.repositories.groups.mongo import MongoDBGroupRepository
+from infrastructure.repositories.outbox.mongo import MongoDBOutboxRepository
+from infrastructure.repositories.users.mongo import (
+    MongoDBUserRepository,
+    MongoDBVerificationTokenRepository,
+)
+
+
+class RecordingCursor:
+    def __init__(self, query_filter: dict, explanation: dict | None = None) -> None:
+        self.filter = query_filter
+        self.sort_key: list = []
+        self.explanation = explanation
+
+    def sort(self, sort_key: list) -> "RecordingCursor":
+        self.sort_key = list(sort_key)
+        return self
+
+    def skip(self, count: int) -> "RecordingCursor":
+        return self
+
+    limit = skip
+
+    async def explain(self) -> dict | None:
+        return self.explanation
+
+
+class RecordingCollection:
+    def __init__(self, explanation: dict | None = None) -> None:
+        self.explanation = explanation
+
+    def find(self, filter: dict, projection=None, session=None) -> RecordingCursor:
+        return RecordingCursor(filter, self.explanation)
+
+
+def init_repository(
+    repository: type[BaseMongoDBRepository], collection: RecordingCollection
+) -> BaseMongoDBRepository:
+    instance = repository(
+        mongo_db_client=None, mongo_db_db_name="db", mongo_db_collection_name="test"
+    )
+    instance.__dict__["_collection"] = collection
+    instance.__dict__["_listing_collection"] = collection
+    return instance
+
+
+def test_is_query_covered_by_index_prefix():
+    index_key = [("group_oid", 1), ("created_at", 1), ("oid", 1)]
+
+    assert is_query_covered(index_key, ("group_oid",))
+    assert is_query_covered(index_key, ("created_at", "group_oid"))
+    assert is_query_covered(index_key, ("group_oid",), PAGE_SORT)
+    assert is_query_covered(index_key, ("group_oid",), [("created_at", -1)])
+    assert not is_query_covered(index_key, ("created_at",))
+    assert not is_query_covered(index_key, ("group_oid", "email"))
+    assert not is_query_covered(index_key, ("group_oid",), [("oid", 1)])
+    assert not is_query_covered([("status", 1)], ("status",), PAGE_SORT)
+
+
+def test_get_queried_fields_splits_or_branches():
+    query_filter = {"group_oid": "", "$or": [{"email": ""}, {"username": ""}]}
+
+    assert get_queried_fields(query_filter) == [
+        {"group_oid", "email"},
+        {"group_oid", "username"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "repository",
+    [
+        MongoDBGroupRepository,
+        MongoDBUserRepository,
+        MongoDBVerificationTokenRepository,
+        MongoDBOutboxRepository,
+    ],
+)
+def test_repository_queries_are_covered_by_declared_indexes(
+    repository: type[BaseMongoDBRepository],
+):
+    index_keys = [list(index.document["key"].items()) for index in repository.indexes]
+    cursors = list(init_repository(repository, RecordingCollection()).checked_queries())
+
+    assert cursors
+    for cursor in cursors:
+        for queried_fields in get_queried_fields(cursor.filter):
+            assert any(
+                is_query_covered(index_key, queried_fields, cursor.sort_key)
+                for index_key in index_keys
+            ), (cursor.filter, cursor.sort_key)
+
+
+def test_get_unindexed_stages_walks_the_plan():
+    plan = {
+        "stage": "SORT",
+        "inputStage": {
+            "stage": "OR",
+            "inputStages": [{"stage": "IXSCAN"}, {"stage": "COLLSCAN"}],
+        },
+    }
+
+    assert get_unindexed_stages(plan) == {"SORT", "COLLSCAN"}
+    assert not get_unindexed_stages(
+        {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_indexes_reports_queries_sorted_in_memory():
+    explanation = {
+        "queryPlanner": {
+            "parsedQuery": {"status": {"$eq": "pending"}},
+            "winningPlan": {"stage": "SORT", "inputStage": {"stage": "IXSCAN"}},
+        }
+    }
+    repository = init_repository(
+        MongoDBOutboxRepository, RecordingCollection(explanation)
+    )
+
+    with pytest.raises(MissingIndexesException) as error:
+        await MongoDBIndexManager(repositories=[repository]).check_indexes()
+
+    assert list(error.value.missing_indexes) == ["test"]
+    assert "(SORT)" in error.value.missing_indexes["test"][0]
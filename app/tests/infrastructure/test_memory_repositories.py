@@ -0,0 +1,224 @@
+import asyncio
+from collections.abc import Awaitable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User
+from domain.values.groups import Title
+from domain.values.users import Email, Password, Username
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.common.operation_log import (
+    DummyOperationLog,
+    FileOperationLog,
+    Record,
+)
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.groups.memory_repository import (
+    InMemoryGroupRepository,
+)
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from infrastructure.repositories.users.memory_repository import (
+    InMemoryUserRepository,
+)
+from infrastructure.repositories.users.base import BaseUserRepository
+from logic.init import _init_container
+
+
+def build_user(index: int, group_oid: str, created_at: datetime) -> User:
+    return User(
+        email=Email(f"user{index}@example.com"),
+        username=Username(f"user{index}"),
+        password=Password("hashed"),
+        group_id=group_oid,
+        created_at=created_at,
+    )
+
+
+class FailingOperationLog(DummyOperationLog):
+    failing: bool = False
+
+    def append(self, record: Record) -> Awaitable[None]:
+        if not self.failing:
+            return super().append(record)
+
+        written = asyncio.get_running_loop().create_future()
+        written.set_exception(OSError("disk full"))
+        return written
+
+
+@pytest.mark.asyncio
+async def test_user_pages_follow_creation_order():
+    repository = InMemoryUserRepository(shards=4)
+    started = datetime(2024, 1, 1)
+    # Added out of order, paged by (created_at, oid)
+    users = [
+        build_user(index, "group", started + timedelta(seconds=index))
+        for index in range(5)
+    ]
+    for user in reversed(users):
+        await repository.add_user(user)
+    await repository.add_user(build_user(5, "other", started))
+
+    first_page, count = await repository.get_users(
+        "group", GetUsersFilters(limit=2, offset=0)
+    )
+    next_page, _ = await repository.get_users(
+        "group",
+        GetUsersFilters(
+            limit=2,
+            offset=0,
+            cursor=PageCursor.from_entity(first_page[-1]),
+            count=CountMode.NONE,
+        ),
+    )
+
+    assert count == 5
+    assert [user.oid for user in first_page + next_page] == [
+        user.oid for user in users[:4]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_deleted_user_leaves_every_index():
+    repository = InMemoryUserRepository()
+    user = build_user(0, "group", datetime(2024, 1, 1))
+    await repository.add_user(user)
+
+    assert await repository.delete_user(user.oid) is user
+    assert await repository.get_user_by_username("user0") is None
+    assert not await repository.check_user_exists_by_email_and_username(
+        email="user0@example.com", username="other"
+    )
+    assert await repository.get_users("group", GetUsersFilters(limit=10, offset=0)) == (
+        [],
+        0,
+    )
+    # The freed username and email can be taken again
+    assert await repository.add_users([build_user(0, "group", datetime.now())]) == set()
+
+
+@pytest.mark.asyncio
+async def test_group_pages_and_title_index():
+    repository = InMemoryGroupRepository()
+    groups = [UserGroup(title=Title(f"group {index}")) for index in range(3)]
+    for group in groups:
+        await repository.add_group(group)
+    await repository.delete_group(groups[1].oid)
+
+    page, count = await repository.get_groups(GetGroupsFilters(limit=10, offset=0))
+
+    assert count == 2
+    assert [group.oid for group in page] == [groups[0].oid, groups[2].oid]
+    assert not await repository.check_group_exists_by_title("group 1")
+
+
+@pytest.mark.asyncio
+async def test_writes_whose_records_fail_are_undone():
+    operation_log = FailingOperationLog()
+    user_repository = InMemoryUserRepository(operation_log=operation_log)
+    group_repository = InMemoryGroupRepository(operation_log=operation_log)
+    user = build_user(0, "group", datetime(2024, 1, 1))
+    group = UserGroup(title=Title("group"))
+    await user_repository.add_user(user)
+    await group_repository.add_group(group)
+    operation_log.failing = True
+
+    for write in (
+        user_repository.add_user(build_user(1, "group", datetime(2024, 1, 2))),
+        user_repository.add_users([build_user(2, "group", datetime(2024, 1, 3))]),
+        user_repository.verify_user(user.oid),
+        group_repository.update_users_count(group.oid, delta=1),
+        group_repository.add_group(UserGroup(title=Title("other"))),
+    ):
+        with pytest.raises(OSError):
+            await write
+    with pytest.raises(OSError):
+        await user_repository.delete_user(user.oid)
+    with pytest.raises(OSError):
+        await group_repository.delete_group(group.oid)
+
+    users, count = await user_repository.get_users(
+        "group", GetUsersFilters(limit=10, offset=0)
+    )
+    assert (users, count) == ([user], 1)
+    assert not user.is_verified
+    assert await user_repository.get_user_by_username("user0") is user
+    assert not await user_repository.check_user_exists_by_email_and_username(
+        email="user1@example.com", username="user2"
+    )
+    assert await group_repository.get_group_by_oid(group.oid) is group
+    assert await group_repository.get_users_count(group.oid) == 0
+    assert not await group_repository.check_group_exists_by_title("other")
+
+
+@pytest.mark.asyncio
+async def test_operation_log_restores_users_after_a_snapshot(tmp_path: Path):
+    repository = InMemoryUserRepository(
+        operation_log=FileOperationLog(directory=tmp_path, name="users")
+    )
+    await repository.open()
+    kept, verified, deleted = (
+        build_user(index, "group", datetime(2024, 1, 1, second=index))
+        for index in range(3)
+    )
+    await repository.add_users([kept, verified, deleted])
+    await repository.operation_log.snapshot()
+    # Logged after the snapshot, replayed on top of it
+    await repository.verify_user(verified.oid)
+    await repository.delete_user(deleted.oid)
+    await repository.close()
+
+    restored = InMemoryUserRepository(
+        operation_log=FileOperationLog(directory=tmp_path, name="users")
+    )
+    await restored.open()
+
+    page, count = await restored.get_users("group", GetUsersFilters(limit=10, offset=0))
+    assert count == 2
+    assert [user.oid for user in page] == [kept.oid, verified.oid]
+    assert [user.is_verified for user in page] == [False, True]
+    assert page[0].password.as_generic_type() == "hashed"
+    assert await restored.get_user_by_username("user2") is None
+    await restored.close()
+
+
+@pytest.mark.asyncio
+async def test_operation_log_ignores_a_torn_tail(tmp_path: Path):
+    repository = InMemoryGroupRepository(
+        operation_log=FileOperationLog(directory=tmp_path, name="groups")
+    )
+    await repository.open()
+    group = UserGroup(title=Title("group"))
+    await repository.add_group(group)
+    await repository.close()
+    # Closing took a snapshot, a crash then tore the first batch written
+    # to the segment after it
+    with open(tmp_path / "groups.00000001.log", "ab") as log:
+        log.write(b"\x97\xa9group")
+
+    restored = InMemoryGroupRepository(
+        operation_log=FileOperationLog(directory=tmp_path, name="groups")
+    )
+    await restored.open()
+    await restored.add_group(UserGroup(title=Title("other")))
+    await restored.close()
+
+    reopened = InMemoryGroupRepository(
+        operation_log=FileOperationLog(directory=tmp_path, name="groups")
+    )
+    await reopened.open()
+    _, count = await reopened.get_groups(GetGroupsFilters(limit=10, offset=0))
+    assert count == 2
+    assert await reopened.check_group_exists_by_title("group")
+    await reopened.close()
+
+
+def test_memory_storage_backend(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "memory")
+
+    container = _init_container()
+
+    assert isinstance(container.resolve(BaseUserRepository), InMemoryUserRepository)
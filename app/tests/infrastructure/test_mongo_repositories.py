@@ -0,0 +1,108 @@
+from collections import Counter
+
+import pytest
+from pymongo import ReadPreference, UpdateOne, WriteConcern
+
+from infrastructure.repositories.common.filters.base import CountMode
+from infrastructure.repositories.common.indexes import MongoDBIndexManager
+from infrastructure.repositories.groups.mongo import MongoDBGroupRepository
+from infrastructure.repositories.users.mongo import MongoDBUserRepository
+from infrastructure.transactions.base import BaseTransactionManager
+from logic.init import _init_container
+
+
+def test_listings_read_from_secondaries_and_writes_use_the_write_concern(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("MONGODB_USER_READ_PREFERENCE", "secondaryPreferred")
+    monkeypatch.setenv("MONGODB_USER_WRITE_CONCERN_W", "majority")
+    monkeypatch.setenv("MONGODB_USER_WRITE_CONCERN_J", "true")
+    monkeypatch.setenv("MONGODB_USE_TRANSACTIONS", "true")
+    monkeypatch.setenv("MONGODB_TRANSACTION_WRITE_CONCERN_W", "2")
+
+    container = _init_container()
+    (user_repository,) = (
+        repository
+        for repository in container.resolve(MongoDBIndexManager).repositories
+        if isinstance(repository, MongoDBUserRepository)
+    )
+    (group_repository,) = (
+        repository
+        for repository in container.resolve(MongoDBIndexManager).repositories
+        if isinstance(repository, MongoDBGroupRepository)
+    )
+
+    majority = WriteConcern(w="majority", j=True)
+    assert user_repository._collection.write_concern == majority
+    assert user_repository._collection.read_preference == ReadPreference.PRIMARY
+    assert (
+        user_repository._listing_collection.read_preference
+        == ReadPreference.SECONDARY_PREFERRED
+    )
+    assert user_repository._listing_collection.write_concern == majority
+    # Unless configured, listings feeding the query cache stay on the primary
+    assert (
+        group_repository._listing_collection.read_preference == ReadPreference.PRIMARY
+    )
+    assert container.resolve(BaseTransactionManager).write_concern == WriteConcern(w=2)
+
+
+class FakeCollection:
+    def __init__(self, documents: list[dict]) -> None:
+        self.documents = documents
+        self.requests: list = []
+
+    async def _iterate(self, documents: list[dict]):
+        for document in documents:
+            yield document
+
+    def aggregate(self, pipeline: list[dict]):
+        counts = Counter(document["group_oid"] for document in self.documents)
+        return self._iterate(
+            [{"_id": oid, "users_count": count} for oid, count in counts.items()]
+        )
+
+    def find(self, filter: dict, projection: dict):
+        return self._iterate([{"oid": document["oid"]} for document in self.documents])
+
+    async def bulk_write(self, requests: list, ordered: bool) -> None:
+        self.requests.extend(requests)
+
+    async def count_documents(self, filter: dict, session=None) -> int:
+        return len(self.documents)
+
+    async def estimated_document_count(self) -> int:
+        return -1
+
+
+@pytest.mark.asyncio
+async def test_recount_users_sets_every_group_counter():
+    group_repository = MongoDBGroupRepository(
+        mongo_db_client=None, mongo_db_db_name="db", mongo_db_collection_name="group"
+    )
+    user_repository = MongoDBUserRepository(
+        mongo_db_client=None, mongo_db_db_name="db", mongo_db_collection_name="user"
+    )
+    groups = FakeCollection([{"oid": "full"}, {"oid": "empty"}])
+    group_repository.__dict__["_collection"] = groups
+    user_repository.__dict__["_collection"] = FakeCollection(
+        [{"group_oid": "full"}, {"group_oid": "full"}]
+    )
+
+    assert await group_repository.recount_users(user_repository) == 2
+    assert groups.requests == [
+        UpdateOne({"oid": "full"}, {"$set": {"users_count": 2}}),
+        UpdateOne({"oid": "empty"}, {"$set": {"users_count": 0}}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_only_estimated_counts_use_collection_metadata():
+    repository = MongoDBGroupRepository(
+        mongo_db_client=None, mongo_db_db_name="db", mongo_db_collection_name="group"
+    )
+    repository.__dict__["_listing_collection"] = FakeCollection([{"oid": "group"}])
+
+    assert await repository._count_documents({}, CountMode.ESTIMATED) == -1
+    assert await repository._count_documents({}, CountMode.CACHED) == 1
+    assert await repository._count_documents({}, CountMode.EXACT) == 1
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from faker import Faker
+
+from infrastructure.exceptions.passwords import PasswordHasherOverloaded
+from infrastructure.security.passwords.bcrypt import BcryptPasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_password_hasher_roundtrip(faker: Faker):
+    hasher = BcryptPasswordHasher(executor=ThreadPoolExecutor(max_workers=1), rounds=4)
+    password = faker.password()
+
+    hashed_password = await hasher.hash_password(password)
+
+    assert await hasher.verify_password(password, hashed_password)
+    assert not await hasher.verify_password(password + "x", hashed_password)
+    assert hasher.pending == 0
+    await hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_password_hasher_rejects_when_saturated(faker: Faker):
+    hasher = BcryptPasswordHasher(
+        executor=ThreadPoolExecutor(max_workers=1), max_pending=2, rounds=4
+    )
+
+    results = await asyncio.gather(
+        *(hasher.hash_password(faker.password()) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, PasswordHasherOverloaded) for result in results) == 1
+    assert hasher.pending == 0
+    await hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_bulk_hashing_does_not_delay_single_operations(faker: Faker):
+    hasher = BcryptPasswordHasher(
+        executor=ThreadPoolExecutor(max_workers=1),
+        max_pending=1,
+        rounds=4,
+        bulk_executor=ThreadPoolExecutor(max_workers=1),
+        bulk_max_pending=1,
+        bulk_slice_size=1,
+    )
+    batches = [[faker.password() for _ in range(20)] for _ in range(2)]
+    imports = asyncio.gather(*map(hasher.hash_passwords, batches))
+    await asyncio.sleep(0)
+
+    password = faker.password()
+    hashed_password = await hasher.hash_password(password)
+
+    assert not imports.done()
+    assert await hasher.verify_password(password, hashed_password)
+    hashed_batches = await imports
+    for passwords, hashed in zip(batches, hashed_batches):
+        assert await hasher.verify_password(passwords[-1], hashed[-1])
+    assert hasher.pending == 0
+    await hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bcrypt_shutdown_does_not_block_the_event_loop():
+    executor = ThreadPoolExecutor(max_workers=1)
+    hasher = BcryptPasswordHasher(executor=executor, rounds=4)
+    executor.submit(time.sleep, 0.2)
+
+    shutdown = asyncio.create_task(hasher.shutdown())
+    await asyncio.sleep(0.05)
+
+    assert not shutdown.done()
+    await shutdown
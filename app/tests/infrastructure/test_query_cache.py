@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+import pytest
+from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from infrastructure.cache.base import AbstractCacheService
+from infrastructure.cache.decorators import cached_query
+from infrastructure.cache.memory import InMemoryCacheService
+from infrastructure.cache.redis import RedisCacheService
+
+
+@dataclass
+class CountingHandler:
+    cache_service: AbstractCacheService
+    cache_ttl: int = 60
+    calls: int = 0
+
+    @cached_query(
+        encoder=lambda result: result,
+        decoder=lambda result: result,
+        tags=lambda query: ("tag",),
+    )
+    async def handle(self, query: str) -> int:
+        self.calls += 1
+        return self.calls
+
+
+@pytest.mark.asyncio
+async def test_invalidated_tags_never_reuse_a_generation():
+    cache_service = InMemoryCacheService()
+    handler = CountingHandler(cache_service=cache_service)
+
+    assert await handler.handle("query") == 1
+    assert await handler.handle("query") == 1
+
+    await cache_service.invalidate_tags("tag")
+    assert await handler.handle("query") == 2
+
+    # A lost generation must not bring back entries cached before
+    await cache_service.delete_cache("tag:v")
+    assert await handler.handle("query") == 3
+
+
+@pytest.mark.asyncio
+async def test_unavailable_redis_bypasses_the_cache_and_fails_invalidation():
+    cache_service = RedisCacheService(
+        # Nothing listens on port 1
+        client=Redis(port=1, retry=Retry(NoBackoff(), retries=0))
+    )
+    handler = CountingHandler(cache_service=cache_service)
+
+    assert await handler.handle("query") == 1
+    assert await handler.handle("query") == 2
+    with pytest.raises(RedisConnectionError):
+        await cache_service.invalidate_tags("tag")
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+
+import pytest
+from faker import Faker
+
+from application.consumers.main import init_projectors
+from domain.entities.users import User
+from domain.events.users import VerificationTokenCreatedEvent
+from domain.values.users import Email, Username
+from infrastructure.message_brokers.base import BaseMessageBroker
+from infrastructure.message_brokers.converters import convert_broker_message_to_event
+from infrastructure.message_brokers.outbox_relay import OutboxRelay
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.read_models.base import BaseReadModel
+from infrastructure.repositories.read_models.memory_repository import (
+    InMemoryReadModel,
+)
+from infrastructure.repositories.users.base import BaseVerificationTokenRepository
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from infrastructure.repositories.users.memory_repository import (
+    InMemoryVerificationTokenRepository,
+)
+from logic.commands.groups import CreateGroupCommand
+from logic.commands.users import (
+    CreateUserCommand,
+    CreateVerificationTokenCommand,
+    DeleteUserCommand,
+    VerifyUserCommand,
+)
+from logic.exceptions.users import UserNotFoundException
+from logic.mediator.base import Mediator
+from logic.queries.groups import GetGroupsQuery
+from logic.queries.users import GetUserQuery, GetUsersQuery
+from settings.config import Settings
+from tests.fixtures import init_dummy_container
+
+
+def build_user(index: int, created_at: datetime) -> User:
+    return User(
+        email=Email(f"user{index}@example.com"),
+        username=Username(f"user{index}"),
+        password=None,
+        group_id="group",
+        created_at=created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_projections_are_idempotent_and_tolerate_reordering():
+    read_model = InMemoryReadModel()
+    started = datetime(2026, 1, 1)
+    users = [
+        build_user(index, started + timedelta(seconds=index)) for index in range(4)
+    ]
+
+    await read_model.verify_user(users[1].oid)
+    await read_model.delete_user(users[2].oid, "group")
+    await read_model.add_users(users)
+    await read_model.add_users(users[:2])
+
+    page, count = await read_model.get_users("group", GetUsersFilters(limit=2))
+    next_page, _ = await read_model.get_users(
+        "group",
+        GetUsersFilters(
+            limit=2, cursor=PageCursor.from_entity(page[-1]), count=CountMode.NONE
+        ),
+    )
+
+    assert count == 3
+    assert [*page, *next_page] == [users[0], users[1], users[3]]
+    assert [user.is_verified for user in page] == [False, True]
+    assert await read_model.get_user(users[2].oid) is None
+
+
+@pytest.mark.asyncio
+async def test_queries_read_the_projection_of_relayed_events(
+    monkeypatch: pytest.MonkeyPatch, faker: Faker
+):
+    monkeypatch.setenv("READ_MODEL_BACKEND", "redis")
+    container = init_dummy_container()
+    container.register(BaseReadModel, instance=InMemoryReadModel())
+    container.register(
+        BaseVerificationTokenRepository, instance=InMemoryVerificationTokenRepository()
+    )
+    settings: Settings = container.resolve(Settings)
+    mediator: Mediator = container.resolve(Mediator)
+    message_broker: BaseMessageBroker = container.resolve(BaseMessageBroker)
+
+    async def project_relayed_events() -> None:
+        await container.resolve(OutboxRelay).relay_batch()
+        # Topics are consumed independently, deletions may come first
+        for topic, projector in reversed(init_projectors(container).items()):
+            for message in await message_broker.start_consuming(topic):
+                await projector.handle(
+                    convert_broker_message_to_event(message, projector.event_type)
+                )
+
+    (group,) = await mediator.handle_command(CreateGroupCommand(title="group"))
+    users = [
+        (
+            await mediator.handle_command(
+                CreateUserCommand(
+                    username=f"user{index}",
+                    email=f"user{index}@example.com",
+                    password=faker.password(),
+                    group_oid=group.oid,
+                )
+            )
+        )[0]
+        for index in range(3)
+    ]
+    query = GetUsersQuery(group_oid=group.oid, filters=GetUsersFilters())
+    assert await mediator.handle_query(query) == ([], 0)
+
+    await mediator.handle_command(CreateVerificationTokenCommand(user_oid=users[1].oid))
+    await container.resolve(OutboxRelay).relay_batch()
+    (token_message,) = await message_broker.start_consuming(
+        settings.verification_token_event_topic
+    )
+    token_event = convert_broker_message_to_event(
+        token_message, VerificationTokenCreatedEvent
+    )
+    await mediator.handle_command(
+        VerifyUserCommand(user_oid=users[1].oid, token=token_event.token)
+    )
+    await mediator.handle_command(DeleteUserCommand(user_oid=users[0].oid))
+    await project_relayed_events()
+
+    projected_users, count = await mediator.handle_query(query)
+    groups, _ = await mediator.handle_query(GetGroupsQuery(filters=GetGroupsFilters()))
+    user = await mediator.handle_query(GetUserQuery(user_oid=users[1].oid))
+
+    assert (projected_users, count) == (users[1:], 2)
+    assert [projected_user.created_at for projected_user in projected_users] == [
+        created_user.created_at for created_user in users[1:]
+    ]
+    assert groups == [group]
+    assert user.is_verified
+    assert user.password is None
+    with pytest.raises(UserNotFoundException):
+        await mediator.handle_query(GetUserQuery(user_oid=users[0].oid))
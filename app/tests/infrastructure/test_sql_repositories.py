@@ -0,0 +1,253 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from domain.entities.groups import UserGroup
+from domain.entities.users import User, VerificationToken
+from domain.values.groups import Title
+from domain.values.users import Email, Password, Username
+from infrastructure.cache.local import LocalCache
+from infrastructure.cache.memory import InMemoryCacheService
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.common.schema import SQLAlchemySchemaManager
+from infrastructure.repositories.groups.sql import SQLAlchemyGroupRepository
+from infrastructure.repositories.outbox.base import (
+    BaseOutboxRepository,
+    OutboxMessage,
+)
+from infrastructure.repositories.outbox.sql import SQLAlchemyOutboxRepository
+from infrastructure.repositories.users.cached import (
+    CachedUserRepository,
+    UserEntityCache,
+)
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from infrastructure.repositories.users.sql import (
+    SQLAlchemyUserRepository,
+    SQLAlchemyVerificationTokenRepository,
+)
+from infrastructure.transactions.base import BaseTransactionManager
+from infrastructure.transactions.sqlalchemy import SQLAlchemyTransactionManager
+from logic.init import _init_container
+
+
+def build_user(index: int, group_oid: str, created_at: datetime) -> User:
+    return User(
+        email=Email(f"user{index}@example.com"),
+        username=Username(f"user{index}"),
+        password=Password("hashed"),
+        group_id=group_oid,
+        created_at=created_at,
+    )
+
+
+@pytest_asyncio.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    await SQLAlchemySchemaManager(engine=engine).create_tables()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_user_pages_follow_creation_order(engine: AsyncEngine):
+    repository = SQLAlchemyUserRepository(engine=engine)
+    started = datetime(2024, 1, 1)
+    users = [
+        build_user(index, "group", started + timedelta(seconds=index))
+        for index in range(5)
+    ]
+    await repository.add_users(list(reversed(users)))
+    await repository.add_user(build_user(5, "other", started))
+
+    first_page, count = await repository.get_users(
+        "group", GetUsersFilters(limit=2, offset=0)
+    )
+    next_page, _ = await repository.get_users(
+        "group",
+        GetUsersFilters(
+            limit=2,
+            offset=0,
+            cursor=PageCursor.from_entity(first_page[-1]),
+            count=CountMode.NONE,
+        ),
+    )
+    documents = [
+        document
+        async for document in repository.iter_group_user_documents(
+            "group", batch_size=2
+        )
+    ]
+
+    assert count == 5
+    assert [user.oid for user in first_page + next_page] == [
+        user.oid for user in users[:4]
+    ]
+    # Pages leave the password hash in the database, logins read it
+    assert first_page[0].password is None
+    login_user = await repository.get_user_by_username("user0")
+    assert login_user.password.as_generic_type() == "hashed"
+    assert [document["oid"] for document in documents] == [user.oid for user in users]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_rejects_duplicates(engine: AsyncEngine):
+    repository = SQLAlchemyUserRepository(engine=engine)
+    started = datetime(2024, 1, 1)
+    await repository.add_user(build_user(0, "group", started))
+
+    rejected = await repository.add_users(
+        [
+            build_user(1, "group", started),
+            build_user(0, "group", started),
+            build_user(2, "group", started),
+            build_user(1, "group", started),
+        ]
+    )
+
+    assert rejected == {1, 3}
+    assert await repository.get_existing_emails_and_usernames(
+        emails=["user1@example.com", "user9@example.com"], usernames=["user2"]
+    ) == ({"user1@example.com"}, {"user2"})
+
+
+@pytest.mark.asyncio
+async def test_deletes_return_the_deleted_rows(engine: AsyncEngine):
+    user_repository = SQLAlchemyUserRepository(engine=engine)
+    group_repository = SQLAlchemyGroupRepository(engine=engine)
+    group = UserGroup(title=Title("group"))
+    user = build_user(0, group.oid, datetime(2024, 1, 1))
+    await group_repository.add_group(group)
+    await user_repository.add_user(user)
+    await group_repository.update_users_count(group.oid, 1)
+    await user_repository.verify_user(user.oid)
+
+    deleted_user = await user_repository.delete_user(user.oid)
+    await group_repository.update_users_count(group.oid, -1)
+
+    assert deleted_user.oid == user.oid
+    assert deleted_user.is_verified
+    assert await user_repository.delete_user(user.oid) is None
+    assert await group_repository.get_users_count(group.oid) == 0
+    assert (await group_repository.delete_group(group.oid)).title == group.title
+    assert not await group_repository.check_group_exists_by_title("group")
+
+
+@pytest.mark.asyncio
+async def test_verification_tokens_are_single_use(engine: AsyncEngine):
+    repository = SQLAlchemyVerificationTokenRepository(engine=engine)
+    token = VerificationToken(user_oid="user")
+    expired_token = VerificationToken(
+        user_oid="user", expires_at=datetime.now() - timedelta(minutes=1)
+    )
+    await repository.add_token(token)
+    await repository.add_token(expired_token)
+
+    assert await repository.check_token_exists(token.token)
+    assert not await repository.check_token_exists(token.token)
+    assert not await repository.check_token_exists(expired_token.token)
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_every_repository(engine: AsyncEngine):
+    transaction_manager = SQLAlchemyTransactionManager(engine=engine)
+    group_repository = SQLAlchemyGroupRepository(engine=engine)
+    outbox_repository: BaseOutboxRepository = SQLAlchemyOutboxRepository(engine=engine)
+
+    with pytest.raises(RuntimeError):
+        async with transaction_manager.transaction():
+            await group_repository.add_group(UserGroup(title=Title("group")))
+            await outbox_repository.add_message(
+                OutboxMessage(topic="groups", key=b"group", value=b"{}")
+            )
+            raise RuntimeError
+
+    assert not await group_repository.check_group_exists_by_title("group")
+    assert await outbox_repository.get_oldest_pending_created_at() is None
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_see_the_committed_rows(engine: AsyncEngine):
+    transaction_manager = SQLAlchemyTransactionManager(engine=engine)
+    group_repository = SQLAlchemyGroupRepository(engine=engine)
+    seen = []
+
+    async def check_committed() -> None:
+        seen.append(await group_repository.check_group_exists_by_title("group"))
+
+    async with transaction_manager.transaction():
+        await group_repository.add_group(UserGroup(title=Title("group")))
+        await transaction_manager.run_after_commit(check_committed)
+        assert seen == []
+    with pytest.raises(RuntimeError):
+        async with transaction_manager.transaction():
+            await transaction_manager.run_after_commit(check_committed)
+            raise RuntimeError
+
+    assert seen == [True]
+
+
+@pytest.mark.asyncio
+async def test_cached_lookups_read_through_the_transaction(tmp_path: Path):
+    # A file, every connection of an in-memory database shares one
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await SQLAlchemySchemaManager(engine=engine).create_tables()
+    transaction_manager = SQLAlchemyTransactionManager(engine=engine)
+    repository = CachedUserRepository(
+        repository=SQLAlchemyUserRepository(engine=engine),
+        cache=UserEntityCache(
+            cache_service=InMemoryCacheService(),
+            local_cache=LocalCache(maxsize=16, ttl=60),
+            ttl=60,
+        ),
+        transaction_manager=transaction_manager,
+    )
+    user = build_user(0, "group", datetime(2024, 1, 1))
+
+    with pytest.raises(RuntimeError):
+        async with transaction_manager.transaction():
+            await repository.add_user(user)
+            assert await repository.get_user_by_oid(user.oid) == user
+            assert await repository.get_users_by_oids([user.oid]) == {user.oid: user}
+            raise RuntimeError
+
+    assert await repository.get_user_by_oid(user.oid) is None
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_outbox_relays_pending_messages_in_order(engine: AsyncEngine):
+    repository = SQLAlchemyOutboxRepository(engine=engine)
+    started = datetime(2024, 1, 1)
+    messages = [
+        OutboxMessage(
+            topic="users",
+            key=b"user",
+            value=bytes([index]),
+            created_at=started + timedelta(seconds=index),
+        )
+        for index in range(3)
+    ]
+    await repository.add_messages(messages)
+
+    await repository.mark_sent([messages[0].oid])
+
+    pending = await repository.get_pending_messages(limit=10)
+    assert [message.value for message in pending] == [b"\x01", b"\x02"]
+    assert await repository.get_oldest_pending_created_at() == messages[1].created_at
+
+
+def test_sqlalchemy_storage_backend(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "sqlalchemy")
+
+    container = _init_container()
+
+    assert isinstance(
+        container.resolve(BaseTransactionManager), SQLAlchemyTransactionManager
+    )
+    assert isinstance(
+        container.resolve(BaseOutboxRepository), SQLAlchemyOutboxRepository
+    )
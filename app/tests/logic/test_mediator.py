@@ -0,0 +1,177 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+import pytest
+from punq import Container
+
+from domain.events.groups import GroupCreatedEvent
+from infrastructure.transactions.base import BaseTransactionManager
+from logic.events.base import BaseEventHandler
+from logic.exceptions.mediator import (
+    EventHandlerTimeoutException,
+    HandlersFailedException,
+    MediatorFrozenException,
+)
+from logic.mediator.base import Mediator
+from logic.mediator.event import EventMediator
+
+
+def test_mediator_is_built_once(container: Container):
+    mediator = container.resolve(Mediator)
+
+    assert container.resolve(Mediator) is mediator
+    assert container.resolve(EventMediator) is mediator
+
+
+def test_frozen_mediator_rejects_new_handlers(mediator: Mediator):
+    assert mediator.is_frozen
+
+    with pytest.raises(MediatorFrozenException):
+        mediator.register_event(GroupCreatedEvent, [])
+
+
+@dataclass
+class RecordingEventHandler(BaseEventHandler[GroupCreatedEvent, str]):
+    name: str
+    calls: list[str]
+    delay: float = 0
+    error: Exception | None = None
+
+    async def handle(self, event: GroupCreatedEvent) -> str:
+        self.calls.append(f"{self.name}:start")
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        self.calls.append(f"{self.name}:end")
+        return self.name
+
+
+@dataclass
+class RecordingTransactionManager(BaseTransactionManager):
+    calls: list[str]
+    active: bool = field(default=False, init=False)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.active
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        async with self._running_after_commit():
+            self.active = True
+            try:
+                yield
+            finally:
+                self.active = False
+            self.calls.append("commit")
+
+
+def build_event() -> GroupCreatedEvent:
+    return GroupCreatedEvent(group_oid="oid", group_title="title")
+
+
+@pytest.mark.asyncio
+async def test_publish_runs_handlers_concurrently():
+    calls: list[str] = []
+    mediator = Mediator()
+    mediator.register_event(
+        GroupCreatedEvent,
+        [
+            RecordingEventHandler("slow", calls, delay=0.01),
+            RecordingEventHandler("fast", calls),
+        ],
+    )
+
+    result = await mediator.publish([build_event()])
+
+    assert result == ["slow", "fast"]
+    assert calls == ["slow:start", "fast:start", "fast:end", "slow:end"]
+
+
+@pytest.mark.asyncio
+async def test_publish_keeps_order_of_ordered_events():
+    calls: list[str] = []
+    mediator = Mediator()
+    mediator.register_event(
+        GroupCreatedEvent,
+        [
+            RecordingEventHandler("slow", calls, delay=0.01),
+            RecordingEventHandler("fast", calls),
+        ],
+        ordered=True,
+    )
+
+    await mediator.publish([build_event()])
+
+    assert calls == ["slow:start", "slow:end", "fast:start", "fast:end"]
+
+
+@pytest.mark.asyncio
+async def test_publish_aggregates_handler_errors():
+    calls: list[str] = []
+    error = ValueError("boom")
+    mediator = Mediator(handler_timeout=0.01)
+    mediator.register_event(
+        GroupCreatedEvent,
+        [
+            RecordingEventHandler("failing", calls, error=error),
+            RecordingEventHandler("hanging", calls, delay=1),
+            RecordingEventHandler("ok", calls),
+        ],
+    )
+
+    with pytest.raises(HandlersFailedException) as exc_info:
+        await mediator.publish([build_event()])
+
+    first_error, second_error = exc_info.value.errors
+    assert first_error is error
+    assert isinstance(second_error, EventHandlerTimeoutException)
+    assert "ok:end" in calls
+
+
+@pytest.mark.asyncio
+async def test_publish_hands_background_handlers_to_supervisor():
+    calls: list[str] = []
+    mediator = Mediator()
+    mediator.register_event(
+        GroupCreatedEvent,
+        [RecordingEventHandler("background", calls, error=ValueError("ignored"))],
+        background=True,
+    )
+
+    assert await mediator.publish([build_event()]) == []
+    assert mediator.supervisor.pending == 1
+
+    await mediator.supervisor.join()
+
+    assert calls == ["background:start"]
+    assert mediator.supervisor.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_after_commit_handlers_wait_for_the_commit():
+    calls: list[str] = []
+    transaction_manager = RecordingTransactionManager(calls)
+    mediator = Mediator(transaction_manager=transaction_manager)
+    mediator.register_event(GroupCreatedEvent, [RecordingEventHandler("inline", calls)])
+    mediator.register_event(
+        GroupCreatedEvent,
+        [RecordingEventHandler("after", calls)],
+        after_commit=True,
+    )
+
+    async with transaction_manager.transaction():
+        await mediator.publish([build_event()])
+    with pytest.raises(ValueError):
+        async with transaction_manager.transaction():
+            await mediator.publish([build_event()])
+            raise ValueError
+    await mediator.publish([build_event()])
+
+    assert calls == [
+        *("inline:start", "inline:end", "commit", "after:start", "after:end"),
+        *("inline:start", "inline:end"),
+        *("inline:start", "inline:end", "after:start", "after:end"),
+    ]
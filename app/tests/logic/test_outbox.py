@@ -0,0 +1,53 @@
+import pytest
+from faker import Faker
+from punq import Container
+
+from domain.entities.groups import UserGroup
+from domain.events.users import UserCreatedEvent
+from domain.values.groups import Title
+from infrastructure.message_brokers.base import BaseMessageBroker
+from infrastructure.message_brokers.converters import convert_broker_message_to_event
+from infrastructure.message_brokers.outbox_relay import OutboxRelay
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.outbox.base import BaseOutboxRepository
+from logic.commands.users import CreateUserCommand
+from logic.mediator.base import Mediator
+from settings.config import Settings
+
+
+@pytest.mark.asyncio
+async def test_events_are_relayed_through_outbox(
+    container: Container,
+    group_repository: BaseGroupRepository,
+    mediator: Mediator,
+    faker: Faker,
+):
+    settings: Settings = container.resolve(Settings)
+    outbox_repository: BaseOutboxRepository = container.resolve(BaseOutboxRepository)
+    message_broker: BaseMessageBroker = container.resolve(BaseMessageBroker)
+    outbox_relay: OutboxRelay = container.resolve(OutboxRelay)
+
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(
+            username="user",
+            email="user@example.com",
+            password=faker.password(),
+            group_oid=group.oid,
+        )
+    )
+
+    assert await message_broker.start_consuming(settings.new_user_event_topic) == []
+    (pending,) = await outbox_repository.get_pending_messages(limit=10)
+    assert pending.key == user.oid.encode()
+
+    assert await outbox_relay.relay_batch() == 1
+    assert await outbox_relay.relay_batch() == 0
+
+    (message,) = await message_broker.start_consuming(settings.new_user_event_topic)
+    event = convert_broker_message_to_event(message, UserCreatedEvent)
+    assert event.user_oid == user.oid
+    assert await outbox_repository.get_pending_messages(limit=10) == []
+    assert outbox_relay.relayed == 1
+    assert outbox_relay.lag == 0
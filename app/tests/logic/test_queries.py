@@ -0,0 +1,174 @@
+import pytest
+from faker import Faker
+
+from domain.entities.groups import UserGroup
+from domain.values.groups import Title
+from infrastructure.repositories.common.filters.base import CountMode, PageCursor
+from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.users.filters.users import GetUsersFilters
+from logic.commands.groups import CreateGroupCommand
+from logic.commands.users import CreateUserCommand, DeleteUserCommand
+from logic.exceptions.groups import GroupNotFoundException
+from logic.mediator.base import Mediator
+from logic.queries.groups import GetGroupsQuery
+from logic.queries.users import (
+    ExportGroupUsersQuery,
+    GetUsersByOidsQuery,
+    GetUsersQuery,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_groups_query_cursor_pagination(
+    group_repository: BaseGroupRepository, mediator: Mediator, faker: Faker
+):
+    for _ in range(5):
+        await group_repository.add_group(UserGroup(title=Title(faker.text(15))))
+
+    offset_page, count = await mediator.handle_query(
+        GetGroupsQuery(filters=GetGroupsFilters(limit=5, offset=0))
+    )
+    first_page, _ = await mediator.handle_query(
+        GetGroupsQuery(filters=GetGroupsFilters(limit=2))
+    )
+    cursor = PageCursor.decode(PageCursor.from_entity(first_page[-1]).encode())
+    second_page, _ = await mediator.handle_query(
+        GetGroupsQuery(filters=GetGroupsFilters(limit=2, offset=100, cursor=cursor))
+    )
+
+    assert count == 5
+    assert [*first_page, *second_page] == offset_page[:4]
+
+
+@pytest.mark.asyncio
+async def test_get_users_query_count_modes(
+    group_repository: BaseGroupRepository, mediator: Mediator, faker: Faker
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    users = [
+        (
+            await mediator.handle_command(
+                CreateUserCommand(
+                    username=f"user{index}",
+                    email=f"user{index}@example.com",
+                    password=faker.password(),
+                    group_oid=group.oid,
+                )
+            )
+        )[0]
+        for index in range(3)
+    ]
+    await mediator.handle_command(DeleteUserCommand(user_oid=users[0].oid))
+
+    counts = {}
+    for mode in CountMode:
+        _, counts[mode] = await mediator.handle_query(
+            GetUsersQuery(group_oid=group.oid, filters=GetUsersFilters(count=mode))
+        )
+
+    assert counts == {
+        CountMode.EXACT: 2,
+        CountMode.ESTIMATED: 2,
+        CountMode.CACHED: 2,
+        CountMode.NONE: None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_groups_query_result_is_cached(
+    group_repository: BaseGroupRepository, mediator: Mediator, faker: Faker
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    query = GetGroupsQuery(filters=GetGroupsFilters())
+
+    groups, count = await mediator.handle_query(query)
+    await group_repository.add_group(UserGroup(title=Title(faker.text(15))))
+    cached_groups, cached_count = await mediator.handle_query(query)
+
+    assert cached_count == count == 1
+    assert cached_groups == groups
+    assert cached_groups[0].title == group.title
+    assert cached_groups[0].created_at == group.created_at
+
+
+@pytest.mark.asyncio
+async def test_group_events_invalidate_cached_queries(mediator: Mediator, faker: Faker):
+    query = GetGroupsQuery(filters=GetGroupsFilters())
+    group, *_ = await mediator.handle_command(CreateGroupCommand(title=faker.text(15)))
+    users_query = GetUsersQuery(group_oid=group.oid, filters=GetUsersFilters())
+
+    assert (await mediator.handle_query(query))[1] == 1
+    assert (await mediator.handle_query(users_query))[1] == 0
+
+    await mediator.handle_command(CreateGroupCommand(title=faker.text(15)))
+    await mediator.handle_command(
+        CreateUserCommand(
+            username="user",
+            email="user@example.com",
+            password=faker.password(),
+            group_oid=group.oid,
+        )
+    )
+
+    assert (await mediator.handle_query(query))[1] == 2
+    assert (await mediator.handle_query(users_query))[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_export_group_users_query_streams_public_fields(
+    group_repository: BaseGroupRepository, mediator: Mediator, faker: Faker
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    for index in range(3):
+        await mediator.handle_command(
+            CreateUserCommand(
+                username=f"user{index}",
+                email=faker.email(),
+                password=faker.password(),
+                group_oid=group.oid,
+            )
+        )
+
+    documents = await mediator.handle_query(ExportGroupUsersQuery(group_oid=group.oid))
+    exported = [document async for document in documents]
+
+    assert [document["username"] for document in exported] == [
+        "user0",
+        "user1",
+        "user2",
+    ]
+    assert all("password" not in document for document in exported)
+
+    with pytest.raises(GroupNotFoundException):
+        await mediator.handle_query(ExportGroupUsersQuery(group_oid="missing"))
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_oids_query_keeps_request_order(
+    group_repository: BaseGroupRepository, mediator: Mediator, faker: Faker
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    users = [
+        (
+            await mediator.handle_command(
+                CreateUserCommand(
+                    username=f"user{index}",
+                    email=faker.email(),
+                    password=faker.password(),
+                    group_oid=group.oid,
+                )
+            )
+        )[0]
+        for index in range(3)
+    ]
+    oids = (users[2].oid, "missing", users[0].oid, users[2].oid)
+
+    found = await mediator.handle_query(GetUsersByOidsQuery(user_oids=oids))
+
+    assert list(found) == [users[2].oid, users[0].oid]
+    assert found[users[0].oid].username == users[0].username
@@ -1,11 +1,22 @@
+import orjson
 import pytest
 
 
 from domain.entities.groups import UserGroup
+from domain.entities.users import User
 from domain.values.groups import Title
 from infrastructure.repositories.groups.base import BaseGroupRepository
+from infrastructure.repositories.groups.filters.groups import GetGroupsFilters
+from infrastructure.repositories.users.base import BaseUserRepository
 from logic.commands.groups import CreateGroupCommand
+from infrastructure.repositories.outbox.base import BaseOutboxRepository
+from logic.commands.users import (
+    BulkCreateUsersCommand,
+    CreateUserCommand,
+    UserLoginCommand,
+)
 from logic.exceptions.groups import GroupAlreadyExistsException
+from logic.exceptions.users import InvalidCredentialsException
 from logic.mediator.base import Mediator
 from faker import Faker
 
@@ -31,9 +42,120 @@ async def test_create_group_command_title_already_exists(
     group = UserGroup(title=Title(title_text))
     await group_repository.add_group(group)
 
-    assert group in group_repository._saved_groups
+    assert await group_repository.get_group_by_oid(group.oid) is group
 
     with pytest.raises(GroupAlreadyExistsException):
         await mediator.handle_command(CreateGroupCommand(title=title_text))
 
-    assert len(group_repository._saved_groups) == 1
+    _, count = await group_repository.get_groups(GetGroupsFilters(limit=10, offset=0))
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_user_command_hashes_password(
+    group_repository: BaseGroupRepository,
+    user_repository: BaseUserRepository,
+    mediator: Mediator,
+    faker: Faker,
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    password = faker.password()
+
+    user: User
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(
+            username=faker.user_name()[:15].ljust(3, "x"),
+            email=faker.email(),
+            password=password,
+            group_oid=group.oid,
+        )
+    )
+
+    assert user.password.as_generic_type() != password
+    assert await user_repository.get_user_by_oid(user_oid=user.oid) == user
+
+
+@pytest.mark.asyncio
+async def test_user_login_command_success(
+    group_repository: BaseGroupRepository, mediator: Mediator, faker: Faker
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    username, password = faker.user_name()[:15].ljust(3, "x"), faker.password()
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(
+            username=username,
+            email=faker.email(),
+            password=password,
+            group_oid=group.oid,
+        )
+    )
+
+    logged_in_user, *_ = await mediator.handle_command(
+        UserLoginCommand(username=username, password=password)
+    )
+
+    assert logged_in_user == user
+
+    with pytest.raises(InvalidCredentialsException):
+        await mediator.handle_command(
+            UserLoginCommand(username=username, password=password + "x")
+        )
+
+
+async def iter_rows(*rows: bytes):
+    for row in rows:
+        yield row
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_users_command_reports_every_row(
+    container,
+    group_repository: BaseGroupRepository,
+    user_repository: BaseUserRepository,
+    mediator: Mediator,
+    faker: Faker,
+):
+    group = UserGroup(title=Title(faker.text(15)))
+    await group_repository.add_group(group)
+    await mediator.handle_command(
+        CreateUserCommand(
+            username="existing",
+            email="existing@example.com",
+            password=faker.password(),
+            group_oid=group.oid,
+        )
+    )
+
+    def build_row(username: str, email: str) -> bytes:
+        return orjson.dumps(
+            {"username": username, "email": email, "password": faker.password()}
+        )
+
+    results, *_ = await mediator.handle_command(
+        BulkCreateUsersCommand(
+            group_oid=group.oid,
+            rows=iter_rows(
+                build_row("first", "first@example.com"),
+                build_row("second", "second@example.com"),
+                b"",
+                build_row("first", "other@example.com"),
+                build_row("existing", "new@example.com"),
+                build_row("invalid", "not-an-email"),
+                b"{not json",
+            ),
+        )
+    )
+
+    assert [result.row for result in results] == [1, 2, 4, 5, 6, 7]
+    first, second, *failed = results
+    assert (await user_repository.get_user_by_oid(first.user_oid)).username.value == (
+        "first"
+    )
+    assert second.user_oid is not None
+    assert all(result.user_oid is None and result.error for result in failed)
+    assert await group_repository.get_users_count(group.oid) == 3
+
+    outbox_repository: BaseOutboxRepository = container.resolve(BaseOutboxRepository)
+    assert len(await outbox_repository.get_pending_messages(limit=10)) == 3